@@ -0,0 +1,92 @@
+"""
+Memory and groupby benchmark for categorical encoding of low-cardinality columns
+
+Runs the QA-77 validations and summary on the same synthetic extract twice: once with
+text columns left as Python objects and once after DataProcessor._encode_categories.
+Reports frame memory, validation time and generate_summary time, and checks that both
+runs produce the same results.
+
+Usage:
+    python benchmark_categoricals.py [--rows 2000000] [--leaders 300]
+"""
+import argparse
+import time
+import numpy as np
+import pandas as pd
+from config_manager import ConfigManager
+from data_processor import DataProcessor
+
+ALLOWED_TITLES = ["Audit Leader", "Executive Auditor", "Audit Manager"]
+
+
+def make_frame(rows: int, leaders: int, seed: int = 0) -> pd.DataFrame:
+    """Build a cleaned QA-77 extract with a few hundred leaders and approvers"""
+    rng = np.random.default_rng(seed)
+    names = np.array([f"Employee {i:04d}" for i in range(leaders)], dtype=object)
+    submit = pd.Timestamp('2025-01-01') + pd.to_timedelta(rng.integers(0, 180, rows), unit='D')
+    return pd.DataFrame({
+        'Audit TW ID': [f"TW{i:08d}" for i in range(rows)],
+        'TW submitter': names[rng.integers(0, leaders, rows)],
+        'TL approver': names[rng.integers(0, leaders, rows)],
+        'AL approver': names[rng.integers(0, leaders, rows)],
+        'Submit Date': submit,
+        'TL Approval Date': submit + pd.to_timedelta(rng.integers(-2, 10, rows), unit='D'),
+        'AL Approval Date': submit + pd.to_timedelta(rng.integers(-2, 20, rows), unit='D'),
+    })
+
+
+def make_titles(leaders: int, seed: int = 0) -> pd.Series:
+    """HR title lookup for the synthetic employees, as the reference cache returns it"""
+    rng = np.random.default_rng(seed)
+    titles = np.array(ALLOWED_TITLES + ["Auditor", "Analyst"], dtype=object)
+    return pd.Series(titles[rng.integers(0, len(titles), leaders)],
+                     index=pd.Index([f"Employee {i:04d}" for i in range(leaders)], dtype=object))
+
+
+def run(config, df: pd.DataFrame, titles: pd.Series, encode: bool):
+    """Validate and summarize one copy of the extract, returning its results and timings"""
+    processor = DataProcessor(config, record_results=False)
+    processor.source_data = df.copy()
+    processor.reference_data = {'HR_Titles': titles}
+    if encode:
+        processor._encode_categories()
+    memory_mb = processor.source_data.memory_usage(index=True, deep=True).sum() / 1024 ** 2
+
+    start_time = time.perf_counter()
+    processor.run_validations()
+    validation_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    summary = processor.generate_summary()
+    summary_time = time.perf_counter() - start_time
+
+    return processor.source_data, summary, memory_mb, validation_time, summary_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=2_000_000)
+    parser.add_argument('--leaders', type=int, default=300)
+    parser.add_argument('--config-dir', default='configs')
+    args = parser.parse_args()
+
+    config = ConfigManager(args.config_dir).get_config('77')
+    df = make_frame(args.rows, args.leaders)
+    titles = make_titles(args.leaders)
+    print(f"Source frame: {len(df):,} rows, {args.leaders} distinct names")
+
+    plain_detail, plain_summary, plain_mb, plain_validation, plain_summary_time = run(config, df, titles, False)
+    coded_detail, coded_summary, coded_mb, coded_validation, coded_summary_time = run(config, df, titles, True)
+
+    pd.testing.assert_frame_equal(coded_summary.astype({'AL approver': object}), plain_summary)
+    for col in [c for c in plain_detail.columns if c.startswith('Valid_')] + ['Compliance']:
+        pd.testing.assert_series_equal(coded_detail[col], plain_detail[col])
+
+    print(f"{'':<16}{'frame MB':>10}{'validate s':>12}{'summary s':>11}")
+    print(f"{'object columns':<16}{plain_mb:>10.0f}{plain_validation:>12.2f}{plain_summary_time:>11.2f}")
+    print(f"{'categoricals':<16}{coded_mb:>10.0f}{coded_validation:>12.2f}{coded_summary_time:>11.2f}")
+    print("Results identical")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Peak-memory benchmark for the shared prepared-column cache
+
+Compares segregation_of_duties and approval_sequence run the original way, where each
+rule takes a full copy of the source frame and re-parses its dates, with the current
+rules sharing one PreparedColumns cache. Peak memory is measured with tracemalloc, on
+top of the source frame, which is built before tracing starts.
+
+Usage:
+    python benchmark_prepared_columns.py [--rows 300000] [--extra-columns 19]
+"""
+import argparse
+import time
+import tracemalloc
+import numpy as np
+import pandas as pd
+from prepared_columns import PreparedColumns
+from validation_rules import ValidationRules
+
+SOD_PARAMS = {'submitter_field': 'TW submitter', 'approver_fields': ['TL approver', 'AL approver']}
+SEQUENCE_PARAMS = {'date_fields_in_order': ['Submit Date', 'TL Approval Date', 'AL Approval Date']}
+
+
+def make_frame(rows: int, extra_columns: int, seed: int = 0) -> pd.DataFrame:
+    """Build a cleaned source frame shaped like a wide QA-77 extract"""
+    rng = np.random.default_rng(seed)
+    names = np.array([f"Employee {i:03d}" for i in range(300)], dtype=object)
+    submit = pd.Timestamp('2025-01-01') + pd.to_timedelta(rng.integers(0, 180, rows), unit='D')
+    df = pd.DataFrame({
+        'Audit TW ID': [f"TW{i:07d}" for i in range(rows)],
+        'TW submitter': names[rng.integers(0, 300, rows)],
+        'TL approver': names[rng.integers(0, 300, rows)],
+        'AL approver': names[rng.integers(0, 300, rows)],
+        # Dates are already parsed by DataProcessor._clean_data
+        'Submit Date': submit,
+        'TL Approval Date': submit + pd.to_timedelta(rng.integers(-2, 10, rows), unit='D'),
+        'AL Approval Date': submit + pd.to_timedelta(rng.integers(-2, 20, rows), unit='D'),
+    })
+    for i in range(extra_columns):
+        df[f"Comment {i}"] = [f"Note {value}" for value in rng.integers(0, 50_000, rows)]
+    return df
+
+
+def copying_segregation_of_duties(df: pd.DataFrame, params) -> pd.Series:
+    """segregation_of_duties as it was before the prepared-column cache, with its full copy"""
+    submitter_field = params['submitter_field']
+    df_clean = df.copy()
+    df_clean[submitter_field] = df_clean[submitter_field].str.lower()
+    result = pd.Series(True, index=df.index)
+    for approver_field in params['approver_fields']:
+        df_clean[approver_field] = df_clean[approver_field].str.lower()
+        result = result & ~(df_clean[submitter_field].notna() & df_clean[approver_field].notna() &
+                            (df_clean[submitter_field] == df_clean[approver_field]))
+    return result
+
+
+def copying_approval_sequence(df: pd.DataFrame, params) -> pd.Series:
+    """approval_sequence as it was before the prepared-column cache, with its full copy"""
+    date_fields = params['date_fields_in_order']
+    df_dates = df.copy()
+    for field in date_fields:
+        df_dates[field] = pd.to_datetime(df_dates[field], errors='coerce')
+    result = pd.Series(True, index=df.index)
+    for field1, field2 in zip(date_fields, date_fields[1:]):
+        both_present = df_dates[field1].notna() & df_dates[field2].notna()
+        result = result & (~both_present | (df_dates[field1] <= df_dates[field2]))
+    return result
+
+
+def run_copying(df: pd.DataFrame):
+    return copying_segregation_of_duties(df, SOD_PARAMS), copying_approval_sequence(df, SEQUENCE_PARAMS)
+
+
+def run_prepared(df: pd.DataFrame):
+    prepared = PreparedColumns(df)
+    return (ValidationRules.segregation_of_duties(df, SOD_PARAMS, prepared),
+            ValidationRules.approval_sequence(df, SEQUENCE_PARAMS, prepared))
+
+
+def measure(func, df: pd.DataFrame):
+    """Run func(df) and return its result, wall time and peak traced memory in MB"""
+    tracemalloc.start()
+    start_time = time.perf_counter()
+    result = func(df)
+    elapsed = time.perf_counter() - start_time
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak / 1024 ** 2
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=300_000)
+    parser.add_argument('--extra-columns', type=int, default=19,
+                        help="Unused text columns, widening the frame the original rules copied")
+    args = parser.parse_args()
+
+    df = make_frame(args.rows, args.extra_columns)
+    frame_mb = df.memory_usage(index=True, deep=True).sum() / 1024 ** 2
+    print(f"Source frame: {len(df):,} rows x {len(df.columns)} columns, {frame_mb:.0f} MB")
+
+    copied, copy_time, copy_peak = measure(run_copying, df)
+    prepared, prepared_time, prepared_peak = measure(run_prepared, df)
+
+    for expected, actual in zip(copied, prepared):
+        pd.testing.assert_series_equal(actual, expected, check_names=False)
+
+    print(f"{'':<24}{'peak MB':>10}{'seconds':>10}")
+    print(f"{'full copy per rule':<24}{copy_peak:>10.0f}{copy_time:>10.2f}")
+    print(f"{'shared PreparedColumns':<24}{prepared_peak:>10.0f}{prepared_time:>10.2f}")
+    print("Results identical")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,42 +1,138 @@
 import os
+import copy
+import json
+import threading
 import yaml
-from typing import Dict, List, Tuple
-from logging_config import setup_logging
+from typing import Dict, List, Optional, Tuple
+from logging_config import get_logger
 
-logger = setup_logging()
+logger = get_logger()
+
+# Use libyaml's C parser when PyYAML was built with it
+SafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+DEFAULT_INDEX_PATH = os.path.join(".qa_cache", "config_index.json")
+
+# Parsed configs shared by every ConfigManager in the process, by absolute path -> (mtime_ns, size, config)
+_parsed_configs = {}
+_parsed_configs_lock = threading.Lock()
 
 
 class ConfigManager:
     """Manages loading and validation of configuration files"""
 
-    def __init__(self, config_dir: str = "configs"):
-        """Initialize config manager with directory of config files"""
+    def __init__(self, config_dir: str = "configs", index_path: Optional[str] = DEFAULT_INDEX_PATH):
+        """
+        Initialize config manager with directory of config files
+
+        Args:
+            config_dir: Directory of analytic configuration files
+            index_path: File holding the compiled index of analytic ids and names;
+                None keeps the index in memory only
+        """
         self.config_dir = config_dir
-        self.configs = {}
+        self.index_path = index_path
+        self.index = {}
+        self._loaded = {}
         self.load_all_configs()
 
+    @property
+    def configs(self) -> Dict[str, Dict]:
+        """All configurations by analytic ID; parses any not loaded yet"""
+        return {analytic_id: self.get_config(analytic_id) for analytic_id in self.index}
+
     def load_all_configs(self) -> None:
-        """Load all configuration files from the config directory"""
+        """
+        Build the index of analytics in the config directory
+
+        Only files that are new or changed since the stored index are parsed; full
+        configurations are otherwise parsed on demand by get_config.
+        """
+        self.index = {}
+        self._loaded = {}
         try:
             if not os.path.exists(self.config_dir):
                 os.makedirs(self.config_dir)
                 self._create_sample_config()
 
+            stored_index = self._read_index()
+            config_dir = os.path.abspath(self.config_dir)
+            # Entries for other config directories sharing the index file are kept as they are
+            compiled_index = {path: entry for path, entry in stored_index.items()
+                              if os.path.dirname(path) != config_dir}
+            parsed_count = 0
+
             for filename in os.listdir(self.config_dir):
                 if filename.endswith(('.yaml', '.yml')):
-                    config_path = os.path.join(self.config_dir, filename)
+                    config_path = os.path.join(config_dir, filename)
                     try:
-                        with open(config_path, 'r', encoding='utf-8') as file:
-                            config = yaml.safe_load(file)
+                        stat = os.stat(config_path)
+                        entry = stored_index.get(config_path)
+                        if not entry or entry['size'] != stat.st_size or entry['mtime_ns'] != stat.st_mtime_ns:
+                            config = self._parse_config(config_path)
+                            parsed_count += 1
+                            entry = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'valid': False}
                             if self._validate_config(config):
-                                analytic_id = str(config.get('analytic_id'))
-                                self.configs[analytic_id] = config
-                                logger.info(f"Loaded config for QA-ID {analytic_id}")
+                                entry.update(valid=True, analytic_id=str(config.get('analytic_id')),
+                                             analytic_name=config.get('analytic_name', 'Unnamed'))
+                        compiled_index[config_path] = entry
+
+                        if entry['valid']:
+                            self.index[entry['analytic_id']] = {'path': config_path,
+                                                                'analytic_name': entry['analytic_name']}
                     except Exception as e:
                         logger.error(f"Error loading config {filename}: {e}")
+
+            if parsed_count or compiled_index.keys() != stored_index.keys():
+                self._write_index(compiled_index)
+
+            logger.info(f"Indexed {len(self.index)} analytics ({parsed_count} config files parsed)")
         except Exception as e:
             logger.error(f"Error accessing config directory: {e}")
 
+    def _parse_config(self, config_path: str) -> Dict:
+        """
+        Parse a config file, reusing the process-wide copy while the file is unchanged
+
+        Returns:
+            Parsed configuration; shared, so callers must copy it before handing it out
+        """
+        stat = os.stat(config_path)
+        with _parsed_configs_lock:
+            cached = _parsed_configs.get(config_path)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+
+        with open(config_path, 'r', encoding='utf-8') as file:
+            config = yaml.load(file, Loader=SafeLoader)
+
+        with _parsed_configs_lock:
+            _parsed_configs[config_path] = (stat.st_mtime_ns, stat.st_size, config)
+        return config
+
+    def _read_index(self) -> Dict:
+        """Read the stored path -> (size, mtime, analytic id and name) index"""
+        if not self.index_path:
+            return {}
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_index(self, compiled_index: Dict) -> None:
+        """Write the index atomically"""
+        if not self.index_path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.index_path) or '.', exist_ok=True)
+            temp_path = f"{self.index_path}.{os.getpid()}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as file:
+                json.dump(compiled_index, file)
+            os.replace(temp_path, self.index_path)
+        except OSError as e:
+            logger.warning(f"Error writing config index: {e}")
+
     def _validate_config(self, config: Dict) -> bool:
         """Validate that a configuration has all required elements"""
         required_keys = ['analytic_id', 'analytic_name', 'source', 'validations', 'thresholds', 'reporting']
@@ -135,12 +231,26 @@ class ConfigManager:
 
     def get_config(self, analytic_id: str) -> Dict:
         """Get configuration for a specific analytic ID"""
-        if analytic_id in self.configs:
-            return self.configs[analytic_id]
-        else:
+        if analytic_id not in self.index:
             logger.error(f"No configuration found for QA-ID {analytic_id}")
             raise ValueError(f"No configuration found for QA-ID {analytic_id}")
 
+        config_path = self.index[analytic_id]['path']
+        stat = os.stat(config_path)
+        loaded = self._loaded.get(analytic_id)
+        if loaded and loaded[0] == stat.st_mtime_ns and loaded[1] == stat.st_size:
+            return loaded[2]
+
+        # Each manager gets its own copy, so changes by one caller don't leak into other managers
+        config = copy.deepcopy(self._parse_config(config_path))
+        if not self._validate_config(config) or str(config.get('analytic_id')) != analytic_id:
+            logger.error(f"Configuration for QA-ID {analytic_id} changed on disk; reload the config directory")
+            raise ValueError(f"No configuration found for QA-ID {analytic_id}")
+
+        self._loaded[analytic_id] = (stat.st_mtime_ns, stat.st_size, config)
+        logger.info(f"Loaded config for QA-ID {analytic_id}")
+        return config
+
     def save_config(self, config: Dict) -> bool:
         """Save configuration to file"""
         if 'analytic_id' not in config:
@@ -155,8 +265,11 @@ class ConfigManager:
             with open(file_path, 'w', encoding='utf-8') as file:
                 yaml.dump(config, file, default_flow_style=False)
 
-            # Update in-memory config
-            self.configs[analytic_id] = config
+            # Update the index and in-memory config
+            config_path = os.path.abspath(file_path)
+            stat = os.stat(config_path)
+            self.index[analytic_id] = {'path': config_path, 'analytic_name': config.get('analytic_name', 'Unnamed')}
+            self._loaded[analytic_id] = (stat.st_mtime_ns, stat.st_size, config)
             logger.info(f"Saved config for QA-ID {analytic_id} to {file_path}")
             return True
 
@@ -166,5 +279,4 @@ class ConfigManager:
 
     def get_available_analytics(self) -> List[Tuple[str, str]]:
         """Get list of available analytics as (id, name) tuples"""
-        return [(analytic_id, config.get('analytic_name', 'Unnamed'))
-                for analytic_id, config in self.configs.items()]
\ No newline at end of file
+        return [(analytic_id, entry['analytic_name']) for analytic_id, entry in self.index.items()]
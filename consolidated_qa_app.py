@@ -7,11 +7,9 @@ from tkinter import filedialog, messagebox, ttk
 from typing import Dict, List, Tuple
 import datetime
 from config_manager import ConfigManager
-from data_processor import DataProcessor
-from consolidated_report_generator import ConsolidatedReportGenerator
-from logging_config import setup_logging
+from logging_config import get_logger, setup_logging
 
-logger = setup_logging()
+logger = get_logger()
 
 
 class QAAnalyticsApp:
@@ -98,11 +96,29 @@ class QAAnalyticsApp:
             text="Generate consolidated reports by Audit Leader",
             variable=self.consolidated_var
         )
-        consolidated_check.grid(row=3, column=0, columnspan=2, sticky=tk.W, pady=(5, 10))
+        consolidated_check.grid(row=3, column=0, columnspan=2, sticky=tk.W, pady=(5, 0))
+
+        # Source cache checkbox
+        self.source_cache_var = tk.BooleanVar(value=True)
+        source_cache_check = ttk.Checkbutton(
+            main_frame,
+            text="Reuse parsed source files from earlier runs (stored under .qa_cache)",
+            variable=self.source_cache_var
+        )
+        source_cache_check.grid(row=4, column=0, columnspan=2, sticky=tk.W, pady=0)
+
+        # Stage cache checkbox
+        self.stage_cache_var = tk.BooleanVar(value=False)
+        stage_cache_check = ttk.Checkbutton(
+            main_frame,
+            text="Reuse validated results of earlier runs with unchanged inputs (stored under .qa_cache)",
+            variable=self.stage_cache_var
+        )
+        stage_cache_check.grid(row=5, column=0, columnspan=2, sticky=tk.W, pady=(0, 10))
 
         # Execution frame
         exec_frame = ttk.Frame(main_frame)
-        exec_frame.grid(row=4, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(5, 10))
+        exec_frame.grid(row=6, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(5, 10))
 
         self.progress = ttk.Progressbar(exec_frame, orient="horizontal", length=200, mode="indeterminate")
         self.progress.pack(side=tk.LEFT, expand=True, fill=tk.X, padx=(0, 5))
@@ -111,15 +127,15 @@ class QAAnalyticsApp:
         exec_btn.pack(side=tk.RIGHT)
 
         # Status log
-        ttk.Label(main_frame, text="Status Log:").grid(row=5, column=0, sticky=tk.W, pady=(5, 5))
+        ttk.Label(main_frame, text="Status Log:").grid(row=7, column=0, sticky=tk.W, pady=(5, 5))
 
         self.log_text = tk.Text(main_frame, height=15, width=80, wrap=tk.WORD)
-        self.log_text.grid(row=6, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S))
+        self.log_text.grid(row=8, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S))
         self.log_text.config(state=tk.DISABLED)
 
         # Add scrollbar to log
         log_scroll = ttk.Scrollbar(main_frame, orient="vertical", command=self.log_text.yview)
-        log_scroll.grid(row=6, column=2, sticky=(tk.N, tk.S))
+        log_scroll.grid(row=8, column=2, sticky=(tk.N, tk.S))
         self.log_text.config(yscrollcommand=log_scroll.set)
 
         # Status bar
@@ -131,7 +147,7 @@ class QAAnalyticsApp:
         self.root.columnconfigure(0, weight=1)
         self.root.rowconfigure(0, weight=1)
         main_frame.columnconfigure(1, weight=1)
-        main_frame.rowconfigure(6, weight=1)
+        main_frame.rowconfigure(8, weight=1)
 
         # Set up log handler
         self._setup_log_handler()
@@ -178,7 +194,7 @@ class QAAnalyticsApp:
 
         # Open file dialog to select source file
         filename = filedialog.askopenfilename(
-            filetypes=[("Excel Files", "*.xlsx *.xls")],
+            filetypes=[("Data Files", "*.xlsx *.xls *.csv *.parquet *.feather"), ("Excel Files", "*.xlsx *.xls")],
             title=f"Select Source Data File for QA-ID {analytic_id}"
         )
 
@@ -240,19 +256,28 @@ class QAAnalyticsApp:
 
         # Get consolidated reports preference
         generate_consolidated = self.consolidated_var.get()
+        use_stage_cache = self.stage_cache_var.get()
+        use_source_cache = self.source_cache_var.get()
 
         # Run in a separate thread to avoid freezing the UI
         threading.Thread(
             target=self._process_analytics,
-            args=(selected_analytics, selected_files, output_dir, generate_consolidated),
+            args=(selected_analytics, selected_files, output_dir, generate_consolidated, use_stage_cache,
+                  use_source_cache),
             daemon=True
         ).start()
 
-    def _process_analytics(self, analytics_ids, source_files, output_dir, generate_consolidated):
+    def _process_analytics(self, analytics_ids, source_files, output_dir, generate_consolidated,
+                           use_stage_cache=False, use_source_cache=True):
         """Process selected analytics in a separate thread"""
         try:
             logger.info(f"Starting processing for {len(analytics_ids)} analytics: {', '.join(analytics_ids)}")
 
+            # Processing modules pull in pandas and openpyxl, so they are imported on first run
+            from data_processor import DataProcessor
+            from report_generator import ReportGenerator
+            from consolidated_report_generator import ConsolidatedReportGenerator
+
             # Track individually generated reports
             individual_reports = []
             main_report = None
@@ -265,7 +290,8 @@ class QAAnalyticsApp:
                         config = self.config_manager.get_config(analytic_id)
 
                         # Initialize processor
-                        processor = DataProcessor(config)
+                        processor = DataProcessor(config, use_source_cache=use_source_cache,
+                                                  use_stage_cache=use_stage_cache)
 
                         # Process data
                         logger.info(f"Processing QA-ID {analytic_id}: {config['analytic_name']}")
@@ -276,7 +302,6 @@ class QAAnalyticsApp:
                             continue
 
                         # Generate report
-                        from report_generator import ReportGenerator
                         report_generator = ReportGenerator(config, processor.results)
 
                         # Main report
@@ -299,7 +324,9 @@ class QAAnalyticsApp:
                         logger.error(f"Error processing QA-ID {analytic_id}: {e}")
             else:
                 # Use consolidated report generator
-                consolidated_generator = ConsolidatedReportGenerator(output_dir=output_dir)
+                consolidated_generator = ConsolidatedReportGenerator(output_dir=output_dir,
+                                                                     use_stage_cache=use_stage_cache,
+                                                                     use_source_cache=use_source_cache)
 
                 # Run all selected analytics
                 results_by_analytic = consolidated_generator.run_analytics(analytics_ids, source_files)
@@ -356,6 +383,7 @@ class QAAnalyticsApp:
 
 # Application entry point
 if __name__ == "__main__":
+    setup_logging()
     root = tk.Tk()
     app = QAAnalyticsApp(root)
     root.mainloop()
\ No newline at end of file
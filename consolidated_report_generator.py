@@ -1,33 +1,88 @@
 import os
+import time
 import datetime
+import multiprocessing
+import numpy as np
 import pandas as pd
-from typing import Dict, List, Tuple
-from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Border, Side, Alignment
-from config_manager import ConfigManager
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.connection import wait
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 from data_processor import DataProcessor
-from logging_config import setup_logging
+from results_store import ResultsStore
+from excel_utils import (add_color_scale, add_fill_rules, excel_writer, fit_column_widths, merge_cells,
+                         resolve_excel_engine, restart_sheet, set_column_widths, write_cell, write_frame)
+from parallel_utils import IN_FLIGHT_PER_WORKER, bounded_map
+from logging_config import get_logger
 
-logger = setup_logging()
+if TYPE_CHECKING:
+    from config_manager import ConfigManager
+
+logger = get_logger()
+
+# Months of stored run history shown in the department report's trend section
+TREND_MONTHS = 12
+# Months summed for the rolling DNC %
+TREND_ROLLING_MONTHS = 3
+
+# Columns added to detail rows in delta reports
+DELTA_STATUS_COLUMN = 'Delta Status'
+PRIOR_COMPLIANCE_COLUMN = 'Prior Compliance'
 
 
 class ConsolidatedReportGenerator:
     """Generates consolidated Excel reports from multiple QA analytics"""
 
-    def __init__(self, output_dir: str = "output"):
+    def __init__(self, output_dir: str = "output", report_workers: int = 1, excel_engine: str = None,
+                 analytic_workers: int = 1, analytic_timeout: Optional[float] = None,
+                 config_manager: Optional['ConfigManager'] = None, results_store: Optional[ResultsStore] = None,
+                 delta_reports: bool = False, use_stage_cache: bool = False, use_source_cache: bool = True):
         """
         Initialize consolidated report generator
 
         Args:
             output_dir: Directory for output files
+            report_workers: Number of processes writing per-leader reports
+            excel_engine: 'openpyxl' (default) or 'xlsxwriter' for constant-memory streaming
+                of large detail sheets
+            analytic_workers: Number of processes running analytics; 1 runs them in this process
+            analytic_timeout: Default seconds an analytic may run in its own process before it
+                is stopped; an analytic's 'execution.timeout_seconds' setting takes precedence
+            config_manager: Optional already-loaded configuration manager; one reading the
+                default config directory is created on first use otherwise
+            results_store: Run history analytics record their runs in and the department
+                report's trends are read from; detail rows are only recorded for analytics
+                reported as deltas
+            delta_reports: Default for whether leader reports list only detail rows that changed
+                since the analytic's previous run; an analytic's 'reporting.delta' setting takes
+                precedence
+            use_stage_cache: Default for reusing validated results of an earlier run with the
+                same inputs; see DataProcessor
+            use_source_cache: Set to False to parse every source file again instead of reusing
+                the frame cached by an earlier run
         """
         self.output_dir = output_dir
-        self.config_manager = ConfigManager()
+        self.report_workers = report_workers
+        self.analytic_workers = analytic_workers
+        self.analytic_timeout = analytic_timeout
+        self.excel_engine = resolve_excel_engine(excel_engine)
+        self._config_manager = config_manager
+        self.results_store = results_store or ResultsStore()
+        self.delta_reports = delta_reports
+        self.use_stage_cache = use_stage_cache
+        self.use_source_cache = use_source_cache
 
         # Create output directory if it doesn't exist
         if not os.path.exists(self.output_dir):
             os.makedirs(self.output_dir)
 
+    @property
+    def config_manager(self) -> 'ConfigManager':
+        """Configuration manager, created on first use"""
+        if self._config_manager is None:
+            from config_manager import ConfigManager
+            self._config_manager = ConfigManager()
+        return self._config_manager
+
     def run_analytics(self, analytic_ids: List[str], source_files: Dict[str, str]) -> Dict[str, Dict]:
         """
         Run multiple analytics and collect results
@@ -40,6 +95,7 @@ class ConsolidatedReportGenerator:
             Dictionary of results by analytic ID
         """
         results_by_analytic = {}
+        jobs = []
 
         for analytic_id in analytic_ids:
             if analytic_id not in source_files:
@@ -49,28 +105,119 @@ class ConsolidatedReportGenerator:
             try:
                 # Get configuration
                 config = self.config_manager.get_config(analytic_id)
-                logger.info(f"Running analytic {analytic_id}: {config['analytic_name']}")
+                jobs.append((analytic_id, config))
+            except Exception as e:
+                logger.error(f"Error running analytic {analytic_id}: {e}")
 
-                # Initialize processor
-                processor = DataProcessor(config)
+        if self.analytic_workers > 1 and len(jobs) > 1:
+            outcomes = self._run_analytics_in_processes(jobs, source_files)
+        else:
+            outcomes = {analytic_id: self._run_analytic(analytic_id, config, source_files[analytic_id],
+                                                         self.results_store, self.use_stage_cache,
+                                                         self._is_delta(config), self.use_source_cache)
+                        for analytic_id, config in jobs}
+
+        # Keep the requested analytic order
+        for analytic_id, config in jobs:
+            success, message, results = outcomes[analytic_id]
+            if success:
+                logger.info(f"Analytic {analytic_id} processed successfully")
+                results_by_analytic[analytic_id] = {
+                    'config': config,
+                    'results': results,
+                    'source_file': source_files[analytic_id]
+                }
+            else:
+                logger.error(f"Failed to process analytic {analytic_id}: {message}")
 
-                # Process data
-                success, message = processor.process_data(source_files[analytic_id])
+        return results_by_analytic
 
-                if success:
-                    logger.info(f"Analytic {analytic_id} processed successfully")
-                    results_by_analytic[analytic_id] = {
-                        'config': config,
-                        'results': processor.results,
-                        'source_file': source_files[analytic_id]
-                    }
-                else:
-                    logger.error(f"Failed to process analytic {analytic_id}: {message}")
+    @staticmethod
+    def _run_analytic(analytic_id: str, config: Dict, source_file: str, results_store: Optional[ResultsStore] = None,
+                      use_stage_cache: bool = False, record_detail: bool = False,
+                      use_source_cache: bool = True) -> Tuple[bool, str, Optional[Dict]]:
+        """
+        Process a single analytic, recording the run in the given results store
 
-            except Exception as e:
-                logger.error(f"Error running analytic {analytic_id}: {e}")
+        Returns:
+            Tuple of (success, message, results)
+        """
+        try:
+            logger.info(f"Running analytic {analytic_id}: {config['analytic_name']}")
 
-        return results_by_analytic
+            # Initialize processor and process data
+            processor = DataProcessor(config, use_source_cache=use_source_cache, use_stage_cache=use_stage_cache,
+                                      results_store=results_store, record_detail=record_detail)
+            success, message = processor.process_data(source_file)
+            return success, message, processor.results if success else None
+
+        except Exception as e:
+            return False, f"Error running analytic {analytic_id}: {e}", None
+
+    def _run_analytics_in_processes(self, jobs: List[Tuple[str, Dict]],
+                                    source_files: Dict[str, str]) -> Dict[str, Tuple[bool, str, Optional[Dict]]]:
+        """
+        Run analytics in separate processes, at most analytic_workers at a time
+
+        Each analytic gets its own process, so an analytic that fails, crashes or runs past its
+        timeout is stopped and reported without affecting the others.
+
+        Args:
+            jobs: (analytic ID, configuration) pairs to run
+            source_files: Dictionary mapping analytic IDs to source file paths
+
+        Returns:
+            Dictionary of (success, message, results) by analytic ID
+        """
+        logger.info(f"Running {len(jobs)} analytics with {self.analytic_workers} processes")
+        context = multiprocessing.get_context()
+        pending = list(jobs)
+        running = {}  # receiving connection -> (analytic ID, process, timeout, deadline)
+        outcomes = {}
+
+        while pending or running:
+            # Start analytics while there are free workers
+            while pending and len(running) < self.analytic_workers:
+                analytic_id, config = pending.pop(0)
+                receiver, sender = context.Pipe(duplex=False)
+                process = context.Process(target=_run_analytic_task, name=f"analytic-{analytic_id}",
+                                          args=(sender, analytic_id, config, source_files[analytic_id],
+                                                self.results_store, self.use_stage_cache,
+                                                self._is_delta(config), self.use_source_cache),
+                                          daemon=True)
+                process.start()
+                sender.close()
+
+                timeout = config.get('execution', {}).get('timeout_seconds', self.analytic_timeout)
+                deadline = time.monotonic() + timeout if timeout else None
+                running[receiver] = (analytic_id, process, timeout, deadline)
+
+            # Wait for a result or the nearest deadline
+            deadlines = [deadline for _, _, _, deadline in running.values() if deadline is not None]
+            wait_time = max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+            for receiver in wait(list(running), timeout=wait_time):
+                analytic_id, process, _, _ = running.pop(receiver)
+                try:
+                    outcomes[analytic_id] = receiver.recv()
+                except EOFError:
+                    # The process ended without sending a result
+                    outcomes[analytic_id] = None
+                receiver.close()
+                process.join()
+                if outcomes[analytic_id] is None:
+                    outcomes[analytic_id] = (False, f"Analytic process exited with code {process.exitcode}", None)
+
+            # Stop analytics that ran past their deadline
+            now = time.monotonic()
+            for receiver, (analytic_id, process, timeout, deadline) in list(running.items()):
+                if deadline is not None and now >= deadline:
+                    process.terminate()
+                    process.join()
+                    receiver.close()
+                    del running[receiver]
+                    outcomes[analytic_id] = (False, f"Timed out after {timeout} seconds", None)
+
+        return outcomes
 
     def generate_consolidated_reports(self, results_by_analytic: Dict[str, Dict]) -> Dict[str, str]:
         """
@@ -103,12 +250,45 @@ class ConsolidatedReportGenerator:
         main_report_path = self.generate_consolidated_main_report(results_by_analytic, leader_field_by_analytic,
                                                                   list(audit_leaders))
 
+        # Leader reports may list only the rows that changed since the previous run
+        results_by_analytic = self._apply_delta_detail(results_by_analytic)
+
+        # Partition each analytic's detail and summary by leader once
+        partitions = {}
+        for analytic_id, data in results_by_analytic.items():
+            leader_field = leader_field_by_analytic[analytic_id]
+            partitions[analytic_id] = {
+                name: frame.groupby(leader_field, sort=False, observed=True).indices
+                for name, frame in data['results'].items()
+                if isinstance(frame, pd.DataFrame) and leader_field in frame.columns
+            }
+
         # Generate a consolidated report for each audit leader
         reports_by_leader = {}
-        for leader in audit_leaders:
-            report_path = self._generate_leader_report(leader, results_by_analytic, leader_field_by_analytic)
-            if report_path:
-                reports_by_leader[leader] = report_path
+        leaders = list(audit_leaders)
+
+        if self.report_workers > 1 and len(leaders) > 1:
+            # Workbook serialization is CPU-bound, so leaders are written in separate processes;
+            # each worker receives only that leader's slices, which are taken as tasks are submitted
+            logger.info(f"Writing {len(leaders)} leader reports with {self.report_workers} processes")
+            task_args = ((self.output_dir, self.excel_engine, leader,
+                          self._slice_results_for_leader(leader, results_by_analytic, partitions),
+                          leader_field_by_analytic)
+                         for leader in leaders)
+            with ProcessPoolExecutor(max_workers=self.report_workers) as executor:
+                for leader, (report_path, error) in zip(leaders, bounded_map(
+                        executor, _generate_leader_report_task, task_args,
+                        self.report_workers * IN_FLIGHT_PER_WORKER)):
+                    if error is not None:
+                        logger.error(f"Error generating consolidated report for {leader}: {error}")
+                    if report_path:
+                        reports_by_leader[leader] = report_path
+        else:
+            for leader in leaders:
+                leader_results = self._slice_results_for_leader(leader, results_by_analytic, partitions)
+                report_path = self._generate_leader_report(leader, leader_results, leader_field_by_analytic)
+                if report_path:
+                    reports_by_leader[leader] = report_path
 
         # Add main report to the dictionary with a special key
         if main_report_path:
@@ -116,6 +296,142 @@ class ConsolidatedReportGenerator:
 
         return reports_by_leader
 
+    def _is_delta(self, config: Dict) -> bool:
+        """Whether an analytic's leader reports list only changed rows"""
+        return config.get('reporting', {}).get('delta', self.delta_reports)
+
+    def _apply_delta_detail(self, results_by_analytic: Dict[str, Dict]) -> Dict[str, Dict]:
+        """
+        Replace the detail of analytics reported as deltas with only their changed rows
+
+        Args:
+            results_by_analytic: Dictionary of results by analytic ID
+
+        Returns:
+            Dictionary shaped like results_by_analytic; analytics reported as deltas get a
+            'delta_since' entry with the previous run's date
+        """
+        delta_results = {}
+        for analytic_id, data in results_by_analytic.items():
+            config = data['config']
+            results = data['results']
+            delta_results[analytic_id] = data
+
+            if not self._is_delta(config) or 'detail' not in results:
+                continue
+
+            record_id = config['source'].get('record_id')
+            if not record_id or record_id not in results['detail'].columns:
+                logger.warning(f"Delta reports for QA-ID {analytic_id} need 'source.record_id' naming a detail "
+                               f"column; reporting all rows")
+                continue
+
+            try:
+                prior_run_id = self.results_store.previous_run_id(analytic_id, results.get('run_id'),
+                                                                  with_detail=True)
+                if prior_run_id is None:
+                    logger.info(f"No previous run with detail stored for QA-ID {analytic_id}; reporting all rows")
+                    continue
+
+                prior_detail = self.results_store.detail(prior_run_id)
+                delta = self._build_delta_detail(results['detail'], prior_detail, record_id)
+                if delta is None:
+                    logger.warning(f"Record IDs in '{record_id}' are missing or not unique for QA-ID "
+                                   f"{analytic_id}; reporting all rows")
+                    continue
+
+            except Exception as e:
+                logger.error(f"Error comparing QA-ID {analytic_id} with its previous run: {e}")
+                continue
+
+            prior_run_date = self.results_store.runs(analytic_id).set_index('run_id').at[prior_run_id, 'run_date']
+            logger.info(f"QA-ID {analytic_id}: {len(delta)} of {len(results['detail'])} rows changed since "
+                        f"run {prior_run_id} ({prior_run_date})")
+            delta_results[analytic_id] = dict(data, results=dict(results, detail=delta), delta_since=prior_run_date)
+
+        return delta_results
+
+    @staticmethod
+    def _build_delta_detail(detail: pd.DataFrame, prior_detail: pd.DataFrame,
+                            record_id: str) -> Optional[pd.DataFrame]:
+        """
+        Select the detail rows whose compliance or values changed since a previous run
+
+        Rows are matched by record ID through a hash index over the previous run's IDs. A row
+        is a new DNC when it is DNC now but was not, or was not present, before; a resolved DNC
+        when it was DNC before and is not now; and changed when any column both runs share
+        differs. Records no longer in the source are not listed.
+
+        Args:
+            detail: Current detail rows
+            prior_detail: The previous run's detail rows
+            record_id: Column identifying a record in both runs
+
+        Returns:
+            Changed rows in their current order, led by DELTA_STATUS_COLUMN and
+            PRIOR_COMPLIANCE_COLUMN, or None if record IDs are missing or repeat
+        """
+        if record_id not in prior_detail.columns:
+            return None
+        current_ids = pd.Index(detail[record_id])
+        prior_ids = pd.Index(prior_detail[record_id])
+        if not current_ids.is_unique or not prior_ids.is_unique:
+            return None
+
+        positions = prior_ids.get_indexer(current_ids)
+        matched = positions >= 0
+
+        prior_compliance = prior_detail['Compliance'].to_numpy(dtype=object)[positions]
+        prior_compliance[~matched] = None
+        is_dnc = (detail['Compliance'] == 'DNC').to_numpy()
+        was_dnc = prior_compliance == 'DNC'
+
+        # Compare the columns both runs share; columns whose type changed are compared as text
+        shared = [column for column in detail.columns if column in prior_detail.columns]
+        current_values = detail[shared]
+        prior_values = prior_detail[shared]
+        retyped = [column for column in shared if current_values[column].dtype != prior_values[column].dtype]
+        if retyped:
+            current_values = current_values.astype({column: str for column in retyped})
+            prior_values = prior_values.astype({column: str for column in retyped})
+        current_hashes = pd.util.hash_pandas_object(current_values, index=False).to_numpy()
+        prior_hashes = pd.util.hash_pandas_object(prior_values, index=False).to_numpy()[positions]
+        changed = matched & (current_hashes != prior_hashes)
+
+        status = np.select([is_dnc & ~was_dnc, was_dnc & ~is_dnc, changed],
+                           ['New DNC', 'Resolved DNC', 'Changed'], default='')
+        delta_positions = np.flatnonzero(status != '')
+
+        delta = detail.take(delta_positions)
+        delta.insert(0, PRIOR_COMPLIANCE_COLUMN, prior_compliance[delta_positions])
+        delta.insert(0, DELTA_STATUS_COLUMN, status[delta_positions])
+        return delta
+
+    @staticmethod
+    def _slice_results_for_leader(leader, results_by_analytic: Dict[str, Dict],
+                                  partitions: Dict[str, Dict[str, Dict]]) -> Dict[str, Dict]:
+        """
+        Narrow every analytic's results to a single leader's rows
+
+        Args:
+            leader: Audit leader value
+            results_by_analytic: Dictionary of results by analytic ID
+            partitions: Row positions by analytic ID, result name and leader
+
+        Returns:
+            Dictionary shaped like results_by_analytic holding only this leader's rows
+        """
+        no_rows = np.array([], dtype=np.intp)
+        leader_results = {}
+        for analytic_id, data in results_by_analytic.items():
+            results = {
+                name: (frame.take(partitions[analytic_id][name].get(leader, no_rows))
+                       if name in partitions[analytic_id] else frame)
+                for name, frame in data['results'].items()
+            }
+            leader_results[analytic_id] = dict(data, results=results)
+        return leader_results
+
     def generate_consolidated_main_report(self, results_by_analytic: Dict[str, Dict],
                                           leader_field_by_analytic: Dict[str, str],
                                           all_leaders: List[str]) -> str:
@@ -137,15 +453,25 @@ class ConsolidatedReportGenerator:
 
         try:
             # Create Excel writer
-            with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
+            with excel_writer(output_path, self.excel_engine) as writer:
+                leader_summary = pd.DataFrame()
                 try:
+                    # One row per analytic and leader, shared by the summary tables and heatmaps
+                    leader_summary = self._build_leader_summary(results_by_analytic, leader_field_by_analytic)
+
                     # Create department-level executive summary
-                    self._create_department_summary(writer, results_by_analytic, leader_field_by_analytic, all_leaders)
+                    self._create_department_summary(writer, results_by_analytic, leader_summary, all_leaders)
                 except Exception as e:
                     logger.error(f"Error creating department summary: {e}")
                     # Create a basic summary instead
                     self._create_basic_summary(writer, results_by_analytic)
 
+                try:
+                    # Month-over-month trends from the stored per-run summaries
+                    self._create_trend_section(writer, results_by_analytic)
+                except Exception as e:
+                    logger.error(f"Error creating trend section: {e}")
+
                 # Add summaries by analytic
                 for analytic_id, data in results_by_analytic.items():
                     try:
@@ -155,8 +481,8 @@ class ConsolidatedReportGenerator:
                         # Summary sheet for this analytic
                         if 'summary' in results and not results['summary'].empty:
                             sheet_name = f"QA-{analytic_id} Summary"
-                            results['summary'].to_excel(writer, sheet_name=sheet_name, index=False)
-                            self._adjust_column_widths(writer.sheets[sheet_name])
+                            worksheet = write_frame(writer, results['summary'], sheet_name)
+                            fit_column_widths(worksheet, [results['summary']])
                     except Exception as e:
                         logger.error(f"Error adding summary for analytic {analytic_id}: {e}")
 
@@ -189,14 +515,15 @@ class ConsolidatedReportGenerator:
                         config_data.append({'Parameter': '', 'Value': ''})
 
                     # Write configuration data
-                    pd.DataFrame(config_data).to_excel(writer, sheet_name='Configuration', index=False)
-                    self._adjust_column_widths(writer.sheets['Configuration'])
+                    config_df = pd.DataFrame(config_data)
+                    worksheet = write_frame(writer, config_df, 'Configuration')
+                    fit_column_widths(worksheet, [config_df])
                 except Exception as e:
                     logger.error(f"Error adding configuration data: {e}")
 
                 try:
                     # Add cross-analytic detail data (all records from all analytics)
-                    self._add_all_detail_data(writer, results_by_analytic)
+                    self._add_all_detail_data(writer, results_by_analytic, leader_summary)
                 except Exception as e:
                     logger.error(f"Error adding detail data: {e}")
 
@@ -231,34 +558,187 @@ class ConsolidatedReportGenerator:
             config = data['config']
             basic_data.append({'Analytics Summary': f"QA-{analytic_id}: {config['analytic_name']}"})
 
+        # The detailed summary may have failed part way through its sheet
+        sheet_name = restart_sheet(writer, 'Department Summary', 'Department Summary (Basic)')
+
         # Create DataFrame and write to sheet
         basic_df = pd.DataFrame(basic_data)
-        basic_df.to_excel(writer, sheet_name='Department Summary', index=False)
+        worksheet = write_frame(writer, basic_df, sheet_name)
 
         # Add note about error
         try:
-            worksheet = writer.sheets['Department Summary']
             row_count = len(basic_data) + 3  # Header row + data rows + buffer
-            worksheet.cell(row=row_count,
-                           column=1).value = "Note: Detailed summary could not be generated due to an error."
-            worksheet.cell(row=row_count, column=1).font = writer.book.create_font(bold=True, color="FF0000")
+            note = "Note: Detailed summary could not be generated due to an error."
+            write_cell(writer, sheet_name, row_count, 1, note, {'bold': True, 'color': 'FF0000'})
 
             # Auto-adjust column widths
-            self._adjust_column_widths(worksheet)
+            fit_column_widths(worksheet, [basic_df], [note])
         except Exception as e:
             logger.error(f"Error formatting basic summary: {e}")
             # Continue without additional formatting
 
+    @staticmethod
+    def _build_leader_summary(results_by_analytic: Dict[str, Dict],
+                              leader_field_by_analytic: Dict[str, str]) -> pd.DataFrame:
+        """
+        Combine every analytic's summary into one row per analytic and audit leader
+
+        Args:
+            results_by_analytic: Dictionary of results by analytic ID
+            leader_field_by_analytic: Dictionary mapping analytic IDs to their leader field names
+
+        Returns:
+            DataFrame with QA-ID, Analytic Name, Audit Leader, GC, PC, DNC, Total, DNC %,
+            Threshold % and Exceeds Threshold columns; rows without a leader are dropped
+        """
+        columns = ['QA-ID', 'Analytic Name', 'Audit Leader', 'GC', 'PC', 'DNC', 'Total', 'DNC %',
+                   'Threshold %', 'Exceeds Threshold']
+        tables = []
+
+        for analytic_id, data in results_by_analytic.items():
+            config = data['config']
+            results = data['results']
+
+            if 'summary' not in results or results['summary'].empty:
+                continue
+
+            summary = results['summary']
+            summary = summary[summary[leader_field_by_analytic[analytic_id]].notna()]
+            threshold = config['thresholds']['error_percentage']
+
+            # Missing count columns read as 0, like the rest of the report
+            table = pd.DataFrame({
+                'QA-ID': analytic_id,
+                'Analytic Name': config['analytic_name'],
+                'Audit Leader': summary[leader_field_by_analytic[analytic_id]].astype(object),
+                'GC': summary.get('GC', 0),
+                'PC': summary.get('PC', 0),
+                'DNC': summary.get('DNC', 0),
+                'Total': summary.get('Total', 0),
+                'DNC %': summary.get('DNC_Percentage', 0),
+                'Threshold %': threshold
+            }, index=summary.index)
+            table['Exceeds Threshold'] = np.where(table['DNC %'] > threshold, 'Yes', 'No')
+            tables.append(table)
+
+        if not tables:
+            return pd.DataFrame(columns=columns)
+        return pd.concat(tables, ignore_index=True)[columns]
+
+    def _create_trend_section(self, writer, results_by_analytic: Dict[str, Dict]):
+        """
+        Create the month-over-month trend sheet from the run history
+
+        Only the stored per-run, per-group summary rows are read; each run adds its own
+        rows to the store, so history never has to be recomputed from detail.
+
+        Args:
+            writer: Excel writer object
+            results_by_analytic: Dictionary of results by analytic ID
+        """
+        # First day of the earliest month in the trend window
+        today = datetime.date.today()
+        month_index = today.year * 12 + today.month - TREND_MONTHS
+        since = datetime.date(month_index // 12, month_index % 12 + 1, 1).isoformat()
+
+        histories = [self.results_store.summary_history(analytic_id, since=since)
+                     for analytic_id in results_by_analytic]
+        history = pd.concat(histories, ignore_index=True) if histories else pd.DataFrame()
+        if history.empty:
+            logger.info("No stored run history; skipping trend section")
+            return
+
+        analytic_names = {analytic_id: data['config']['analytic_name']
+                          for analytic_id, data in results_by_analytic.items()}
+        leader_trend, analytic_trend = self._build_trend_tables(history, analytic_names)
+
+        # Audit leaders down the side, months across
+        dnc_by_month = leader_trend.pivot(index='Audit Leader', columns='Month', values='DNC %').reset_index()
+        dnc_by_month.columns.name = None
+
+        sheet_name = "Trends"
+        title_style = {'bold': True, 'size': 12}
+        merge_cells(writer, sheet_name, 1, 1, max(len(dnc_by_month.columns), len(analytic_trend.columns)),
+                    "MONTH-OVER-MONTH TRENDS", {'bold': True, 'size': 14, 'align': 'center'})
+
+        # Section 1: DNC % heatmap by leader and month
+        write_cell(writer, sheet_name, 3, 1, "DNC % by Audit Leader and Month", title_style)
+        worksheet = write_frame(writer, dnc_by_month, sheet_name, startrow=3,
+                                header_style={'bold': True, 'border': True, 'align': 'center'})
+        if len(dnc_by_month.columns) > 1:
+            from openpyxl.utils import get_column_letter
+            add_color_scale(writer, sheet_name,
+                            f"B5:{get_column_letter(len(dnc_by_month.columns))}{4 + len(dnc_by_month)}",
+                            [(0, '63BE7B'), (50, 'FFEB84'), (100, 'F8696B')])
+
+        # Section 2: per leader rolling DNC % and threshold breaches
+        leader_row = 6 + len(dnc_by_month)
+        write_cell(writer, sheet_name, leader_row, 1,
+                   f"Audit Leader Trend (rolling {TREND_ROLLING_MONTHS}-month DNC %)", title_style)
+        write_frame(writer, leader_trend, sheet_name, startrow=leader_row,
+                    header_style={'bold': True, 'border': True})
+
+        # Section 3: per analytic rolling DNC % and threshold breaches
+        analytic_row = leader_row + len(leader_trend) + 3
+        write_cell(writer, sheet_name, analytic_row, 1,
+                   f"Analytic Trend (rolling {TREND_ROLLING_MONTHS}-month DNC %)", title_style)
+        write_frame(writer, analytic_trend, sheet_name, startrow=analytic_row,
+                    header_style={'bold': True, 'border': True})
+
+        fit_column_widths(worksheet, [dnc_by_month, leader_trend, analytic_trend])
+
+    @staticmethod
+    def _build_trend_tables(history: pd.DataFrame,
+                            analytic_names: Dict[str, str]) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Aggregate stored run summaries into monthly trends per audit leader and per analytic
+
+        The latest run of each analytic in a month stands for that month. Rolling DNC % is
+        DNC over Total summed across the last TREND_ROLLING_MONTHS months that have runs.
+
+        Args:
+            history: Rows from ResultsStore.summary_history; group values are audit leaders
+            analytic_names: Analytic names by analytic ID
+
+        Returns:
+            Tuple of (leader trend, analytic trend) tables
+        """
+        history = history.assign(Month=history['run_date'].str[:7])
+        latest_runs = (history.sort_values(['run_date', 'run_id'])
+                       .groupby(['analytic_id', 'Month'])['run_id'].last())
+        history = history[history['run_id'].isin(latest_runs)]
+
+        def trend(keys: List[str], breach_label: str) -> pd.DataFrame:
+            table = (history.groupby(keys + ['Month'], sort=True)
+                     .agg(DNC=('DNC', 'sum'), Total=('Total', 'sum'), Breaches=('Exceeds_Threshold', 'sum'))
+                     .reset_index())
+            table['DNC %'] = (table['DNC'] / table['Total'] * 100).round(2)
+            rolling = (table.groupby(keys, sort=False)[['DNC', 'Total']]
+                       .rolling(TREND_ROLLING_MONTHS, min_periods=1).sum()
+                       .reset_index(level=list(range(len(keys))), drop=True))
+            rolling_column = f'Rolling {TREND_ROLLING_MONTHS}-Month DNC %'
+            table[rolling_column] = (rolling['DNC'] / rolling['Total'] * 100).round(2)
+            columns = keys + ['Month', 'DNC', 'Total', 'DNC %', rolling_column, 'Breaches']
+            return table[columns].rename(columns={'Breaches': breach_label})
+
+        leader_trend = trend(['group_value'], 'Analytics Exceeding Threshold').rename(
+            columns={'group_value': 'Audit Leader'})
+
+        analytic_trend = trend(['analytic_id'], 'Leaders Exceeding Threshold').rename(
+            columns={'analytic_id': 'QA-ID'})
+        analytic_trend.insert(1, 'Analytic Name', analytic_trend['QA-ID'].map(analytic_names))
+
+        return leader_trend, analytic_trend
+
     def _create_department_summary(self, writer, results_by_analytic: Dict[str, Dict],
-                                   leader_field_by_analytic: Dict[str, str],
-                                   all_leaders: List[str]):
+                                   leader_summary: pd.DataFrame, all_leaders: List[str]):
         """
         Create a department-level summary sheet
 
         Args:
             writer: Excel writer object
             results_by_analytic: Dictionary of results by analytic ID
-            leader_field_by_analytic: Dictionary mapping analytic IDs to their leader field names
+            leader_summary: Table from _build_leader_summary
             all_leaders: List of all audit leaders
         """
         # Create header data
@@ -271,53 +751,20 @@ class ConsolidatedReportGenerator:
             {'Overview': ""}
         ]
 
-        # Create a pivot table style summary
-        # First, gather data for each analytic and leader combination
-        summary_data = []
-
-        for analytic_id, data in results_by_analytic.items():
-            config = data['config']
-            results = data['results']
-            analytic_name = config['analytic_name']
-            threshold = config['thresholds']['error_percentage']
-
-            if 'summary' in results and not results['summary'].empty:
-                summary = results['summary']
-                leader_field = leader_field_by_analytic[analytic_id]
-
-                # For each leader in this analytic's summary
-                for _, row in summary.iterrows():
-                    leader = row[leader_field]
-                    if pd.isna(leader):
-                        continue
-
-                    summary_row = {
-                        'QA-ID': analytic_id,
-                        'Analytic Name': analytic_name,
-                        'Audit Leader': leader,
-                        'GC': row.get('GC', 0),
-                        'PC': row.get('PC', 0),
-                        'DNC': row.get('DNC', 0),
-                        'Total': row.get('Total', 0),
-                        'DNC %': row.get('DNC_Percentage', 0),
-                        'Threshold %': threshold,
-                        'Exceeds Threshold': 'Yes' if row.get('DNC_Percentage', 0) > threshold else 'No'
-                    }
-
-                    summary_data.append(summary_row)
-
         # Create two summary tables:
         # 1. By Analytic (all leaders)
         # 2. By Leader (all analytics)
 
-        if summary_data:
-            # Convert to DataFrame
-            summary_df = pd.DataFrame(summary_data)
+        if not leader_summary.empty:
+            summary_df = leader_summary
 
             # Write header
             header_df = pd.DataFrame(header_data)
-            header_df.to_excel(writer, sheet_name='Department Summary', index=False)
-            worksheet = writer.sheets['Department Summary']
+            worksheet = write_frame(writer, header_df, 'Department Summary')
+
+            # Frames and column A text written to the sheet, for sizing columns
+            sheet_frames = [header_df]
+            sheet_texts = []
 
             # 1. Summary by Analytic
             analytic_pivot = pd.pivot_table(
@@ -333,8 +780,8 @@ class ConsolidatedReportGenerator:
             )
 
             # Add exceeds threshold column
-            analytic_pivot['Exceeds Threshold'] = analytic_pivot.apply(
-                lambda x: 'Yes' if x['DNC %'] > x['Threshold %'] else 'No', axis=1
+            analytic_pivot['Exceeds Threshold'] = np.where(
+                analytic_pivot['DNC %'] > analytic_pivot['Threshold %'], 'Yes', 'No'
             )
 
             # Round percentages
@@ -342,17 +789,14 @@ class ConsolidatedReportGenerator:
 
             # Write to sheet starting at an offset from header
             start_row = len(header_data) + 2
-            worksheet.cell(row=start_row, column=1).value = "SUMMARY BY ANALYTIC"
-            analytic_pivot.to_excel(
-                writer,
-                sheet_name='Department Summary',
-                startrow=start_row + 1,
-                index=False
-            )
+            write_cell(writer, 'Department Summary', start_row, 1, "SUMMARY BY ANALYTIC")
+            write_frame(writer, analytic_pivot, 'Department Summary', startrow=start_row + 1)
+            sheet_frames.append(analytic_pivot)
+            sheet_texts.append("SUMMARY BY ANALYTIC")
 
             # 2. Summary by Leader
             start_row = start_row + len(analytic_pivot) + 4
-            worksheet.cell(row=start_row, column=1).value = "SUMMARY BY AUDIT LEADER"
+            write_cell(writer, 'Department Summary', start_row, 1, "SUMMARY BY AUDIT LEADER")
 
             leader_pivot = pd.pivot_table(
                 summary_df,
@@ -365,35 +809,27 @@ class ConsolidatedReportGenerator:
             leader_pivot['DNC %'] = leader_pivot['DNC %'].round(2)
 
             # Calculate whether any analytic exceeds threshold for this leader
-            leader_exceeds = summary_df.groupby('Audit Leader')['Exceeds Threshold'].apply(
-                lambda x: 'Yes' if 'Yes' in x.values else 'No'
-            ).reset_index()
+            leader_exceeds = (summary_df['Exceeds Threshold'].eq('Yes')
+                              .groupby(summary_df['Audit Leader']).any()
+                              .map({True: 'Yes', False: 'No'})
+                              .reset_index())
 
             # Merge with leader_pivot
             leader_pivot = leader_pivot.merge(leader_exceeds, on='Audit Leader')
 
-            leader_pivot.to_excel(
-                writer,
-                sheet_name='Department Summary',
-                startrow=start_row + 1,
-                index=False
-            )
+            write_frame(writer, leader_pivot, 'Department Summary', startrow=start_row + 1)
+            sheet_frames.append(leader_pivot)
+            sheet_texts.append("SUMMARY BY AUDIT LEADER")
 
             # 3. Add a heatmap-style matrix (Leader x Analytic with DNC %)
             start_row = start_row + len(leader_pivot) + 4
-            worksheet.cell(row=start_row, column=1).value = "DNC % HEATMAP BY LEADER AND ANALYTIC"
+            write_cell(writer, 'Department Summary', start_row, 1, "DNC % HEATMAP BY LEADER AND ANALYTIC")
+            sheet_texts.append("DNC % HEATMAP BY LEADER AND ANALYTIC")
 
             # Create a flattened version of the heatmap data that avoids MultiIndex issues
-            heatmap_data = []
-            for _, row in summary_df.iterrows():
-                heatmap_data.append({
-                    'Audit Leader': row['Audit Leader'],
-                    'QA-ID': row['QA-ID'],
-                    'Analytic Name': row['Analytic Name'],
-                    'DNC %': row['DNC %']
-                })
-
-            heatmap_df = pd.DataFrame(heatmap_data)
+            heatmap_df = summary_df[['Audit Leader', 'QA-ID', 'Analytic Name', 'DNC %']].copy()
+            # First row a fallback table can use without writing over the heatmap
+            heatmap_next_row = start_row + 1
 
             # Create a pivot table that doesn't use MultiIndex columns
             try:
@@ -412,76 +848,33 @@ class ConsolidatedReportGenerator:
                 # Reset index to make Audit Leader a column
                 flat_heatmap = flat_heatmap.reset_index()
 
-                # Write to sheet
-                flat_heatmap.to_excel(
-                    writer,
-                    sheet_name='Department Summary',
-                    startrow=start_row + 1,
-                    index=False
-                )
+                # Make the heatmap title row bold and larger
+                write_cell(writer, 'Department Summary', start_row + 1, 1, None, {'bold': True, 'size': 12})
 
-                # Apply conditional formatting (color gradient) to the heatmap
-                # Get reference to the worksheet
-                worksheet = writer.sheets['Department Summary']
+                # Write to sheet: center all cells, add borders, make headers bold
+                write_frame(writer, flat_heatmap, 'Department Summary', startrow=start_row + 1,
+                            header_style={'bold': True, 'border': True, 'align': 'center', 'valign': 'center'},
+                            body_style={'border': True, 'align': 'center', 'valign': 'center'})
+                sheet_frames.append(flat_heatmap)
+                heatmap_next_row = start_row + len(flat_heatmap) + 4
 
                 # Determine the range of cells for the heatmap values (excluding headers and audit leader column)
                 start_col = 2  # Column B (assuming Audit Leader is column A)
                 start_data_row = start_row + 3  # First data row (+1 for header, +1 for startrow offset, +1 for the header row excel adds)
                 end_row = start_data_row + len(flat_heatmap.index) - 1
-                end_col = start_col + len(flat_heatmap.columns) - 1  # -1 because Audit Leader is already accounted for
-
-                # Define color scale: green for low values, yellow for middle, red for high values
-                from openpyxl.formatting.rule import ColorScaleRule
-                from openpyxl.styles import Alignment, Font, PatternFill, Border, Side
-
-                # Apply color scale rule
-                color_scale = ColorScaleRule(
-                    start_type='num', start_value=0, start_color='63BE7B',  # Green
-                    mid_type='num', mid_value=50, mid_color='FFEB84',  # Yellow
-                    end_type='num', end_value=100, end_color='F8696B'  # Red
-                )
-
-                # Determine the cell range (e.g., "B4:C10")
-                heatmap_range = f"{worksheet.cell(row=start_data_row, column=start_col).coordinate}:{worksheet.cell(row=end_row, column=end_col).coordinate}"
-                worksheet.conditional_formatting.add(heatmap_range, color_scale)
-
-                # Improve formatting: center all cells, add borders, make headers bold
-                # Center all cells in the heatmap
-                for row in range(start_data_row - 1, end_row + 1):  # Include header row
-                    for col in range(1, end_col + 1):  # Include Audit Leader column
-                        cell = worksheet.cell(row=row, column=col)
-                        cell.alignment = Alignment(horizontal='center', vertical='center')
-
-                        # Add borders to all cells
-                        thin_border = Border(
-                            left=Side(style='thin'),
-                            right=Side(style='thin'),
-                            top=Side(style='thin'),
-                            bottom=Side(style='thin')
-                        )
-                        cell.border = thin_border
-
-                        # Make headers bold
-                        if row == start_data_row - 1:  # Header row
-                            cell.font = Font(bold=True)
-
-                # Make the heatmap title bold and larger
-                title_cell = worksheet.cell(row=start_row + 1, column=1)
-                title_cell.font = Font(bold=True, size=12)
-
-                # Add a note about the color coding
-                note_row = end_row + 2
-                note_cell = worksheet.cell(row=note_row, column=1)
-                note_cell.value = "Note: Color coding indicates DNC % values - Green (0%) → Yellow (50%) → Red (100%)"
-                note_cell.font = Font(italic=True)
+                end_col = len(flat_heatmap.columns)
 
-                # Ensure the first column is wide enough for audit leader names
-                worksheet.column_dimensions['A'].width = 25
+                # Apply color scale: green for low values, yellow for middle, red for high values
+                from openpyxl.utils import get_column_letter
+                heatmap_range = (f"{get_column_letter(start_col)}{start_data_row}:"
+                                 f"{get_column_letter(end_col)}{end_row}")
+                add_color_scale(writer, 'Department Summary', heatmap_range,
+                                [(0, '63BE7B'), (50, 'FFEB84'), (100, 'F8696B')])  # Green, yellow, red
 
-                # Make analytic columns wider for better readability
-                for col_idx in range(start_col, end_col + 1):
-                    col_letter = worksheet.cell(row=1, column=col_idx).column_letter
-                    worksheet.column_dimensions[col_letter].width = 30
+                # Add a note about the color coding
+                note = "Note: Color coding indicates DNC % values - Green (0%) → Yellow (50%) → Red (100%)"
+                write_cell(writer, 'Department Summary', end_row + 2, 1, note, {'italic': True})
+                sheet_texts.append(note)
 
             except Exception as e:
                 # Fallback approach if pivot table or formatting doesn't work
@@ -490,37 +883,34 @@ class ConsolidatedReportGenerator:
                 # Create a simple table instead
                 fallback_table = heatmap_df[['Audit Leader', 'Analytic', 'DNC %']]
 
-                worksheet.cell(row=start_row + 1,
-                               column=1).value = "Note: Simplified format due to Excel formatting constraints"
+                note = "Note: Simplified format due to Excel formatting constraints"
+                write_cell(writer, 'Department Summary', heatmap_next_row, 1, note)
+                sheet_texts.append(note)
 
-                fallback_table.to_excel(
-                    writer,
-                    sheet_name='Department Summary',
-                    startrow=start_row + 3,
-                    index=False
-                )
+                write_frame(writer, fallback_table, 'Department Summary', startrow=heatmap_next_row + 2)
+                sheet_frames.append(fallback_table)
 
             # Auto-adjust column widths
-            self._adjust_column_widths(worksheet)
+            fit_column_widths(worksheet, sheet_frames, sheet_texts)
         else:
             # Create a basic summary if no data available
             basic_summary = pd.DataFrame(header_data)
-            basic_summary.to_excel(writer, sheet_name='Department Summary', index=False)
-            worksheet = writer.sheets['Department Summary']
+            worksheet = write_frame(writer, basic_summary, 'Department Summary')
 
             # Add message about no data
             start_row = len(header_data) + 2
-            worksheet.cell(row=start_row, column=1).value = "No analytics data available for summary."
+            write_cell(writer, 'Department Summary', start_row, 1, "No analytics data available for summary.")
 
-            self._adjust_column_widths(worksheet)
+            fit_column_widths(worksheet, [basic_summary], ["No analytics data available for summary."])
 
-    def _add_all_detail_data(self, writer, results_by_analytic: Dict[str, Dict]):
+    def _add_all_detail_data(self, writer, results_by_analytic: Dict[str, Dict], leader_summary: pd.DataFrame):
         """
         Add all detail data to the report for cross-analytic analysis
 
         Args:
             writer: Excel writer object
             results_by_analytic: Dictionary of results by analytic ID
+            leader_summary: Table from _build_leader_summary, for the heatmap sheet
         """
         # Create a sheet with all detail records from all analytics
         all_detail_data = []
@@ -541,167 +931,58 @@ class ConsolidatedReportGenerator:
         # If we have detail data, combine it and write to a sheet
         if all_detail_data:
             combined_df = pd.concat(all_detail_data, ignore_index=True)
-            combined_df.to_excel(writer, sheet_name="All Detail Data", index=False)
-            self._adjust_column_widths(writer.sheets["All Detail Data"])
+            worksheet = write_frame(writer, combined_df, "All Detail Data")
+            fit_column_widths(worksheet, [combined_df])
 
         # Create an alternative heatmap visualization as a separate sheet for better readability
         try:
-            self._create_enhanced_heatmap(writer, results_by_analytic)
+            self._create_enhanced_heatmap(writer, leader_summary)
         except Exception as e:
             logger.error(f"Error creating enhanced heatmap: {e}")
 
-    def _create_enhanced_heatmap(self, writer, results_by_analytic):
+    def _create_enhanced_heatmap(self, writer, leader_summary: pd.DataFrame):
         """
         Create an enhanced, more readable heatmap visualization
 
         Args:
             writer: Excel writer object
-            results_by_analytic: Dictionary of results by analytic ID
+            leader_summary: Table from _build_leader_summary
         """
-        # Collect data for all analytics and audit leaders
-        heatmap_data = []
-
-        for analytic_id, data in results_by_analytic.items():
-            config = data['config']
-            results = data['results']
-
-            if 'summary' in results and not results['summary'].empty:
-                summary = results['summary']
-                leader_field = config['reporting']['group_by']
-
-                for _, row in summary.iterrows():
-                    leader = row[leader_field]
-                    if pd.isna(leader):
-                        continue
-
-                    dnc_pct = row.get('DNC_Percentage', 0)
-                    threshold = config['thresholds']['error_percentage']
-                    exceeds = 'Yes' if dnc_pct > threshold else 'No'
-
-                    heatmap_data.append({
-                        'Audit Leader': leader,
-                        'QA-ID': analytic_id,
-                        'Analytic Name': config['analytic_name'],
-                        'DNC %': dnc_pct,
-                        'Threshold %': threshold,
-                        'Exceeds Threshold': exceeds
-                    })
-
-        if not heatmap_data:
+        if leader_summary.empty:
             return
 
-        # Create DataFrame
-        heatmap_df = pd.DataFrame(heatmap_data)
+        heatmap_df = leader_summary[['Audit Leader', 'QA-ID', 'Analytic Name', 'DNC %', 'Threshold %',
+                                     'Exceeds Threshold']]
 
-        # Create a new worksheet for the heatmap
         sheet_name = "DNC Heatmap"
-        heatmap_df.to_excel(writer, sheet_name=sheet_name, index=False)
-
-        # Get worksheet
-        ws = writer.sheets[sheet_name]
-
-        # Apply formatting
-        from openpyxl.styles import PatternFill, Font, Alignment, Border, Side
-        from openpyxl.formatting.rule import ColorScaleRule
-
-        # Define color fills for various thresholds
-        green_fill = PatternFill(start_color="63BE7B", end_color="63BE7B", fill_type="solid")  # Green
-        yellow_fill = PatternFill(start_color="FFEB84", end_color="FFEB84", fill_type="solid")  # Yellow
-        orange_fill = PatternFill(start_color="FFC000", end_color="FFC000", fill_type="solid")  # Orange
-        red_fill = PatternFill(start_color="F8696B", end_color="F8696B", fill_type="solid")  # Red
-
-        # Define borders and alignment
-        border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
-        )
-        center_alignment = Alignment(horizontal='center', vertical='center')
-        bold_font = Font(bold=True)
-
-        # Apply header formatting
-        for cell in ws[1]:
-            cell.font = bold_font
-            cell.border = border
-            cell.alignment = center_alignment
-
-        # Format all data cells
-        for row in ws.iter_rows(min_row=2, min_col=1, max_row=len(heatmap_data) + 1, max_col=len(heatmap_df.columns)):
-            for cell in row:
-                cell.border = border
-                cell.alignment = center_alignment
-
-                # Apply color to DNC % cells (column index 3 - zero-based, so 4 in Excel)
-                if cell.column == 4:  # DNC % column
-                    value = cell.value
-                    if value is not None:
-                        if value < 25:
-                            cell.fill = green_fill
-                        elif value < 50:
-                            cell.fill = yellow_fill
-                        elif value < 75:
-                            cell.fill = orange_fill
-                        else:
-                            cell.fill = red_fill
-
-                # Apply color to Exceeds Threshold cells
-                if cell.column == 6:  # Exceeds Threshold column
-                    if cell.value == 'Yes':
-                        cell.fill = red_fill
-                    else:
-                        cell.fill = green_fill
-
-        # Set column widths
-        ws.column_dimensions['A'].width = 25  # Audit Leader
-        ws.column_dimensions['B'].width = 10  # QA-ID
-        ws.column_dimensions['C'].width = 35  # Analytic Name
-        ws.column_dimensions['D'].width = 15  # DNC %
-        ws.column_dimensions['E'].width = 15  # Threshold %
-        ws.column_dimensions['F'].width = 20  # Exceeds Threshold
-
-        # Add title and legend
-        ws.insert_rows(1, 3)  # Add 3 rows at the top
-
-        # Add title
-        title_cell = ws.cell(row=1, column=1)
-        title_cell.value = "DNC PERCENTAGE HEATMAP BY AUDIT LEADER AND ANALYTIC"
-        title_cell.font = Font(bold=True, size=14)
-        ws.merge_cells(start_row=1, start_column=1, end_row=1, end_column=6)
-        title_cell.alignment = Alignment(horizontal='center', vertical='center')
-
-        # Add legend
-        legend_cell = ws.cell(row=2, column=1)
-        legend_cell.value = "Color Legend: "
-        legend_cell.font = Font(bold=True)
-
-        # Green legend
-        green_cell = ws.cell(row=2, column=2)
-        green_cell.value = "< 25%"
-        green_cell.fill = green_fill
-        green_cell.border = border
-        green_cell.alignment = center_alignment
-
-        # Yellow legend
-        yellow_cell = ws.cell(row=2, column=3)
-        yellow_cell.value = "25% - 49%"
-        yellow_cell.fill = yellow_fill
-        yellow_cell.border = border
-        yellow_cell.alignment = center_alignment
-
-        # Orange legend
-        orange_cell = ws.cell(row=2, column=4)
-        orange_cell.value = "50% - 74%"
-        orange_cell.fill = orange_fill
-        orange_cell.border = border
-        orange_cell.alignment = center_alignment
-
-        # Red legend
-        red_cell = ws.cell(row=2, column=5)
-        red_cell.value = "≥ 75%"
-        red_cell.fill = red_fill
-        red_cell.border = border
-        red_cell.alignment = center_alignment
+
+        # Define colors for various thresholds
+        green, yellow, orange, red = "63BE7B", "FFEB84", "FFC000", "F8696B"
+        center = {'align': 'center', 'valign': 'center'}
+        cell_style = dict(center, border=True)
+
+        # Title and legend go in the first rows, so the table starts below them
+        merge_cells(writer, sheet_name, 1, 1, 6, "DNC PERCENTAGE HEATMAP BY AUDIT LEADER AND ANALYTIC",
+                    dict(center, bold=True, size=14))
+        write_cell(writer, sheet_name, 2, 1, "Color Legend: ", {'bold': True})
+        for column, (label, color) in enumerate([("< 25%", green), ("25% - 49%", yellow),
+                                                 ("50% - 74%", orange), ("≥ 75%", red)], 2):
+            write_cell(writer, sheet_name, 2, column, label, dict(cell_style, fill=color))
+
+        # Write the table with centered, bordered cells
+        worksheet = write_frame(writer, heatmap_df, sheet_name, startrow=3,
+                                header_style=dict(cell_style, bold=True), body_style=cell_style)
+
+        # Color DNC % cells by band and Exceeds Threshold cells by Yes/No with conditional
+        # formatting over the data rows; the first matching rule fills a cell
+        first_row, last_row = 5, 4 + len(heatmap_df)
+        add_fill_rules(writer, sheet_name, f"D{first_row}:D{last_row}",
+                       [('<', 25, green), ('<', 50, yellow), ('<', 75, orange), ('>=', 75, red)])
+        add_fill_rules(writer, sheet_name, f"F{first_row}:F{last_row}",
+                       [('==', 'Yes', red), ('!=', 'Yes', green)], skip_blanks=False)
+
+        # Set column widths: Audit Leader, QA-ID, Analytic Name, DNC %, Threshold %, Exceeds Threshold
+        set_column_widths(worksheet, [25, 10, 35, 15, 15, 20], padding=0)
 
     def _generate_leader_report(self, leader: str, results_by_analytic: Dict[str, Dict],
                                 leader_field_by_analytic: Dict[str, str]) -> str:
@@ -724,7 +1005,7 @@ class ConsolidatedReportGenerator:
             output_path = os.path.join(self.output_dir, filename)
 
             # Create Excel writer
-            with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
+            with excel_writer(output_path, self.excel_engine) as writer:
                 # Create executive summary
                 self._create_executive_summary(writer, leader, results_by_analytic, leader_field_by_analytic)
 
@@ -742,16 +1023,17 @@ class ConsolidatedReportGenerator:
                         if not leader_detail.empty:
                             # Write this analytic's detail to a sheet
                             sheet_name = f"QA-{analytic_id} Detail"
-                            leader_detail.to_excel(writer, sheet_name=sheet_name, index=False)
+                            worksheet = write_frame(writer, leader_detail, sheet_name)
 
                             # Auto-adjust column widths
-                            self._adjust_column_widths(writer.sheets[sheet_name])
+                            fit_column_widths(worksheet, [leader_detail])
 
                     # Add configuration info for this analytic
                     config_sheet_name = f"QA-{analytic_id} Config"
                     config_data = self._create_config_data(data['config'], data['source_file'])
-                    pd.DataFrame(config_data).to_excel(writer, sheet_name=config_sheet_name, index=False)
-                    self._adjust_column_widths(writer.sheets[config_sheet_name])
+                    config_df = pd.DataFrame(config_data)
+                    worksheet = write_frame(writer, config_df, config_sheet_name)
+                    fit_column_widths(worksheet, [config_df])
 
             logger.info(f"Generated consolidated report for {leader}: {output_path}")
             return output_path
@@ -810,26 +1092,32 @@ class ConsolidatedReportGenerator:
                 {'Overview': f"Consolidated QA Analytics Report"},
                 {'Overview': f"Audit Leader: {leader}"},
                 {'Overview': f"Date Generated: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"},
-                {'Overview': f"Number of Analytics: {len(results_by_analytic)}"},
+                {'Overview': f"Number of Analytics: {len(results_by_analytic)}"}
+            ]
+
+            # Detail sheets of delta reports only list rows that changed since the previous run
+            header_data.extend(
+                {'Overview': f"QA-{analytic_id} Detail: changes since run of {data['delta_since']}"}
+                for analytic_id, data in results_by_analytic.items() if 'delta_since' in data
+            )
+            header_data.extend([
                 {'Overview': ""},  # Empty row as separator
                 {'Overview': ""}  # Empty row as separator
-            ]
+            ])
 
             header_df = pd.DataFrame(header_data)
 
             # Write header and summary to executive summary sheet
-            header_df.to_excel(writer, sheet_name='Executive Summary', index=False)
+            worksheet = write_frame(writer, header_df, 'Executive Summary')
 
-            # Get the worksheet to determine where to start the summary table
-            worksheet = writer.sheets['Executive Summary']
+            # Determine where to start the summary table
             start_row = len(header_data) + 2  # +2 for header row and zero-indexing
 
             # Write summary data starting at the calculated row
-            summary_df.to_excel(writer, sheet_name='Executive Summary',
-                                startrow=start_row, index=False)
+            write_frame(writer, summary_df, 'Executive Summary', startrow=start_row)
 
             # Auto-adjust column widths
-            self._adjust_column_widths(worksheet)
+            fit_column_widths(worksheet, [header_df, summary_df])
         else:
             # Create a basic summary if no data available
             basic_summary = pd.DataFrame([
@@ -839,8 +1127,8 @@ class ConsolidatedReportGenerator:
                 {'Overview': f"No analytics data available for this audit leader."}
             ])
 
-            basic_summary.to_excel(writer, sheet_name='Executive Summary', index=False)
-            self._adjust_column_widths(writer.sheets['Executive Summary'])
+            worksheet = write_frame(writer, basic_summary, 'Executive Summary')
+            fit_column_widths(worksheet, [basic_summary])
 
     def _create_config_data(self, config: Dict, source_file: str = None) -> List[Dict]:
         """
@@ -898,21 +1186,20 @@ class ConsolidatedReportGenerator:
 
         return config_data
 
-    def _adjust_column_widths(self, worksheet):
-        """
-        Auto-adjust column widths in a worksheet
 
-        Args:
-            worksheet: Worksheet object to adjust
-        """
-        for idx, col in enumerate(worksheet.columns, 1):
-            max_length = 0
-            column = worksheet.cell(row=1, column=idx).column_letter
-            for cell in col:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-            adjusted_width = (max_length + 2)
-            worksheet.column_dimensions[column].width = min(adjusted_width, 50)
\ No newline at end of file
+def _generate_leader_report_task(output_dir: str, excel_engine: str, leader, leader_results: Dict[str, Dict],
+                                 leader_field_by_analytic: Dict[str, str]) -> str:
+    """Write one leader's consolidated report in a worker process from that leader's slices only"""
+    generator = ConsolidatedReportGenerator(output_dir=output_dir, excel_engine=excel_engine)
+    return generator._generate_leader_report(leader, leader_results, leader_field_by_analytic)
+
+
+def _run_analytic_task(connection, analytic_id: str, config: Dict, source_file: str,
+                       results_store: Optional[ResultsStore] = None, use_stage_cache: bool = False,
+                       record_detail: bool = False, use_source_cache: bool = True) -> None:
+    """Process one analytic in a worker process and send (success, message, results) back"""
+    try:
+        connection.send(ConsolidatedReportGenerator._run_analytic(analytic_id, config, source_file, results_store,
+                                                                  use_stage_cache, record_detail, use_source_cache))
+    finally:
+        connection.close()
@@ -1,21 +1,77 @@
 import os
+import time
+import inspect
 import pandas as pd
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple, Optional
 from validation_rules import ValidationRules
-from logging_config import setup_logging
+from prepared_columns import PreparedColumns
+from source_cache import FileHashManifest, SourceCache
+from stage_cache import StageCache
+from incremental_store import FINGERPRINT_COLUMN, IncrementalStore
+from results_store import ResultsStore
+from reference_cache import REFERENCE_CACHE, ReferenceCache
+import source_readers
+from source_readers import ReadPlan, get_reader
+from logging_config import get_logger
+
+logger = get_logger()
+
+# Text columns with at most this many distinct values, and at most this share of distinct
+# values per row, are stored as pandas categoricals after loading
+CATEGORY_MAX_UNIQUE = 10000
+CATEGORY_MAX_RATIO = 0.5
 
-logger = setup_logging()
 
 class DataProcessor:
     """Processes data files according to configuration rules"""
 
-    def __init__(self, config: Dict):
-        """Initialize with configuration dictionary"""
+    def __init__(self, config: Dict, parallel_validations: bool = False, max_workers: Optional[int] = None,
+                 use_source_cache: bool = True, source_cache: Optional[SourceCache] = None,
+                 reference_cache: Optional[ReferenceCache] = None, use_stage_cache: bool = False,
+                 stage_cache: Optional[StageCache] = None, incremental: bool = False,
+                 incremental_store: Optional[IncrementalStore] = None, record_results: bool = False,
+                 results_store: Optional[ResultsStore] = None, record_detail: bool = False):
+        """
+        Initialize with configuration dictionary
+
+        Args:
+            config: Configuration dictionary
+            parallel_validations: Default for running independent validations on a thread pool;
+                an analytic's 'execution.parallel_validations' setting takes precedence
+            max_workers: Default thread pool size; overridden by 'execution.max_workers'
+            use_source_cache: Set to False to bypass the parsed source cache
+            source_cache: Optional cache instance, e.g. to use a different directory or limits
+            reference_cache: Optional reference lookup cache; defaults to the one shared by the process
+            use_stage_cache: Default for reusing validated detail and summary frames stored by an
+                earlier run with the same inputs; 'execution.stage_cache' in the config takes
+                precedence. Each stored run writes its full detail to disk (see StageCache)
+            stage_cache: Optional cache instance for validated detail and summary frames
+            incremental: Default for validating only rows that are new or changed since the last
+                run, by 'source.record_id'; 'execution.incremental' in the config takes precedence
+            incremental_store: Optional store of the last run's results for incremental runs
+            record_results: Record this run's summary in the default results history
+            results_store: Results history to record this run in; given a store, runs are recorded
+                whatever record_results says
+            record_detail: Also record the run's detail rows, which delta reports compare against
+        """
         self.config = config
+        self.parallel_validations = parallel_validations
+        self.max_workers = max_workers
+        self.source_cache = (source_cache or SourceCache()) if use_source_cache else None
+        self.reference_cache = reference_cache or REFERENCE_CACHE
+        self.use_stage_cache = use_stage_cache
+        self.stage_cache = stage_cache
+        self.incremental = incremental
+        self.incremental_store = incremental_store or IncrementalStore()
+        self.results_store = results_store or (ResultsStore() if record_results else None)
+        self.record_detail = record_detail
         self.validation_rules = ValidationRules()
         self.reference_data = {}
         self.source_data = None
+        self.prepared_columns = None
+        self.validation_timings = {}
         self.results = None
 
     def load_source_data(self, file_path: str) -> bool:
@@ -26,8 +82,31 @@ class DataProcessor:
             bool: True if successful, False otherwise
         """
         try:
-            # Load data from Excel
-            self.source_data = pd.read_excel(file_path)
+            read_plan = self._build_read_plan()
+            cache_key = self._source_cache_key(read_plan) if self.source_cache is not None else None
+
+            # Reuse the prepared frame from a previous run of the same file, source config and code
+            if cache_key is not None:
+                cached = self.source_cache.get(file_path, cache_key)
+                if cached is not None:
+                    self.source_data = cached
+                    logger.info(f"Successfully loaded source data with {len(self.source_data)} rows (cached)")
+                    return True
+
+            # Load data with the reader for the configured file type
+            reader = get_reader(self.config['source'].get('file_type', 'xlsx'))
+            try:
+                self.source_data = reader(file_path, self.config['source'],
+                                          header_check=self._check_source_header, read_plan=read_plan)
+            except Exception as e:
+                if read_plan.columns is None:
+                    raise
+                # Fall back to reading every column, e.g. for readers that cannot project this file
+                logger.warning(f"Error reading projected columns ({e}); reading all columns")
+                read_plan = ReadPlan(column_types=read_plan.column_types)
+                cache_key = self._source_cache_key(read_plan) if cache_key is not None else None
+                self.source_data = reader(file_path, self.config['source'],
+                                          header_check=self._check_source_header, read_plan=read_plan)
 
             # Map column aliases to standard names
             self._map_column_aliases()
@@ -40,6 +119,10 @@ class DataProcessor:
 
             # Clean and prepare the data
             self._clean_data()
+            self._encode_categories()
+
+            if cache_key is not None:
+                self.source_cache.put(file_path, cache_key, self.source_data)
 
             logger.info(f"Successfully loaded source data with {len(self.source_data)} rows")
             return True
@@ -48,61 +131,194 @@ class DataProcessor:
             logger.error(f"Error loading source data: {e}")
             return False
 
+    def _source_cache_key(self, read_plan: ReadPlan) -> Optional[Dict]:
+        """
+        Describe what a cached source frame depends on besides the file itself
+
+        Returns:
+            Source settings and reader and cleaning code hashes, or None if the code files
+            cannot be hashed
+        """
+        # Fixes to the readers or to cleaning must not keep serving frames built by the old code
+        code_files = [inspect.getfile(source_readers), __file__]
+        try:
+            code_hashes = [self.source_cache.hashes.file_hash(path) for path in code_files]
+        except OSError as e:
+            logger.warning(f"Source cache disabled for this run: {e}")
+            return None
+        return dict(self._source_cache_config(read_plan), code_hashes=code_hashes)
+
+    def _source_cache_config(self, read_plan: ReadPlan) -> Dict:
+        """Source settings that shape the loaded frame, used in cache keys"""
+        # The projected columns depend on more than the source section, so they are part of the cache key
+        return dict(self.config['source'], read_columns=sorted(read_plan.columns or []))
+
     def _map_column_aliases(self) -> None:
         """Map column aliases to standard names based on configuration"""
         if not self.source_data is not None:
             return
 
+        column_mapping = self._column_alias_mapping(self.source_data.columns)
+
+        # Rename columns if needed
+        if column_mapping:
+            self.source_data = self.source_data.rename(columns=column_mapping)
+
+    def _column_alias_mapping(self, columns) -> Dict[str, str]:
+        """
+        Build the alias -> standard name mapping for a set of source column names
+
+        Args:
+            columns: Column names as found in the source file
+
+        Returns:
+            Dictionary of columns to rename
+        """
         column_mapping = {}
         for column_info in self.config['source']['required_columns']:
             std_name = column_info['name']
             aliases = column_info.get('alias', [])
 
-            # Check if standard name exists in DataFrame
-            if std_name in self.source_data.columns:
+            # Check if standard name exists in source
+            if std_name in columns:
                 continue
 
-            # Check if any alias exists in DataFrame
+            # Check if any alias exists in source
             for alias in aliases:
-                if alias in self.source_data.columns:
+                if alias in columns:
                     column_mapping[alias] = std_name
                     break
 
-        # Rename columns if needed
-        if column_mapping:
-            self.source_data = self.source_data.rename(columns=column_mapping)
+        return column_mapping
 
-    def _check_required_columns(self) -> List[str]:
-        """Check that all required columns are present"""
-        if self.source_data is None:
-            return []
+    def _check_required_columns(self, columns=None) -> List[str]:
+        """Check that all required columns are present, in the loaded data or the given column names"""
+        if columns is None:
+            if self.source_data is None:
+                return []
+            columns = self.source_data.columns
 
         required_columns = [col['name'] for col in self.config['source']['required_columns']]
-        missing = [col for col in required_columns if col not in self.source_data.columns]
+        missing = [col for col in required_columns if col not in columns]
         return missing
 
+    def _check_source_header(self, header: List[str]) -> None:
+        """Fail a load from its header row, before data rows are parsed where the reader allows it"""
+        column_mapping = self._column_alias_mapping(header)
+        missing_columns = self._check_required_columns([column_mapping.get(col, col) for col in header])
+        if missing_columns:
+            raise ValueError(f"Missing required columns: {', '.join(missing_columns)}")
+
     def _clean_data(self) -> None:
         """Clean and prepare data for analysis"""
         if self.source_data is None:
             return
 
-        # Convert date columns to datetime
+        # Convert columns to their declared types; undeclared columns named like dates are parsed as dates
+        declared_types = {}
         for col_info in self.config['source']['required_columns']:
             col_name = col_info['name']
-            if 'date' in col_name.lower() and col_name in self.source_data.columns:
-                try:
-                    self.source_data[col_name] = pd.to_datetime(
-                        self.source_data[col_name],
-                        errors='coerce'
-                    )
-                except Exception as e:
-                    logger.warning(f"Error converting {col_name} to datetime: {e}")
+            col_type = col_info.get('type')
+            if col_type is None and 'date' in col_name.lower():
+                col_type = 'date'
+            declared_types[col_name] = col_type
+
+            if col_name not in self.source_data.columns or col_type is None:
+                continue
+
+            values = self.source_data[col_name]
+            try:
+                if col_type == 'date':
+                    # An explicit format avoids per-value format inference
+                    self.source_data[col_name] = pd.to_datetime(values, format=col_info.get('format'),
+                                                                errors='coerce')
+                elif col_type == 'number':
+                    self.source_data[col_name] = pd.to_numeric(values, errors='coerce')
+                elif col_type == 'string':
+                    self.source_data[col_name] = values.where(values.isna(), values.astype(str))
+            except Exception as e:
+                logger.warning(f"Error converting {col_name} to {col_type}: {e}")
 
         # Strip whitespace from string columns
         for col in self.source_data.columns:
-            if self.source_data[col].dtype == 'object':
+            if self.source_data[col].dtype == 'object' and declared_types.get(col) not in ('date', 'number'):
                 self.source_data[col] = self.source_data[col].str.strip()
 
+    def _encode_categories(self) -> None:
+        """
+        Convert low-cardinality text columns to categoricals
+
+        Leader, approver, title and risk-level columns repeat a few hundred values across many
+        rows; as categoricals they take a fraction of the memory and group and compare on codes.
+        Disabled with 'source.categorical_encoding: false'.
+        """
+        if self.source_data is None or not self.config['source'].get('categorical_encoding', True):
+            return
+
+        row_count = len(self.source_data)
+        encoded = []
+        for col in self.source_data.columns:
+            values = self.source_data[col]
+            if values.dtype != 'object':
+                continue
+
+            unique_count = values.nunique()
+            if unique_count > CATEGORY_MAX_UNIQUE or unique_count > row_count * CATEGORY_MAX_RATIO:
+                continue
+
+            # Mixed-type columns stay as objects so their sort order and comparisons are unchanged
+            if pd.api.types.infer_dtype(values, skipna=True) != 'string':
+                continue
+
+            self.source_data[col] = values.astype('category')
+            encoded.append(col)
+
+        if encoded:
+            logger.info(f"Encoded {len(encoded)} low-cardinality column(s) as categories: {', '.join(encoded)}")
+
+    def _build_read_plan(self) -> ReadPlan:
+        """
+        Derive which physical columns to read and their declared types from the configuration
+
+        The plan covers the required columns (by standard name or alias), the record ID, the
+        group-by field and every column named by a rule's '*field*' parameters; other columns are
+        not parsed. Set 'source.project_columns: false' to read every column, e.g. to keep unused
+        source columns in the detail sheets.
+
+        Returns:
+            ReadPlan for the source reader
+        """
+        source = self.config['source']
+        aliases_by_name = {col['name']: [col['name']] + list(col.get('alias', []))
+                           for col in source['required_columns']}
+
+        column_types = {}
+        for col_info in source['required_columns']:
+            if col_info.get('type'):
+                for physical_name in aliases_by_name[col_info['name']]:
+                    column_types[physical_name] = col_info['type']
+
+        if not source.get('project_columns', True):
+            return ReadPlan(column_types=column_types)
+
+        used_columns = set(aliases_by_name)
+        if source.get('record_id'):
+            used_columns.add(source['record_id'])
+        group_by_field = self.config.get('reporting', {}).get('group_by')
+        if group_by_field:
+            used_columns.add(group_by_field)
+
+        for validation in self.config.get('validations', []):
+            for key, value in validation.get('parameters', {}).items():
+                if 'field' in key:
+                    used_columns.update(value if isinstance(value, list) else [value])
+
+        physical_columns = set()
+        for col_name in used_columns:
+            physical_columns.update(aliases_by_name.get(col_name, [col_name]))
+
+        return ReadPlan(columns=physical_columns, column_types=column_types)
+
     def load_reference_data(self) -> bool:
         """
         Load reference data files specified in configuration
@@ -130,16 +346,13 @@ class DataProcessor:
                     success = False
                     continue
 
-                # Load the reference file
-                ref_df = pd.read_excel(path)
-
-                # Create a dictionary from key->value columns
-                ref_dict = dict(zip(ref_df[key_col], ref_df[value_col]))
+                # Get the read-only key->value lookup, shared with other analytics using the same file
+                ref_lookup = self.reference_cache.get(path, key_col, value_col)
 
                 # Store in reference data dictionary
-                self.reference_data[name] = ref_dict
+                self.reference_data[name] = ref_lookup
 
-                logger.info(f"Loaded reference data '{name}' with {len(ref_dict)} entries")
+                logger.info(f"Loaded reference data '{name}' with {len(ref_lookup)} entries")
 
             except Exception as e:
                 logger.error(f"Error loading reference data {ref_file_info.get('name')}: {e}")
@@ -147,39 +360,87 @@ class DataProcessor:
 
         return success
 
+    def _parallel_settings(self) -> Tuple[bool, Optional[int]]:
+        """
+        Resolve whether validations run on a thread pool
+
+        The analytic's 'execution' config section overrides the processor-wide defaults.
+
+        Returns:
+            Tuple of (parallel enabled, max worker threads)
+        """
+        execution = self.config.get('execution', {})
+        parallel = execution.get('parallel_validations', self.parallel_validations)
+        max_workers = execution.get('max_workers', self.max_workers)
+        return bool(parallel), max_workers
+
+    def _run_validation(self, validation: Dict) -> Tuple[str, pd.Series, float]:
+        """
+        Run a single configured validation rule
+
+        Args:
+            validation: Validation entry from the configuration
+
+        Returns:
+            Tuple of (rule name, conformance result, wall time in seconds)
+        """
+        rule_name = validation['rule']
+        params = validation.get('parameters', {})
+        start_time = time.perf_counter()
+
+        # Get the validation method by name
+        if hasattr(self.validation_rules, rule_name) and callable(getattr(self.validation_rules, rule_name)):
+            validation_method = getattr(self.validation_rules, rule_name)
+
+            # Run the validation
+            try:
+                if rule_name == 'title_based_approval':
+                    result = validation_method(self.source_data, params, self.reference_data)
+                elif rule_name in ('segregation_of_duties', 'approval_sequence'):
+                    result = validation_method(self.source_data, params, self.prepared_columns)
+                else:
+                    result = validation_method(self.source_data, params)
+
+                elapsed = time.perf_counter() - start_time
+                logger.info(f"Validation '{rule_name}' completed in {elapsed:.3f}s - "
+                            f"{result.sum()} of {len(result)} records conform")
+                return rule_name, result, elapsed
+
+            except Exception as e:
+                logger.error(f"Error running validation '{rule_name}': {e}")
+        else:
+            logger.error(f"Validation rule '{rule_name}' not found")
+
+        return rule_name, pd.Series(False, index=self.source_data.index), time.perf_counter() - start_time
+
     def run_validations(self) -> None:
         """Run all validation rules and compile results"""
         if self.source_data is None:
             logger.error("Cannot run validations - no source data loaded")
             return
 
-        # Create result columns for each validation
-        validation_results = {}
-
-        for validation in self.config['validations']:
-            rule_name = validation['rule']
-            params = validation.get('parameters', {})
+        # Normalized columns are computed at most once per run and shared by all rules
+        self.prepared_columns = PreparedColumns(self.source_data)
 
-            # Get the validation method by name
-            if hasattr(self.validation_rules, rule_name) and callable(getattr(self.validation_rules, rule_name)):
-                validation_method = getattr(self.validation_rules, rule_name)
+        validations = self.config['validations']
+        parallel, max_workers = self._parallel_settings()
 
-                # Run the validation
-                try:
-                    if rule_name == 'title_based_approval':
-                        result = validation_method(self.source_data, params, self.reference_data)
-                    else:
-                        result = validation_method(self.source_data, params)
+        if parallel and len(validations) > 1:
+            # Rules only read the source data, so independent rules can share it across threads;
+            # map() yields outcomes in config order so the Valid_* columns stay deterministic
+            logger.info(f"Running {len(validations)} validations in parallel (max_workers={max_workers})")
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                outcomes = list(executor.map(self._run_validation, validations))
+        else:
+            outcomes = [self._run_validation(validation) for validation in validations]
 
-                    validation_results[rule_name] = result
-                    logger.info(f"Validation '{rule_name}' completed - {result.sum()} of {len(result)} records conform")
+        # Create result columns for each validation
+        validation_results = {}
+        self.validation_timings = {}
 
-                except Exception as e:
-                    logger.error(f"Error running validation '{rule_name}': {e}")
-                    validation_results[rule_name] = pd.Series(False, index=self.source_data.index)
-            else:
-                logger.error(f"Validation rule '{rule_name}' not found")
-                validation_results[rule_name] = pd.Series(False, index=self.source_data.index)
+        for rule_name, result, elapsed in outcomes:
+            validation_results[rule_name] = result
+            self.validation_timings[rule_name] = elapsed
 
         # Calculate overall result - "GC", "PC", or "DNC"
         if validation_results:
@@ -212,6 +473,94 @@ class DataProcessor:
             logger.warning("No validation results calculated")
             self.source_data['Compliance'] = 'N/A'
 
+    def _incremental_record_id(self) -> Optional[str]:
+        """
+        Resolve whether validations run incrementally
+
+        Returns:
+            The record ID column when incremental mode is on and configured, otherwise None
+        """
+        execution = self.config.get('execution', {})
+        if not execution.get('incremental', self.incremental):
+            return None
+
+        record_id = self.config['source'].get('record_id')
+        if not record_id or record_id not in self.source_data.columns:
+            logger.warning("Incremental mode needs 'source.record_id' naming a loaded column; validating all rows")
+            return None
+        return record_id
+
+    def run_incremental_validations(self, record_id: str) -> None:
+        """
+        Validate only rows that are new or changed since the last run and carry forward the rest
+
+        Rows are matched to the stored results by record ID and compared by a fingerprint of
+        their source values. All rows are validated when nothing usable is stored, for example
+        after a change to the rules or reference data, or when record IDs repeat.
+
+        Args:
+            record_id: Column identifying each record across runs
+        """
+        if self.source_data is None:
+            logger.error("Cannot run validations - no source data loaded")
+            return
+
+        try:
+            context = self._validation_context(self.incremental_store.hashes)
+        except Exception as e:
+            logger.warning(f"Incremental mode disabled for this run: {e}")
+            self.run_validations()
+            return
+
+        analytic_id = self.config['analytic_id']
+        full_data = self.source_data
+        record_ids = full_data[record_id]
+        fingerprints = pd.util.hash_pandas_object(full_data, index=False).to_numpy()
+
+        if not record_ids.is_unique:
+            logger.warning(f"Record IDs in '{record_id}' are not unique; validating all rows")
+            self.run_validations()
+            return
+
+        stored = self.incremental_store.load(analytic_id, context)
+        changed = np.ones(len(full_data), dtype=bool)
+        if stored is not None:
+            stored_positions = pd.Index(stored[record_id]).get_indexer(record_ids)
+            found = stored_positions >= 0
+            changed[found] = stored[FINGERPRINT_COLUMN].to_numpy()[stored_positions[found]] != fingerprints[found]
+
+        changed_count = int(changed.sum())
+        logger.info(f"Incremental run: {changed_count} of {len(changed)} rows new or changed, "
+                    f"{len(changed) - changed_count} carried forward")
+
+        if changed_count == len(changed):
+            self.run_validations()
+        else:
+            result_columns = [col for col in stored.columns if col not in (record_id, FINGERPRINT_COLUMN)]
+            carried = stored.iloc[stored_positions[~changed]][result_columns].set_axis(np.flatnonzero(~changed))
+            parts = [carried]
+
+            if changed_count:
+                # Validate the new and changed rows on their own, then merge them back in row order
+                self.source_data = full_data[changed].copy()
+                self.run_validations()
+                parts.append(self.source_data[result_columns].set_axis(np.flatnonzero(changed)))
+
+            results = pd.concat(parts).sort_index()
+            self.source_data = full_data
+            for col in result_columns:
+                self.source_data[col] = results[col].to_numpy()
+
+        result_columns = [col for col in self.source_data.columns
+                          if col.startswith('Valid_') or col in ('Compliance', 'DNC_Validated')]
+        rows = self.source_data[[record_id] + result_columns].copy()
+        rows.insert(1, FINGERPRINT_COLUMN, fingerprints)
+        # The status columns hold a handful of values, which store far faster as categories;
+        # without validations configured only Compliance exists
+        status_columns = [col for col in ('Compliance', 'DNC_Validated') if col in rows.columns]
+        rows[status_columns] = rows[status_columns].astype('category')
+        self.incremental_store.save(analytic_id, context, rows)
+
     def generate_summary(self) -> pd.DataFrame:
         """Generate summary statistics by group"""
         if self.source_data is None or 'Compliance' not in self.source_data:
@@ -225,7 +574,8 @@ class DataProcessor:
             return None
 
         # Count records by group and compliance status
-        summary = self.source_data.groupby([group_by_field, 'Compliance']).size().unstack(fill_value=0)
+        # observed=True keeps categorical group values that have no rows out of the summary
+        summary = self.source_data.groupby([group_by_field, 'Compliance'], observed=True).size().unstack(fill_value=0)
 
         # Ensure all compliance categories exist
         for category in ['GC', 'PC', 'DNC']:
@@ -249,35 +599,128 @@ class DataProcessor:
 
         return summary
 
+    def _validation_context(self, hashes: FileHashManifest) -> Dict:
+        """
+        Describe how rows are validated: source settings, rules, reference data and rule code
+
+        Args:
+            hashes: File hash manifest used for the reference and code files
+
+        Raises:
+            OSError: If a reference or code file cannot be hashed
+        """
+        reference_files = [dict(ref_file_info, content_hash=hashes.file_hash(ref_file_info['path']))
+                           for ref_file_info in self.config.get('reference_files') or []]
+        # Changes to the rule implementations invalidate validation results as well
+        code_files = [inspect.getfile(ValidationRules), inspect.getfile(PreparedColumns),
+                      inspect.getfile(source_readers), __file__]
+
+        return {
+            'source': self._source_cache_config(self._build_read_plan()),
+            'reference_files': reference_files,
+            'validations': self.config['validations'],
+            'code_hashes': [hashes.file_hash(path) for path in code_files]
+        }
+
+    def _active_stage_cache(self) -> Optional[StageCache]:
+        """
+        Get the stage cache if this analytic uses it, creating the default one on first use
+
+        The analytic's 'execution.stage_cache' setting overrides the processor-wide default.
+        """
+        execution = self.config.get('execution', {})
+        if not execution.get('stage_cache', self.use_stage_cache):
+            return None
+        if self.stage_cache is None:
+            self.stage_cache = StageCache()
+        return self.stage_cache
+
+    def _stage_inputs(self, source_file: str, stage_cache: StageCache) -> Tuple[Optional[Dict], Optional[Dict]]:
+        """
+        Describe everything the validation and summary stage outputs depend on
+
+        Args:
+            source_file: Path to source data file
+            stage_cache: Cache whose file hash manifest is used
+
+        Returns:
+            Tuple of (validation stage inputs, summary stage inputs), or (None, None)
+            if an input file cannot be hashed
+        """
+        try:
+            validation_inputs = dict(self._validation_context(stage_cache.hashes),
+                                     source_hash=stage_cache.hashes.file_hash(source_file))
+            summary_inputs = {
+                'validations': validation_inputs,
+                'group_by': self.config['reporting']['group_by'],
+                'error_percentage': self.config['thresholds']['error_percentage']
+            }
+            return validation_inputs, summary_inputs
+
+        except Exception as e:
+            logger.warning(f"Stage cache disabled for this run: {e}")
+            return None, None
+
     def process_data(self, source_file: str) -> Tuple[bool, str]:
         """
         Process data file according to configuration
 
+        With the stage cache enabled, the validated detail and the summary are reused
+        from an earlier run whose inputs hash the same; a threshold-only change then
+        recomputes only the summary.
+
         Args:
             source_file: Path to source data file
 
         Returns:
             Tuple of (success, message)
         """
-        # Step 1: Load source data
-        if not self.load_source_data(source_file):
-            return False, "Failed to load source data"
-
-        # Step 2: Load reference data if needed
-        if not self.load_reference_data():
-            return False, "Failed to load reference data"
+        stage_cache = self._active_stage_cache()
+        validation_inputs, summary_inputs = (self._stage_inputs(source_file, stage_cache) if stage_cache is not None
+                                             else (None, None))
+
+        validated = stage_cache.get_stage('validations', validation_inputs) if validation_inputs else None
+        if validated is not None:
+            self.source_data = validated
+            logger.info(f"Skipped load, reference and validation stages: reused validated detail "
+                        f"with {len(validated)} rows")
+        else:
+            # Step 1: Load source data
+            if not self.load_source_data(source_file):
+                return False, "Failed to load source data"
+
+            # Step 2: Load reference data if needed
+            if not self.load_reference_data():
+                return False, "Failed to load reference data"
+
+            # Step 3: Run validations, only on new or changed rows in incremental mode
+            record_id = self._incremental_record_id()
+            if record_id:
+                self.run_incremental_validations(record_id)
+            else:
+                self.run_validations()
 
-        # Step 3: Run validations
-        self.run_validations()
+            if validation_inputs:
+                stage_cache.put_stage('validations', validation_inputs, self.source_data)
 
         # Step 4: Generate summary
-        summary = self.generate_summary()
+        summary = stage_cache.get_stage('summary', summary_inputs) if summary_inputs else None
         if summary is None:
-            return False, "Failed to generate summary"
+            summary = self.generate_summary()
+            if summary is None:
+                return False, "Failed to generate summary"
+
+            if summary_inputs:
+                stage_cache.put_stage('summary', summary_inputs, summary)
 
         self.results = {
             'detail': self.source_data,
             'summary': summary
         }
 
+        # Keep the run in the results history for trend queries
+        if self.results_store is not None:
+            self.results['run_id'] = self.results_store.record_run(self.config, self.results, source_file,
+                                                                   include_detail=self.record_detail)
+
         return True, "Processing complete"
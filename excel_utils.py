@@ -0,0 +1,481 @@
+import datetime
+import weakref
+from copy import copy
+import numpy as np
+import pandas as pd
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Engines reports can be written with. 'xlsxwriter' streams rows to disk in constant_memory
+# mode, so cells must be written top to bottom and cannot be restyled once written.
+EXCEL_ENGINES = ('openpyxl', 'xlsxwriter')
+DEFAULT_EXCEL_ENGINE = 'openpyxl'
+
+# Number formats and header style pandas uses when writing frames
+DATETIME_FORMAT = 'YYYY-MM-DD HH:MM:SS'
+DATE_FORMAT = 'YYYY-MM-DD'
+HEADER_STYLE = {'bold': True, 'border': True, 'align': 'center', 'valign': 'top'}
+
+# Column widths are the longest text in the column plus padding, capped
+MAX_COLUMN_WIDTH = 50
+COLUMN_WIDTH_PADDING = 2
+
+# Columns longer than this are measured on an evenly spaced sample of rows
+WIDTH_SAMPLE_ROWS = 20000
+
+# Display length of a datetime cell ('YYYY-MM-DD HH:MM:SS')
+DATETIME_TEXT_WIDTH = 19
+
+
+class FlushedRowError(ValueError):
+    """Raised when writing to a row an XlsxWriter constant_memory sheet already wrote to disk"""
+
+
+def column_text_widths(df: pd.DataFrame) -> List[int]:
+    """
+    Measure the longest text per column of a DataFrame, header included
+
+    Args:
+        df: DataFrame as it will be written to the sheet
+
+    Returns:
+        List of widths in characters, one per column
+    """
+    step = max(1, len(df) // WIDTH_SAMPLE_ROWS)
+    widths = []
+    for position, col in enumerate(df.columns):
+        values = df.iloc[::step, position]
+        widths.append(max(len(str(col)), _longest_text(values)))
+    return widths
+
+
+def _longest_text(values: pd.Series) -> int:
+    """Length of the longest non-missing value of a column when shown as text"""
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        # Measure each category in use once instead of every row
+        codes = values.cat.codes.to_numpy()
+        used = np.unique(codes[codes >= 0])
+        if not len(used):
+            return 0
+        return int(values.cat.categories.astype(str).str.len().to_numpy()[used].max())
+
+    values = values.dropna()
+    if values.empty:
+        return 0
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return DATETIME_TEXT_WIDTH
+    return int(values.astype(str).str.len().max())
+
+
+def set_column_widths(worksheet, widths: Sequence[int], padding: int = COLUMN_WIDTH_PADDING) -> None:
+    """
+    Apply text widths to a worksheet's columns, starting at column A
+
+    Args:
+        worksheet: openpyxl or XlsxWriter worksheet
+        widths: Text widths in characters
+        padding: Characters added to each width before capping it
+    """
+    for idx, width in enumerate(widths, 1):
+        width = min(width + padding, MAX_COLUMN_WIDTH)
+        if hasattr(worksheet, 'set_column'):
+            # XlsxWriter worksheet
+            worksheet.set_column(idx - 1, idx - 1, width)
+        else:
+            from openpyxl.utils import get_column_letter
+            worksheet.column_dimensions[get_column_letter(idx)].width = width
+
+
+def fit_column_widths(worksheet, frames: Iterable[pd.DataFrame], texts: Iterable[str] = ()) -> None:
+    """
+    Size a worksheet's columns from the DataFrames written to it, without reading its cells
+
+    Args:
+        worksheet: openpyxl or XlsxWriter worksheet
+        frames: DataFrames written to the sheet starting at column A (without index)
+        texts: Extra text written into column A, such as titles and notes
+    """
+    widths: List[int] = []
+    for frame in frames:
+        for idx, width in enumerate(column_text_widths(frame)):
+            if idx < len(widths):
+                widths[idx] = max(widths[idx], width)
+            else:
+                widths.append(width)
+
+    text_width = max((len(str(text)) for text in texts), default=0)
+    if text_width:
+        if widths:
+            widths[0] = max(widths[0], text_width)
+        else:
+            widths.append(text_width)
+
+    set_column_widths(worksheet, widths)
+
+
+def resolve_excel_engine(engine: Optional[str]) -> str:
+    """
+    Validate a configured Excel engine name
+
+    Raises:
+        ValueError: If the engine is not supported
+    """
+    engine = str(engine or DEFAULT_EXCEL_ENGINE).lower()
+    if engine not in EXCEL_ENGINES:
+        raise ValueError(f"Unsupported Excel engine '{engine}' (supported: {', '.join(EXCEL_ENGINES)})")
+    return engine
+
+
+def excel_writer(output_path: str, engine: Optional[str] = None) -> pd.ExcelWriter:
+    """
+    Open an Excel writer for a report
+
+    Args:
+        output_path: Path of the workbook to write
+        engine: 'openpyxl' (default) or 'xlsxwriter' for constant-memory streaming
+
+    Returns:
+        pandas ExcelWriter; use write_frame and write_cell to fill it so either engine works
+    """
+    engine = resolve_excel_engine(engine)
+    if engine == 'xlsxwriter':
+        # URLs stay plain text, as they are with openpyxl
+        return pd.ExcelWriter(output_path, engine='xlsxwriter', engine_kwargs={
+            'options': {'constant_memory': True, 'strings_to_urls': False}
+        })
+    return pd.ExcelWriter(output_path, engine='openpyxl')
+
+
+def is_streaming(writer: pd.ExcelWriter) -> bool:
+    """Check whether a writer streams rows (XlsxWriter) rather than holding cells in memory"""
+    return writer.engine == 'xlsxwriter'
+
+
+def get_worksheet(writer: pd.ExcelWriter, sheet_name: str):
+    """Get a worksheet of the writer's workbook, creating it if needed"""
+    if sheet_name in writer.sheets:
+        return writer.sheets[sheet_name]
+    if is_streaming(writer):
+        return writer.book.add_worksheet(sheet_name)
+    return writer.book.create_sheet(sheet_name)
+
+
+def restart_sheet(writer: pd.ExcelWriter, sheet_name: str, replacement_name: str) -> str:
+    """
+    Discard a partly written sheet so it can be written again from the top
+
+    openpyxl sheets are recreated in place. Rows XlsxWriter streamed to disk cannot be taken
+    back, so the partial sheet is hidden and a new sheet is shown in its place.
+
+    Args:
+        writer: Writer from excel_writer
+        sheet_name: Sheet that may hold partial output
+        replacement_name: Name of the new sheet when the partial one cannot be discarded
+
+    Returns:
+        Name of the empty sheet to write to
+    """
+    if sheet_name not in writer.sheets:
+        return sheet_name
+
+    if not is_streaming(writer):
+        index = writer.book.sheetnames.index(sheet_name)
+        writer.book.remove(writer.book[sheet_name])
+        writer.book.create_sheet(sheet_name, index)
+        return sheet_name
+
+    partial = writer.sheets[sheet_name]
+    replacement = get_worksheet(writer, replacement_name)
+    # A hidden sheet cannot be the active one
+    replacement.activate()
+    partial.hide()
+    return replacement_name
+
+
+def _check_row_open(worksheet, sheet_name: str, row: int) -> None:
+    """
+    Check that a zero-based row can still be written
+
+    Raises:
+        FlushedRowError: If a constant_memory sheet already wrote the row to disk, where
+            XlsxWriter would drop the write silently
+    """
+    if getattr(worksheet, 'constant_memory', False) and row < worksheet.previous_row:
+        raise FlushedRowError(f"Row {row + 1} of sheet '{sheet_name}' was already written to disk; "
+                              f"streamed sheets must be written top to bottom")
+
+
+def write_frame(writer: pd.ExcelWriter, df: pd.DataFrame, sheet_name: str, startrow: int = 0,
+                header_style: Optional[Dict] = None, body_style: Optional[Dict] = None):
+    """
+    Write a DataFrame without its index, starting at column A
+
+    With openpyxl this is DataFrame.to_excel. With XlsxWriter the frame is written row by
+    row, because pandas writes column by column, which constant_memory mode cannot take.
+    Values, number formats and the header style match to_excel either way.
+
+    Args:
+        writer: Writer from excel_writer
+        df: DataFrame to write
+        sheet_name: Target sheet, created if needed
+        startrow: Zero-based row of the header
+        header_style: Optional style replacing the default header style (see write_cell)
+        body_style: Optional style for every data cell
+
+    Returns:
+        The worksheet written to
+    """
+    if not is_streaming(writer):
+        df.to_excel(writer, sheet_name=sheet_name, startrow=startrow, index=False)
+        worksheet = writer.sheets[sheet_name]
+        if header_style is not None:
+            _style_openpyxl_range(worksheet, startrow + 1, startrow + 1, len(df.columns), header_style)
+        if body_style is not None and len(df):
+            _style_openpyxl_range(worksheet, startrow + 2, startrow + len(df) + 1, len(df.columns), body_style)
+        return worksheet
+
+    worksheet = get_worksheet(writer, sheet_name)
+    _check_row_open(worksheet, sheet_name, startrow)
+    header_format = _xlsxwriter_format(writer, header_style if header_style is not None else HEADER_STYLE)
+    for col, name in enumerate(df.columns):
+        worksheet.write(startrow, col, name, header_format)
+
+    body_style = body_style or {}
+    body_format = _xlsxwriter_format(writer, body_style) if body_style else None
+    datetime_format = _xlsxwriter_format(writer, dict(body_style, num_format=DATETIME_FORMAT))
+    date_format = _xlsxwriter_format(writer, dict(body_style, num_format=DATE_FORMAT))
+
+    columns = [_column_values(df.iloc[:, position]) for position in range(len(df.columns))]
+    write = worksheet.write
+    for row, values in enumerate(zip(*columns), startrow + 1):
+        for col, value in enumerate(values):
+            if value is None:
+                if body_format is not None:
+                    worksheet.write_blank(row, col, None, body_format)
+            elif isinstance(value, datetime.datetime):
+                write(row, col, value, datetime_format)
+            elif isinstance(value, datetime.date):
+                write(row, col, value, date_format)
+            else:
+                write(row, col, value, body_format)
+    return worksheet
+
+
+def _column_values(values: pd.Series) -> List:
+    """Column values as Python objects, with None for missing values and text for infinities"""
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        values = values.astype(object)
+    if pd.api.types.is_float_dtype(values):
+        values = values.replace([np.inf, -np.inf], ['inf', '-inf'])
+    return values.astype(object).where(values.notna(), None).tolist()
+
+
+def write_cell(writer: pd.ExcelWriter, sheet_name: str, row: int, column: int, value,
+               style: Optional[Dict] = None) -> None:
+    """
+    Write a single cell
+
+    Style keys: bold, italic, size, color (font, hex RGB), fill (hex RGB), border (thin on all
+    sides), align and valign ('center', 'left', ...). With XlsxWriter, rows must be written in
+    order; writing above a row already written raises FlushedRowError.
+
+    Args:
+        writer: Writer from excel_writer
+        sheet_name: Target sheet, created if needed
+        row: One-based row
+        column: One-based column
+        value: Cell value
+        style: Optional style
+    """
+    worksheet = get_worksheet(writer, sheet_name)
+    if is_streaming(writer):
+        _check_row_open(worksheet, sheet_name, row - 1)
+        worksheet.write(row - 1, column - 1, value, _xlsxwriter_format(writer, style) if style else None)
+        return
+
+    cell = worksheet.cell(row=row, column=column)
+    cell.value = value
+    if style:
+        for attribute, style_value in _openpyxl_style(style).items():
+            setattr(cell, attribute, style_value)
+
+
+def merge_cells(writer: pd.ExcelWriter, sheet_name: str, row: int, first_column: int, last_column: int,
+                value, style: Optional[Dict] = None) -> None:
+    """
+    Write a value into merged cells spanning columns of one row (one-based)
+
+    Args:
+        writer: Writer from excel_writer
+        sheet_name: Target sheet, created if needed
+        row: One-based row
+        first_column: One-based first column
+        last_column: One-based last column
+        value: Cell value
+        style: Optional style, see write_cell
+    """
+    worksheet = get_worksheet(writer, sheet_name)
+    if is_streaming(writer):
+        _check_row_open(worksheet, sheet_name, row - 1)
+        worksheet.merge_range(row - 1, first_column - 1, row - 1, last_column - 1, value,
+                              _xlsxwriter_format(writer, style or {}))
+        return
+
+    write_cell(writer, sheet_name, row, first_column, value, style)
+    worksheet.merge_cells(start_row=row, start_column=first_column, end_row=row, end_column=last_column)
+
+
+def add_color_scale(writer: pd.ExcelWriter, sheet_name: str, cell_range: str,
+                    points: Sequence) -> None:
+    """
+    Add a three-colour scale to a range
+
+    Args:
+        writer: Writer from excel_writer
+        sheet_name: Target sheet
+        cell_range: Range in A1 notation, e.g. "B4:C10"
+        points: Three (value, hex RGB colour) pairs for the minimum, midpoint and maximum
+    """
+    (start_value, start_color), (mid_value, mid_color), (end_value, end_color) = points
+    worksheet = get_worksheet(writer, sheet_name)
+    if is_streaming(writer):
+        worksheet.conditional_format(cell_range, {
+            'type': '3_color_scale',
+            'min_type': 'num', 'min_value': start_value, 'min_color': f'#{start_color}',
+            'mid_type': 'num', 'mid_value': mid_value, 'mid_color': f'#{mid_color}',
+            'max_type': 'num', 'max_value': end_value, 'max_color': f'#{end_color}'
+        })
+        return
+
+    from openpyxl.formatting.rule import ColorScaleRule
+    worksheet.conditional_formatting.add(cell_range, ColorScaleRule(
+        start_type='num', start_value=start_value, start_color=start_color,
+        mid_type='num', mid_value=mid_value, mid_color=mid_color,
+        end_type='num', end_value=end_value, end_color=end_color
+    ))
+
+
+# Comparison operators for fill rules, as Excel names them
+CELL_RULE_OPERATORS = {
+    '<': 'lessThan', '<=': 'lessThanOrEqual', '>': 'greaterThan', '>=': 'greaterThanOrEqual',
+    '==': 'equal', '!=': 'notEqual'
+}
+
+
+def add_fill_rules(writer: pd.ExcelWriter, sheet_name: str, cell_range: str,
+                   rules: Sequence[Tuple[str, object, str]], skip_blanks: bool = True) -> None:
+    """
+    Fill cells of a range by value with conditional formatting rules
+
+    Rules are checked in order and the first match fills the cell, so bands can be given as
+    a sequence of upper bounds. Nothing is stored per cell.
+
+    Args:
+        writer: Writer from excel_writer
+        sheet_name: Target sheet
+        cell_range: Range in A1 notation, e.g. "D5:D40"
+        rules: (operator, value, hex RGB fill) triples; operators are <, <=, >, >=, == and !=
+        skip_blanks: Leave empty cells unfilled instead of comparing them as zero
+    """
+    worksheet = get_worksheet(writer, sheet_name)
+    if is_streaming(writer):
+        if skip_blanks:
+            worksheet.conditional_format(cell_range, {'type': 'blanks', 'stop_if_true': True})
+        for operator, value, fill in rules:
+            worksheet.conditional_format(cell_range, {
+                'type': 'cell', 'criteria': operator, 'value': _rule_value(value),
+                'format': _xlsxwriter_format(writer, {'fill': fill}), 'stop_if_true': True
+            })
+        return
+
+    from openpyxl.formatting.rule import CellIsRule, Rule
+    from openpyxl.styles import PatternFill
+
+    if skip_blanks:
+        first_cell = cell_range.split(':')[0]
+        worksheet.conditional_formatting.add(cell_range, Rule(
+            type='containsBlanks', stopIfTrue=True, formula=[f'LEN(TRIM({first_cell}))=0']))
+    for operator, value, fill in rules:
+        worksheet.conditional_formatting.add(cell_range, CellIsRule(
+            operator=CELL_RULE_OPERATORS[operator], formula=[_rule_value(value)], stopIfTrue=True,
+            fill=PatternFill(start_color=fill, end_color=fill, fill_type='solid')))
+
+
+def _rule_value(value) -> str:
+    """Formula text for a rule value; strings are quoted"""
+    return f'"{value}"' if isinstance(value, str) else str(value)
+
+
+def _style_key(style: Dict):
+    """Hashable key for a style dictionary"""
+    return tuple(sorted(style.items()))
+
+
+# Style objects are shared between cells; XlsxWriter formats belong to one workbook
+_OPENPYXL_STYLES: Dict = {}
+_XLSXWRITER_FORMATS = weakref.WeakKeyDictionary()
+
+
+def _openpyxl_style(style: Dict) -> Dict:
+    """Convert a style dictionary into openpyxl cell attributes"""
+    key = _style_key(style)
+    if key not in _OPENPYXL_STYLES:
+        from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
+
+        attributes = {}
+        if any(name in style for name in ('bold', 'italic', 'size', 'color')):
+            attributes['font'] = Font(bold=style.get('bold', False), italic=style.get('italic', False),
+                                      size=style.get('size'), color=style.get('color'))
+        if 'fill' in style:
+            attributes['fill'] = PatternFill(start_color=style['fill'], end_color=style['fill'],
+                                             fill_type='solid')
+        if style.get('border'):
+            side = Side(style='thin')
+            attributes['border'] = Border(left=side, right=side, top=side, bottom=side)
+        if 'align' in style or 'valign' in style:
+            attributes['alignment'] = Alignment(horizontal=style.get('align'), vertical=style.get('valign'))
+        _OPENPYXL_STYLES[key] = attributes
+    return _OPENPYXL_STYLES[key]
+
+
+def _style_openpyxl_range(worksheet, first_row: int, last_row: int, last_column: int, style: Dict) -> None:
+    """Apply a style to every cell of a block starting at column A (one-based rows)"""
+    attributes = _openpyxl_style(style)
+
+    # Cells sharing a starting style end up with the same style, so each combination is
+    # resolved against the workbook once and copied to the other cells
+    resolved = {}
+    for row in worksheet.iter_rows(min_row=first_row, max_row=last_row, min_col=1, max_col=last_column):
+        for cell in row:
+            key = tuple(cell._style or ())
+            if key in resolved:
+                cell._style = copy(resolved[key])
+                continue
+            for attribute, style_value in attributes.items():
+                setattr(cell, attribute, style_value)
+            resolved[key] = copy(cell._style)
+
+
+def _xlsxwriter_format(writer: pd.ExcelWriter, style: Dict):
+    """Get the XlsxWriter format for a style dictionary, created once per workbook"""
+    formats = _XLSXWRITER_FORMATS.setdefault(writer.book, {})
+    key = _style_key(style)
+    if key not in formats:
+        properties = {}
+        for name in ('bold', 'italic', 'num_format'):
+            if name in style:
+                properties[name] = style[name]
+        if 'size' in style:
+            properties['font_size'] = style['size']
+        if 'color' in style:
+            properties['font_color'] = f"#{style['color']}"
+        if 'fill' in style:
+            properties.update(pattern=1, bg_color=f"#{style['fill']}")
+        if style.get('border'):
+            properties['border'] = 1
+        if 'align' in style:
+            properties['align'] = style['align']
+        if 'valign' in style:
+            valign = style['valign']
+            properties['valign'] = 'vcenter' if valign == 'center' else valign
+        formats[key] = writer.book.add_format(properties)
+    return formats[key]
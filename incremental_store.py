@@ -0,0 +1,100 @@
+import os
+import json
+import hashlib
+import pandas as pd
+from typing import Dict, Optional
+from source_cache import ENTRY_SUFFIX, FileHashManifest, read_frame, write_frame
+from logging_config import get_logger
+
+logger = get_logger()
+
+DEFAULT_INCREMENTAL_DIR = os.path.join(".qa_cache", "incremental")
+
+# Column holding each stored row's content fingerprint
+FINGERPRINT_COLUMN = "_Row_Fingerprint"
+
+# Key of the stored rows' attrs, kept in the Parquet metadata, holding the validation context hash
+CONTEXT_HASH_ATTR = "context_hash"
+
+
+class IncrementalStore:
+    """Per-analytic store of the last run's validation results, keyed by record ID"""
+
+    def __init__(self, cache_dir: str = DEFAULT_INCREMENTAL_DIR):
+        """
+        Initialize incremental store
+
+        Args:
+            cache_dir: Directory holding the stored results and the file hash manifest
+        """
+        self.cache_dir = cache_dir
+        self.hashes = FileHashManifest(cache_dir)
+
+    def load(self, analytic_id, context: Dict) -> Optional[pd.DataFrame]:
+        """
+        Get the rows stored by the analytic's last run, if they were validated the same way
+
+        Args:
+            analytic_id: Analytic ID
+            context: JSON-serializable description of the validation rules, reference data
+                and code the results depend on
+
+        Returns:
+            DataFrame with the record ID, FINGERPRINT_COLUMN and result columns, or None
+            if nothing usable is stored
+        """
+        try:
+            state_path = self._state_path(analytic_id)
+            if not os.path.exists(state_path):
+                logger.info(f"No stored results for QA-ID {analytic_id}; validating all rows")
+                return None
+
+            rows = read_frame(state_path)
+            if rows.attrs.get(CONTEXT_HASH_ATTR) != self._context_hash(context):
+                logger.info(f"Validation rules or reference data changed for QA-ID {analytic_id}; "
+                            f"validating all rows")
+                return None
+
+            rows.attrs = {}
+            return rows
+
+        except Exception as e:
+            logger.warning(f"Error reading stored results for QA-ID {analytic_id}: {e}")
+            return None
+
+    def save(self, analytic_id, context: Dict, rows: pd.DataFrame) -> None:
+        """
+        Replace the analytic's stored rows with this run's
+
+        Args:
+            analytic_id: Analytic ID
+            context: The same context description used for load
+            rows: Record IDs, fingerprints and result columns of every row in this run
+        """
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # The hash travels in the same file as the rows, so both are replaced together
+            stored = rows.copy(deep=False)
+            stored.attrs = {CONTEXT_HASH_ATTR: self._context_hash(context)}
+            write_frame(stored, self._state_path(analytic_id))
+
+        except Exception as e:
+            logger.warning(f"Error storing results for QA-ID {analytic_id}: {e}")
+
+    def clear(self) -> None:
+        """Remove every analytic's stored results and the file hash manifest"""
+        if os.path.isdir(self.cache_dir):
+            for filename in os.listdir(self.cache_dir):
+                if filename.startswith("qa_") and filename.endswith(ENTRY_SUFFIX):
+                    os.remove(os.path.join(self.cache_dir, filename))
+        self.hashes.clear()
+
+    def _state_path(self, analytic_id) -> str:
+        """Path of the analytic's stored results"""
+        return os.path.join(self.cache_dir, f"qa_{analytic_id}{ENTRY_SUFFIX}")
+
+    @staticmethod
+    def _context_hash(context: Dict) -> str:
+        """Hash of the validation context, with the pandas version the rows were stored with"""
+        key_data = json.dumps({'context': context, 'pandas': pd.__version__}, sort_keys=True, default=str)
+        return hashlib.sha256(key_data.encode('utf-8')).hexdigest()
@@ -1,14 +1,28 @@
 # logging_config.py
 import logging
 
+LOGGER_NAME = "qa_analytics"
+
+
 def setup_logging():
-    """Configure logging for the application"""
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler("qa_analytics.log"),
-            logging.StreamHandler()
-        ]
-    )
-    return logging.getLogger("qa_analytics")
\ No newline at end of file
+    """
+    Configure logging for the application
+
+    Called by entry points; the handlers are only created the first time, so
+    repeated calls return the configured logger without opening the log file again.
+    """
+    if not logging.getLogger().handlers:
+        logging.basicConfig(
+            level=logging.INFO,
+            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            handlers=[
+                logging.FileHandler("qa_analytics.log"),
+                logging.StreamHandler()
+            ]
+        )
+    return logging.getLogger(LOGGER_NAME)
+
+
+def get_logger():
+    """Get the application logger for a module without configuring logging"""
+    return logging.getLogger(LOGGER_NAME)
@@ -1,16 +1,15 @@
 import os
 import sys
+import datetime
 import logging
 import threading
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 from typing import Dict, List
 from config_manager import ConfigManager
-from data_processor import DataProcessor
-from report_generator import ReportGenerator
-from logging_config import setup_logging
+from logging_config import get_logger, setup_logging
 
-logger = setup_logging()
+logger = get_logger()
 
 class QAAnalyticsApp:
     """Main application with GUI interface"""
@@ -70,9 +69,27 @@ class QAAnalyticsApp:
         output_btn = ttk.Button(output_frame, text="Browse...", command=self._browse_output)
         output_btn.pack(side=tk.RIGHT, padx=(5, 0))
 
+        # Source cache checkbox
+        self.source_cache_var = tk.BooleanVar(value=True)
+        source_cache_check = ttk.Checkbutton(
+            main_frame,
+            text="Reuse parsed source files from earlier runs (stored under .qa_cache)",
+            variable=self.source_cache_var
+        )
+        source_cache_check.grid(row=3, column=0, columnspan=2, sticky=tk.W, pady=(5, 0))
+
+        # Stage cache checkbox
+        self.stage_cache_var = tk.BooleanVar(value=False)
+        stage_cache_check = ttk.Checkbutton(
+            main_frame,
+            text="Reuse validated results of earlier runs with unchanged inputs (stored under .qa_cache)",
+            variable=self.stage_cache_var
+        )
+        stage_cache_check.grid(row=4, column=0, columnspan=2, sticky=tk.W, pady=0)
+
         # Execution frame
         exec_frame = ttk.Frame(main_frame)
-        exec_frame.grid(row=3, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(10, 0))
+        exec_frame.grid(row=5, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(10, 0))
 
         self.progress = ttk.Progressbar(exec_frame, orient="horizontal", length=200, mode="indeterminate")
         self.progress.pack(side=tk.LEFT, expand=True, fill=tk.X, padx=(0, 5))
@@ -81,15 +98,15 @@ class QAAnalyticsApp:
         exec_btn.pack(side=tk.RIGHT)
 
         # Status log
-        ttk.Label(main_frame, text="Status Log:").grid(row=4, column=0, sticky=tk.W, pady=(10, 5))
+        ttk.Label(main_frame, text="Status Log:").grid(row=6, column=0, sticky=tk.W, pady=(10, 5))
 
         self.log_text = tk.Text(main_frame, height=15, width=80, wrap=tk.WORD)
-        self.log_text.grid(row=5, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S))
+        self.log_text.grid(row=7, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S))
         self.log_text.config(state=tk.DISABLED)
 
         # Add scrollbar to log
         log_scroll = ttk.Scrollbar(main_frame, orient="vertical", command=self.log_text.yview)
-        log_scroll.grid(row=5, column=2, sticky=(tk.N, tk.S))
+        log_scroll.grid(row=7, column=2, sticky=(tk.N, tk.S))
         self.log_text.config(yscrollcommand=log_scroll.set)
 
         # Status bar
@@ -101,7 +118,7 @@ class QAAnalyticsApp:
         self.root.columnconfigure(0, weight=1)
         self.root.rowconfigure(0, weight=1)
         main_frame.columnconfigure(1, weight=1)
-        main_frame.rowconfigure(5, weight=1)
+        main_frame.rowconfigure(7, weight=1)
 
         # Set up log handler
         self._setup_log_handler()
@@ -135,7 +152,7 @@ class QAAnalyticsApp:
     def _browse_source(self):
         """Browse for source data file"""
         filename = filedialog.askopenfilename(
-            filetypes=[("Excel Files", "*.xlsx *.xls")],
+            filetypes=[("Data Files", "*.xlsx *.xls *.csv *.parquet *.feather"), ("Excel Files", "*.xlsx *.xls")],
             title="Select Source Data File"
         )
         if filename:
@@ -172,9 +189,11 @@ class QAAnalyticsApp:
         self.status_var.set("Processing...")
 
         # Run in a separate thread to avoid freezing the UI
-        threading.Thread(target=self._process_data, args=(analytic_id,), daemon=True).start()
+        threading.Thread(target=self._process_data,
+                         args=(analytic_id, self.stage_cache_var.get(), self.source_cache_var.get()),
+                         daemon=True).start()
 
-    def _process_data(self, analytic_id):
+    def _process_data(self, analytic_id, use_stage_cache=False, use_source_cache=True):
         """Process data in a separate thread"""
         try:
             # Get configuration
@@ -185,8 +204,12 @@ class QAAnalyticsApp:
             if not os.path.exists(output_dir):
                 os.makedirs(output_dir)
 
+            # Processing modules pull in pandas and openpyxl, so they are imported on first run
+            from data_processor import DataProcessor
+            from report_generator import ReportGenerator
+
             # Initialize processor
-            processor = DataProcessor(config)
+            processor = DataProcessor(config, use_source_cache=use_source_cache, use_stage_cache=use_stage_cache)
 
             # Process data
             logger.info(f"Starting processing for QA-ID {analytic_id}")
@@ -230,6 +253,7 @@ class QAAnalyticsApp:
 
 # Application entry point
 if __name__ == "__main__":
+    setup_logging()
     root = tk.Tk()
     app = QAAnalyticsApp(root)
     root.mainloop()
\ No newline at end of file
@@ -0,0 +1,43 @@
+from collections import deque
+from concurrent.futures import Executor
+from typing import Any, Callable, Iterable, Iterator, Optional, Tuple
+
+# Tasks kept submitted per worker process, so workers never wait for the next task while
+# the arguments of only a few tasks are held in memory at a time
+IN_FLIGHT_PER_WORKER = 2
+
+
+def bounded_map(executor: Executor, func: Callable, task_args: Iterable[Tuple],
+                max_in_flight: int) -> Iterator[Tuple[Any, Optional[Exception]]]:
+    """
+    Run func over task arguments on an executor with a bounded number of pending tasks
+
+    Arguments are drawn from task_args only when a task can be submitted, so a generator
+    building large per-task slices holds at most max_in_flight of them at once, plus the
+    pickled copies on their way to the workers.
+
+    Args:
+        executor: Executor running the tasks
+        func: Function to run; must be picklable for process pools
+        task_args: Positional argument tuples, one per task; may be a lazy generator
+        max_in_flight: Maximum number of submitted tasks not yet collected
+
+    Returns:
+        Iterator of (result, error) pairs in task order; error is the exception a task
+        raised, with result None
+    """
+    pending = deque()
+    for args in task_args:
+        pending.append(executor.submit(func, *args))
+        if len(pending) >= max(1, max_in_flight):
+            yield _outcome(pending.popleft())
+    while pending:
+        yield _outcome(pending.popleft())
+
+
+def _outcome(future) -> Tuple[Any, Optional[Exception]]:
+    """Wait for a future and return its (result, error) pair"""
+    try:
+        return future.result(), None
+    except Exception as e:
+        return None, e
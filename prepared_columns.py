@@ -0,0 +1,83 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, Tuple
+from logging_config import get_logger
+
+logger = get_logger()
+
+
+class PreparedColumns:
+    """
+    Per-run cache of normalized source columns shared by validation rules
+
+    Safe to share between rules running on a thread pool: under contention a column
+    may be computed twice, but every caller sees an equivalent result.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        """
+        Initialize cache over a source DataFrame
+
+        Args:
+            df: Cleaned source DataFrame; it is never copied or modified
+        """
+        self._df = df
+        self._cache: Dict[Tuple[str, str], pd.Series] = {}
+
+    @property
+    def index(self) -> pd.Index:
+        """Index of the underlying source data"""
+        return self._df.index
+
+    @property
+    def columns(self) -> pd.Index:
+        """Columns of the underlying source data"""
+        return self._df.columns
+
+    def lowercase(self, column: str) -> pd.Series:
+        """
+        Get a column with string values lowercased for name comparisons
+
+        Categorical columns are lowercased once per category rather than once per row.
+        Other non-string columns are returned unchanged.
+
+        Args:
+            column: Name of the source column
+
+        Returns:
+            Series that callers must treat as read-only
+        """
+        key = ('lowercase', column)
+        if key not in self._cache:
+            values = self._df[column]
+            if isinstance(values.dtype, pd.CategoricalDtype):
+                # Code -1 (missing) picks the trailing NaN
+                lowered = np.append(values.cat.categories.to_series().str.lower().to_numpy(dtype=object), np.nan)
+                values = pd.Series(lowered[values.cat.codes.to_numpy()], index=values.index, name=values.name)
+            elif values.dtype == 'object':
+                values = values.str.lower()
+            self._cache[key] = values
+        return self._cache[key]
+
+    def datetime(self, column: str) -> pd.Series:
+        """
+        Get a column parsed as datetime, with unparseable values as NaT
+
+        Columns already converted during cleaning are returned as-is.
+
+        Args:
+            column: Name of the source column
+
+        Returns:
+            Series that callers must treat as read-only
+        """
+        key = ('datetime', column)
+        if key not in self._cache:
+            values = self._df[column]
+            if not pd.api.types.is_datetime64_any_dtype(values):
+                try:
+                    values = pd.to_datetime(values, errors='coerce')
+                except Exception as e:
+                    logger.error(f"Error converting {column} to datetime: {e}")
+            self._cache[key] = values
+        return self._cache[key]
@@ -0,0 +1,221 @@
+import os
+import sys
+import argparse
+import datetime
+from typing import Dict, List, Optional, Tuple
+from config_manager import ConfigManager
+from logging_config import get_logger, setup_logging
+
+logger = get_logger()
+
+# Process exit codes
+EXIT_OK = 0
+EXIT_PARTIAL = 1  # Some analytics failed; reports were generated for the rest
+EXIT_USAGE = 2  # Bad arguments, unknown QA-IDs or missing source files
+EXIT_FAILED = 3  # No analytic produced results
+
+MODES = ('consolidated', 'individual')
+
+
+def parse_source_mapping(value: str) -> Tuple[str, str]:
+    """
+    Parse a QA_ID=SOURCE_FILE argument
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not in QA_ID=SOURCE_FILE form
+    """
+    analytic_id, separator, source_file = value.partition('=')
+    if not separator or not analytic_id.strip() or not source_file.strip():
+        raise argparse.ArgumentTypeError(f"expected QA_ID=SOURCE_FILE, got '{value}'")
+    return analytic_id.strip(), source_file.strip()
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser"""
+    parser = argparse.ArgumentParser(
+        description="Run QA analytics and generate reports without the GUI",
+        epilog=(f"Exit codes: {EXIT_OK} success, {EXIT_PARTIAL} some analytics failed, "
+                f"{EXIT_USAGE} invalid arguments or inputs, {EXIT_FAILED} no analytic produced results")
+    )
+    parser.add_argument('sources', nargs='*', type=parse_source_mapping, metavar='QA_ID=SOURCE_FILE',
+                        help="Analytic to run and its source data file; repeat for several analytics")
+    parser.add_argument('-o', '--output-dir', default='output', help="Directory for generated reports")
+    parser.add_argument('-m', '--mode', choices=MODES, default='consolidated',
+                        help="Consolidated per-leader reports, or separate reports per analytic")
+    parser.add_argument('--config-dir', default='configs', help="Directory of analytic configuration files")
+    parser.add_argument('--report-workers', type=int, default=1, help="Processes writing per-leader reports")
+    parser.add_argument('--analytic-workers', type=int, default=1,
+                        help="Processes running analytics in consolidated mode")
+    parser.add_argument('--analytic-timeout', type=float, default=None,
+                        help="Seconds an analytic may run in its own process before it is stopped")
+    parser.add_argument('--excel-engine', choices=('openpyxl', 'xlsxwriter'), default=None,
+                        help="Excel writer engine for reports")
+    parser.add_argument('--delta', action='store_true',
+                        help="In consolidated mode, list only rows changed since each analytic's previous run "
+                             "in leader reports")
+    parser.add_argument('--results-db', default=None,
+                        help="In consolidated mode, SQLite run history for trends and delta reports "
+                             "(default results/qa_results.db)")
+    parser.add_argument('--no-source-cache', action='store_true',
+                        help="Parse every source file again instead of reusing frames cached under .qa_cache/source")
+    parser.add_argument('--stage-cache', action='store_true',
+                        help="Reuse validated results of earlier runs with unchanged inputs; stores each run's "
+                             "full detail under .qa_cache/stages")
+    parser.add_argument('--list', action='store_true', help="List available analytics and exit")
+    return parser
+
+
+def run_individual(analytic_ids: List[str], source_files: Dict[str, str], output_dir: str, configs: Dict[str, Dict],
+                   report_workers: int = 1, excel_engine: Optional[str] = None,
+                   use_stage_cache: bool = False, use_source_cache: bool = True) -> Tuple[int, List[str]]:
+    """
+    Run each analytic and write its main and per-group reports
+
+    Returns:
+        Tuple of (number of analytics that failed, paths of generated reports)
+    """
+    from data_processor import DataProcessor
+    from report_generator import ReportGenerator
+
+    failures = 0
+    report_paths = []
+
+    for analytic_id in analytic_ids:
+        try:
+            config = configs[analytic_id]
+            logger.info(f"Processing QA-ID {analytic_id}: {config['analytic_name']}")
+
+            processor = DataProcessor(config, use_source_cache=use_source_cache, use_stage_cache=use_stage_cache)
+            success, message = processor.process_data(source_files[analytic_id])
+            if not success:
+                logger.error(f"Failed to process QA-ID {analytic_id}: {message}")
+                failures += 1
+                continue
+
+            report_generator = ReportGenerator(config, processor.results, output_dir=output_dir,
+                                               report_workers=report_workers, excel_engine=excel_engine)
+
+            main_report_path = os.path.join(
+                output_dir,
+                f"QA_{analytic_id}_Main_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
+            )
+            main_report = report_generator.generate_main_report(main_report_path, source_files[analytic_id])
+            if not main_report:
+                failures += 1
+                continue
+
+            report_paths.append(main_report)
+            report_paths.extend(report_generator.generate_individual_reports())
+            logger.info(f"Generated reports for QA-ID {analytic_id}")
+
+        except Exception as e:
+            logger.error(f"Error processing QA-ID {analytic_id}: {e}")
+            failures += 1
+
+    return failures, report_paths
+
+
+def run_consolidated(analytic_ids: List[str], source_files: Dict[str, str], output_dir: str,
+                     config_manager: ConfigManager, report_workers: int = 1, analytic_workers: int = 1,
+                     analytic_timeout: Optional[float] = None,
+                     excel_engine: Optional[str] = None, delta_reports: bool = False,
+                     use_stage_cache: bool = False, results_db: Optional[str] = None,
+                     use_source_cache: bool = True) -> Tuple[int, List[str]]:
+    """
+    Run all analytics and write the department and per-leader consolidated reports
+
+    Returns:
+        Tuple of (number of analytics that failed, paths of generated reports)
+    """
+    from consolidated_report_generator import ConsolidatedReportGenerator
+    from results_store import ResultsStore
+
+    results_store = ResultsStore(results_db) if results_db else None
+    generator = ConsolidatedReportGenerator(output_dir=output_dir, report_workers=report_workers,
+                                            excel_engine=excel_engine, analytic_workers=analytic_workers,
+                                            analytic_timeout=analytic_timeout, config_manager=config_manager,
+                                            delta_reports=delta_reports, use_stage_cache=use_stage_cache,
+                                            use_source_cache=use_source_cache, results_store=results_store)
+
+    results_by_analytic = generator.run_analytics(analytic_ids, source_files)
+    failures = len(analytic_ids) - len(results_by_analytic)
+    if not results_by_analytic:
+        return failures, []
+
+    reports_by_leader = generator.generate_consolidated_reports(results_by_analytic)
+    return failures, list(reports_by_leader.values())
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the command-line interface
+
+    Args:
+        argv: Arguments, excluding the program name; defaults to sys.argv[1:]
+
+    Returns:
+        Process exit code
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    setup_logging()
+
+    config_manager = ConfigManager(args.config_dir)
+
+    if args.list:
+        for analytic_id, analytic_name in config_manager.get_available_analytics():
+            print(f"{analytic_id}\t{analytic_name}")
+        return EXIT_OK
+
+    if not args.sources:
+        parser.print_usage(sys.stderr)
+        print("error: at least one QA_ID=SOURCE_FILE is required", file=sys.stderr)
+        return EXIT_USAGE
+
+    # Check every input before any analytic runs
+    source_files = dict(args.sources)
+    analytic_ids = list(source_files)
+    configs = {}
+    for analytic_id, source_file in source_files.items():
+        if analytic_id not in config_manager.index:
+            logger.error(f"No configuration found for QA-ID {analytic_id}")
+            return EXIT_USAGE
+        if not os.path.exists(source_file):
+            logger.error(f"Source file for QA-ID {analytic_id} does not exist: {source_file}")
+            return EXIT_USAGE
+        configs[analytic_id] = config_manager.get_config(analytic_id)
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    logger.info(f"Starting {args.mode} run for {len(analytic_ids)} analytics: {', '.join(analytic_ids)}")
+
+    try:
+        if args.mode == 'individual':
+            failures, report_paths = run_individual(analytic_ids, source_files, args.output_dir, configs,
+                                                    report_workers=args.report_workers,
+                                                    excel_engine=args.excel_engine,
+                                                    use_stage_cache=args.stage_cache,
+                                                    use_source_cache=not args.no_source_cache)
+        else:
+            failures, report_paths = run_consolidated(analytic_ids, source_files, args.output_dir, config_manager,
+                                                      report_workers=args.report_workers,
+                                                      analytic_workers=args.analytic_workers,
+                                                      analytic_timeout=args.analytic_timeout,
+                                                      excel_engine=args.excel_engine, delta_reports=args.delta,
+                                                      use_stage_cache=args.stage_cache,
+                                                      results_db=args.results_db,
+                                                      use_source_cache=not args.no_source_cache)
+    except Exception as e:
+        logger.error(f"Error in processing: {e}")
+        return EXIT_FAILED
+
+    for path in report_paths:
+        logger.info(f"  {path}")
+    logger.info(f"Generated {len(report_paths)} reports; {failures} of {len(analytic_ids)} analytics failed")
+
+    if failures == len(analytic_ids) or not report_paths:
+        return EXIT_FAILED
+    return EXIT_PARTIAL if failures else EXIT_OK
+
+
+if __name__ == "__main__":
+    sys.exit(main())
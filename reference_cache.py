@@ -0,0 +1,99 @@
+import os
+import threading
+import numpy as np
+import pandas as pd
+from collections import OrderedDict
+from logging_config import get_logger
+
+logger = get_logger()
+
+
+class ReferenceCache:
+    """In-memory cache of reference lookups shared by every analytic run in the process"""
+
+    def __init__(self, max_entries: int = 16, max_bytes: int = 512 * 1024 ** 2):
+        """
+        Initialize reference cache
+
+        Args:
+            max_entries: Maximum number of cached lookups kept
+            max_bytes: Maximum estimated memory held by cached lookups
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, file_path: str, key_column: str, value_column: str) -> pd.Series:
+        """
+        Get the key -> value lookup for a reference file, loading it on a miss
+
+        Args:
+            file_path: Path to the reference Excel file
+            key_column: Column holding the lookup keys
+            value_column: Column holding the looked-up values
+
+        Returns:
+            Read-only Series of values indexed by unique, non-null key; when a key
+            repeats, the last row wins
+        """
+        abs_path = os.path.abspath(file_path)
+        stat = os.stat(abs_path)
+        key = (abs_path, stat.st_mtime_ns, stat.st_size, key_column, value_column)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                # Move the entry to the end so eviction drops least recently used lookups first
+                self._entries.move_to_end(key)
+                self.hits += 1
+                logger.info(f"Reference cache hit for {file_path} ({self.hits} hits, {self.misses} misses)")
+                return entry[0]
+
+        lookup = self._load(abs_path, key_column, value_column)
+
+        with self._lock:
+            self.misses += 1
+            logger.info(f"Reference cache miss for {file_path} ({self.hits} hits, {self.misses} misses)")
+
+            # Drop lookups built from an older version of the same file and columns
+            for stale_key in [k for k in self._entries if k[0] == abs_path and k[3:] == key[3:]]:
+                del self._entries[stale_key]
+
+            self._entries[key] = (lookup, lookup.memory_usage(index=True, deep=True))
+            self._evict()
+
+        return lookup
+
+    def clear(self) -> None:
+        """Remove all cached lookups and reset the hit/miss counts"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def _load(self, abs_path: str, key_column: str, value_column: str) -> pd.Series:
+        """Read a reference file and index its values by key"""
+        ref_df = pd.read_excel(abs_path, usecols=[key_column, value_column])
+
+        lookup = pd.Series(ref_df[value_column].to_numpy(dtype=object), index=ref_df[key_column].astype(object))
+        lookup = lookup[lookup.index.notna() & ~lookup.index.duplicated(keep='last')]
+
+        # Shared between analytics, so the values must not be modified in place
+        values = np.array(lookup.to_numpy(dtype=object))
+        values.flags.writeable = False
+        return pd.Series(values, index=lookup.index, name=value_column, copy=False)
+
+    def _evict(self) -> None:
+        """Remove least recently used lookups beyond the entry and memory limits"""
+        total_bytes = sum(size for _, size in self._entries.values())
+        while len(self._entries) > 1 and (len(self._entries) > self.max_entries or total_bytes > self.max_bytes):
+            evicted_key, (_, size) = self._entries.popitem(last=False)
+            total_bytes -= size
+            logger.info(f"Evicted reference cache entry for {evicted_key[0]}")
+
+
+# Shared by every DataProcessor in the process unless one is given its own cache
+REFERENCE_CACHE = ReferenceCache()
@@ -3,29 +3,40 @@
 
 import os
 import datetime
+import numpy as np
 import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List
-from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Border, Side, Alignment
-from logging_config import setup_logging
+from excel_utils import excel_writer, fit_column_widths, resolve_excel_engine, write_frame
+from parallel_utils import IN_FLIGHT_PER_WORKER, bounded_map
+from logging_config import get_logger
 
-logger = setup_logging()
+logger = get_logger()
 
 
 class ReportGenerator:
     """Generates Excel reports from processed data"""
 
-    def __init__(self, config: Dict, results: Dict):
+    def __init__(self, config: Dict, results: Dict, output_dir: str = "output", report_workers: int = 1,
+                 excel_engine: str = None):
         """
         Initialize report generator
 
         Args:
             config: Configuration dictionary
             results: Dictionary with 'detail' and 'summary' DataFrames
+            output_dir: Directory for individual reports
+            report_workers: Default number of processes writing individual reports;
+                'reporting.report_workers' in the config takes precedence
+            excel_engine: Default Excel engine, 'openpyxl' or 'xlsxwriter' (constant-memory
+                streaming for large detail sheets); 'reporting.excel_engine' in the config
+                takes precedence
         """
         self.config = config
         self.results = results
-        self.output_dir = "output"
+        self.output_dir = output_dir
+        self.report_workers = report_workers
+        self.excel_engine = resolve_excel_engine(config.get('reporting', {}).get('excel_engine', excel_engine))
 
         # Create output directory if it doesn't exist
         if not os.path.exists(self.output_dir):
@@ -49,33 +60,21 @@ class ReportGenerator:
 
         try:
             # Create Excel writer
-            with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-                # Write summary sheet
-                self.results['summary'].to_excel(writer, sheet_name='Summary', index=False)
-
-                # Write detail sheet
-                self.results['detail'].to_excel(writer, sheet_name='Detail', index=False)
-
-                # Create configuration data from config file
-                config_data = self._create_config_sheet_data(source_file)
-
-                # Write configuration data to sheet
-                pd.DataFrame(config_data).to_excel(writer, sheet_name='Configuration', index=False)
-
-                # Auto-adjust column widths
-                for sheet_name in writer.sheets:
-                    worksheet = writer.sheets[sheet_name]
-                    for idx, col in enumerate(worksheet.columns, 1):
-                        max_length = 0
-                        column = worksheet.cell(row=1, column=idx).column_letter
-                        for cell in col:
-                            try:
-                                if len(str(cell.value)) > max_length:
-                                    max_length = len(cell.value)
-                            except:
-                                pass
-                        adjusted_width = (max_length + 2)
-                        worksheet.column_dimensions[column].width = min(adjusted_width, 50)
+            with excel_writer(output_path, self.excel_engine) as writer:
+                sheet_frames = {
+                    'Summary': self.results['summary'],
+                    'Detail': self.results['detail'],
+                    # Create configuration data from config file
+                    'Configuration': pd.DataFrame(self._create_config_sheet_data(source_file))
+                }
+
+                # Write summary, detail and configuration sheets
+                for sheet_name, sheet_df in sheet_frames.items():
+                    write_frame(writer, sheet_df, sheet_name)
+
+                # Auto-adjust column widths from the written frames
+                for sheet_name, sheet_df in sheet_frames.items():
+                    fit_column_widths(writer.sheets[sheet_name], [sheet_df])
 
             logger.info(f"Generated main report: {output_path}")
             return output_path
@@ -146,9 +145,9 @@ class ReportGenerator:
             detail = self.results['detail']
             total_records = len(detail)
 
-            gc_count = sum(detail['Compliance'] == 'GC')
-            dnc_count = sum(detail['Compliance'] == 'DNC')
-            pc_count = sum(detail['Compliance'] == 'PC')
+            gc_count = int((detail['Compliance'] == 'GC').sum())
+            dnc_count = int((detail['Compliance'] == 'DNC').sum())
+            pc_count = int((detail['Compliance'] == 'PC').sum())
 
             config_data.append({'Parameter': 'Total Records', 'Value': total_records})
             config_data.append({'Parameter': 'Generally Conforms (GC)',
@@ -174,67 +173,115 @@ class ReportGenerator:
             logger.error(f"Group field '{group_by_field}' not found in data")
             return report_paths
 
+        detail = self.results['detail']
+        summary = self.results['summary']
+
+        # Partition detail and summary once; each group's rows are then taken by position
+        detail_positions = detail.groupby(group_by_field, sort=False, observed=True).indices
+        summary_positions = (summary.groupby(group_by_field, sort=False, observed=True).indices
+                             if group_by_field in summary.columns else {})
+        no_rows = np.array([], dtype=np.intp)
+
+        # Configuration data is the same for every group apart from the group line
+        config_data = self._create_config_sheet_data()
+
         # Get unique groups
-        groups = self.results['detail'][group_by_field].unique()
-
-        for group in groups:
-            if pd.isna(group):
-                continue  # Skip null values
-
-            try:
-                # Filter data for this group
-                group_detail = self.results['detail'][self.results['detail'][group_by_field] == group]
-                group_summary = self.results['summary'][self.results['summary'][group_by_field] == group]
-
-                # Create filename
-                safe_group_name = str(group).replace('/', '_').replace('\\', '_')
-                timestamp = datetime.datetime.now().strftime("%Y%m%d")
-                filename = f"QA_{self.config['analytic_id']}_{safe_group_name}_{timestamp}.xlsx"
-                output_path = os.path.join(self.output_dir, filename)
-
-                # Create Excel writer
-                with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-                    # Write summary sheet
-                    if not group_summary.empty:
-                        group_summary.to_excel(writer, sheet_name='Summary', index=False)
-
-                    # Write detail sheet
-                    if not group_detail.empty:
-                        group_detail.to_excel(writer, sheet_name='Detail', index=False)
-
-                    # Create configuration data for this group
-                    config_data = self._create_config_sheet_data()
-
-                    # Add group-specific information
-                    # Find where the section header is
-                    for i, row in enumerate(config_data):
-                        if row['Parameter'] == '--- RESULTS SUMMARY ---':
-                            # Insert group information before the results
-                            config_data.insert(i, {'Parameter': f'{group_by_field}', 'Value': group})
-                            break
-
-                    # Write configuration data
-                    pd.DataFrame(config_data).to_excel(writer, sheet_name='Configuration', index=False)
-
-                    # Auto-adjust column widths
-                    for sheet_name in writer.sheets:
-                        worksheet = writer.sheets[sheet_name]
-                        for idx, col in enumerate(worksheet.columns, 1):
-                            max_length = 0
-                            column = worksheet.cell(row=1, column=idx).column_letter
-                            for cell in col:
-                                try:
-                                    if len(str(cell.value)) > max_length:
-                                        max_length = len(cell.value)
-                                except:
-                                    pass
-                            adjusted_width = (max_length + 2)
-                            worksheet.column_dimensions[column].width = min(adjusted_width, 50)
-
-                report_paths.append(output_path)
-                logger.info(f"Generated individual report for {group}: {output_path}")
-
-            except Exception as e:
-                logger.error(f"Error generating report for {group}: {e}")
-
-        return report_paths
\ No newline at end of file
+        groups = [group for group in detail[group_by_field].unique() if not pd.isna(group)]  # Skip null values
+
+        report_workers = self.config['reporting'].get('report_workers', self.report_workers) or 1
+
+        if report_workers > 1 and len(groups) > 1:
+            # Workbook serialization is CPU-bound, so groups are written in separate processes;
+            # each worker receives only its own group's slices, which are taken as tasks are submitted
+            logger.info(f"Writing {len(groups)} individual reports with {report_workers} processes")
+            task_args = ((self.config, self.output_dir, self.excel_engine, group,
+                          detail.take(detail_positions.get(group, no_rows)),
+                          summary.take(summary_positions.get(group, no_rows)), config_data)
+                         for group in groups)
+            outcomes = []
+            with ProcessPoolExecutor(max_workers=report_workers) as executor:
+                for group, (path, error) in zip(groups, bounded_map(executor, _write_group_report_task, task_args,
+                                                                    report_workers * IN_FLIGHT_PER_WORKER)):
+                    if error is not None:
+                        logger.error(f"Error generating report for {group}: {error}")
+                    outcomes.append(path)
+        else:
+            outcomes = [
+                self._write_group_report(group, detail.take(detail_positions.get(group, no_rows)),
+                                         summary.take(summary_positions.get(group, no_rows)), config_data)
+                for group in groups
+            ]
+
+        report_paths.extend(path for path in outcomes if path)
+        return report_paths
+
+    def _write_group_report(self, group, group_detail: pd.DataFrame, group_summary: pd.DataFrame,
+                            config_data: List[Dict] = None) -> str:
+        """
+        Write the report for a single group
+
+        Args:
+            group: Group value
+            group_detail: Detail rows for this group
+            group_summary: Summary rows for this group
+            config_data: Optional precomputed configuration sheet data shared by all groups
+
+        Returns:
+            Path to the generated report, or None on error
+        """
+        group_by_field = self.config['reporting']['group_by']
+
+        try:
+            # Create filename
+            safe_group_name = str(group).replace('/', '_').replace('\\', '_')
+            timestamp = datetime.datetime.now().strftime("%Y%m%d")
+            filename = f"QA_{self.config['analytic_id']}_{safe_group_name}_{timestamp}.xlsx"
+            output_path = os.path.join(self.output_dir, filename)
+
+            # Create Excel writer
+            with excel_writer(output_path, self.excel_engine) as writer:
+                sheet_frames = {}
+
+                # Write summary sheet
+                if not group_summary.empty:
+                    write_frame(writer, group_summary, 'Summary')
+                    sheet_frames['Summary'] = group_summary
+
+                # Write detail sheet
+                if not group_detail.empty:
+                    write_frame(writer, group_detail, 'Detail')
+                    sheet_frames['Detail'] = group_detail
+
+                # Create configuration data for this group
+                config_data = list(config_data) if config_data is not None else self._create_config_sheet_data()
+
+                # Add group-specific information
+                # Find where the section header is
+                for i, row in enumerate(config_data):
+                    if row['Parameter'] == '--- RESULTS SUMMARY ---':
+                        # Insert group information before the results
+                        config_data.insert(i, {'Parameter': f'{group_by_field}', 'Value': group})
+                        break
+
+                # Write configuration data
+                sheet_frames['Configuration'] = pd.DataFrame(config_data)
+                write_frame(writer, sheet_frames['Configuration'], 'Configuration')
+
+                # Auto-adjust column widths from the written frames
+                for sheet_name, sheet_df in sheet_frames.items():
+                    fit_column_widths(writer.sheets[sheet_name], [sheet_df])
+
+            logger.info(f"Generated individual report for {group}: {output_path}")
+            return output_path
+
+        except Exception as e:
+            logger.error(f"Error generating report for {group}: {e}")
+            return None
+
+
+def _write_group_report_task(config: Dict, output_dir: str, excel_engine: str, group, group_detail: pd.DataFrame,
+                             group_summary: pd.DataFrame, config_data: List[Dict]) -> str:
+    """Write one group's report in a worker process from that group's slices only"""
+    generator = ReportGenerator(config, {'detail': group_detail, 'summary': group_summary}, output_dir=output_dir,
+                                excel_engine=excel_engine)
+    return generator._write_group_report(group, group_detail, group_summary, config_data)
@@ -0,0 +1,341 @@
+import io
+import os
+import sqlite3
+import datetime
+import pandas as pd
+from contextlib import closing
+from typing import Dict, List, Optional
+from source_cache import read_frame
+from logging_config import get_logger
+
+logger = get_logger()
+
+DEFAULT_RESULTS_DB = os.path.join("results", "qa_results.db")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    analytic_id TEXT NOT NULL,
+    analytic_name TEXT,
+    run_date TEXT NOT NULL,
+    source_file TEXT,
+    group_by TEXT,
+    threshold REAL,
+    total_records INTEGER
+);
+CREATE INDEX IF NOT EXISTS runs_by_analytic_date ON runs (analytic_id, run_date);
+CREATE INDEX IF NOT EXISTS runs_by_date ON runs (run_date);
+
+CREATE TABLE IF NOT EXISTS summary (
+    run_id INTEGER NOT NULL REFERENCES runs (run_id),
+    group_value TEXT,
+    gc INTEGER,
+    pc INTEGER,
+    dnc INTEGER,
+    total INTEGER,
+    dnc_percentage REAL,
+    exceeds_threshold INTEGER
+);
+CREATE INDEX IF NOT EXISTS summary_by_run_group ON summary (run_id, group_value);
+CREATE INDEX IF NOT EXISTS summary_by_group ON summary (group_value, run_id);
+
+CREATE TABLE IF NOT EXISTS detail_partitions (
+    run_id INTEGER NOT NULL REFERENCES runs (run_id),
+    group_value TEXT,
+    compliance TEXT,
+    row_count INTEGER,
+    frame BLOB  -- Parquet file holding the partition's rows
+);
+CREATE INDEX IF NOT EXISTS detail_by_run_group_status ON detail_partitions (run_id, group_value, compliance);
+"""
+
+# Summary table columns as returned by the query API, matching DataProcessor.generate_summary
+SUMMARY_COLUMNS = {
+    'gc': 'GC',
+    'pc': 'PC',
+    'dnc': 'DNC',
+    'total': 'Total',
+    'dnc_percentage': 'DNC_Percentage',
+    'exceeds_threshold': 'Exceeds_Threshold'
+}
+
+
+class ResultsStore:
+    """
+    Embedded SQLite history of analytic runs, indexed by QA-ID, run date, group value and compliance status
+
+    Runs beyond the retention limits are deleted as new runs are recorded. SQLite reuses the
+    freed pages, so the database stays roughly the size of the runs it keeps.
+    """
+
+    def __init__(self, db_path: str = DEFAULT_RESULTS_DB, keep_runs: Optional[int] = 100,
+                 keep_detail_runs: int = 2):
+        """
+        Initialize results store
+
+        Args:
+            db_path: SQLite database file; created with its tables on first use. Relative paths
+                resolve against the working directory
+            keep_runs: Most recent runs kept per analytic; older runs are deleted with their
+                summary and detail. None keeps every run
+            keep_detail_runs: Most recent runs per analytic whose detail rows are kept; delta
+                reports only compare with the previous run
+        """
+        self.db_path = db_path
+        self.keep_runs = keep_runs
+        self.keep_detail_runs = keep_detail_runs
+        self._initialized = False
+
+    def record_run(self, config: Dict, results: Dict, source_file: str = None,
+                   run_date: datetime.datetime = None, include_detail: bool = False) -> Optional[int]:
+        """
+        Store one analytic run's summary and, optionally, its detail
+
+        Args:
+            config: Analytic configuration
+            results: Dictionary with 'detail' and 'summary' DataFrames
+            source_file: Optional source data file path
+            run_date: Run timestamp; defaults to now
+            include_detail: Also store the detail rows, e.g. for delta reports against this run
+
+        Returns:
+            ID of the stored run, or None on error
+        """
+        analytic_id = str(config['analytic_id'])
+        try:
+            group_by = config['reporting']['group_by']
+            threshold = config['thresholds']['error_percentage']
+            detail = results['detail']
+            summary = results['summary']
+            run_date = (run_date or datetime.datetime.now()).isoformat(timespec='milliseconds')
+
+            summary_rows = list(zip(
+                self._text_values(summary[group_by]),
+                *(summary[SUMMARY_COLUMNS[col]].astype(int if col != 'dnc_percentage' else float).tolist()
+                  for col in ('gc', 'pc', 'dnc', 'total', 'dnc_percentage', 'exceeds_threshold'))
+            ))
+
+            detail_rows = self._detail_partitions(analytic_id, detail, group_by) if include_detail else []
+
+            with closing(self._connect()) as connection, connection:
+                run_id = connection.execute(
+                    "INSERT INTO runs (analytic_id, analytic_name, run_date, source_file, group_by, threshold, "
+                    "total_records) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (analytic_id, config.get('analytic_name'), run_date,
+                     os.path.basename(source_file) if source_file else None, group_by, threshold, len(detail))
+                ).lastrowid
+                connection.executemany(
+                    "INSERT INTO summary (run_id, group_value, gc, pc, dnc, total, dnc_percentage, exceeds_threshold) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    ((run_id,) + row for row in summary_rows)
+                )
+                connection.executemany(
+                    "INSERT INTO detail_partitions (run_id, group_value, compliance, row_count, frame) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    ((run_id,) + row for row in detail_rows)
+                )
+                self._apply_retention(connection, analytic_id)
+
+            logger.info(f"Stored run {run_id} for QA-ID {analytic_id}: {len(summary_rows)} groups, "
+                        f"{sum(row[2] for row in detail_rows)} detail rows")
+            return run_id
+
+        except Exception as e:
+            logger.error(f"Error storing results for QA-ID {analytic_id}: {e}")
+            return None
+
+    def runs(self, analytic_id: str = None, last_runs: int = None) -> pd.DataFrame:
+        """
+        List stored runs, oldest first
+
+        Args:
+            analytic_id: Optional QA-ID to restrict to
+            last_runs: Optional number of most recent runs to keep per analytic
+        """
+        query = f"SELECT * FROM runs WHERE run_id IN ({self._run_filter(analytic_id, last_runs)}) " \
+                f"ORDER BY run_date, run_id"
+        return self._query(query, self._run_params(analytic_id, last_runs))
+
+    def previous_run_id(self, analytic_id: str, run_id: int = None, with_detail: bool = False) -> Optional[int]:
+        """
+        Get the analytic's stored run preceding a given run
+
+        Args:
+            analytic_id: QA-ID
+            run_id: Stored run to look before; when omitted, the most recent run is returned
+            with_detail: Only consider runs whose detail rows are stored
+
+        Returns:
+            ID of the preceding run, or None if there is none
+        """
+        query = "SELECT run_id FROM runs WHERE analytic_id = ?"
+        params = [str(analytic_id)]
+        if with_detail:
+            query += " AND EXISTS (SELECT 1 FROM detail_partitions d WHERE d.run_id = runs.run_id)"
+        if run_id is not None:
+            query += (" AND (run_date < (SELECT run_date FROM runs WHERE run_id = ?) OR "
+                      "(run_date = (SELECT run_date FROM runs WHERE run_id = ?) AND run_id < ?))")
+            params += [int(run_id)] * 3
+        query += " ORDER BY run_date DESC, run_id DESC LIMIT 1"
+
+        with closing(self._connect()) as connection:
+            row = connection.execute(query, params).fetchone()
+        return row[0] if row else None
+
+    def summary_history(self, analytic_id: str = None, group_values: List[str] = None,
+                        last_runs: int = None, since: str = None) -> pd.DataFrame:
+        """
+        Get stored per-group summaries, oldest run first
+
+        Args:
+            analytic_id: Optional QA-ID to restrict to
+            group_values: Optional group values (e.g. audit leaders) to restrict to
+            last_runs: Optional number of most recent runs to keep per analytic
+            since: Optional ISO date; only runs on or after it are returned
+
+        Returns:
+            DataFrame with run_id, analytic_id, run_date, group_value and the summary counts
+        """
+        columns = ', '.join(f"s.{col} AS {name}" for col, name in SUMMARY_COLUMNS.items())
+        query = (f"SELECT r.run_id, r.analytic_id, r.run_date, s.group_value, {columns} "
+                 f"FROM summary s JOIN runs r ON r.run_id = s.run_id "
+                 f"WHERE s.run_id IN ({self._run_filter(analytic_id, last_runs)})")
+        params = self._run_params(analytic_id, last_runs)
+        if group_values:
+            query += f" AND s.group_value IN ({', '.join('?' * len(group_values))})"
+            params += [str(value) for value in group_values]
+        if since:
+            query += " AND r.run_date >= ?"
+            params.append(since)
+        query += " ORDER BY r.run_date, r.run_id, s.group_value"
+
+        history = self._query(query, params)
+        history['Exceeds_Threshold'] = history['Exceeds_Threshold'].astype(bool)
+        return history
+
+    def dnc_percentage_history(self, analytic_id: str, last_runs: int = 12) -> pd.DataFrame:
+        """
+        Get DNC % per group over an analytic's most recent runs
+
+        Args:
+            analytic_id: QA-ID
+            last_runs: Number of most recent runs
+
+        Returns:
+            DataFrame indexed by run date with one column per group value
+        """
+        history = self.summary_history(analytic_id, last_runs=last_runs)
+        if history.empty:
+            return pd.DataFrame()
+        return history.pivot_table(index='run_date', columns='group_value', values='DNC_Percentage', sort=True)
+
+    def detail(self, run_id: int, group_value: str = None, compliance: str = None) -> pd.DataFrame:
+        """
+        Get a stored run's detail rows
+
+        Args:
+            run_id: Stored run ID
+            group_value: Optional group value to restrict to
+            compliance: Optional compliance status ('GC', 'PC' or 'DNC') to restrict to
+
+        Returns:
+            DataFrame of the stored rows in their original order
+        """
+        query = "SELECT frame FROM detail_partitions WHERE run_id = ?"
+        params = [run_id]
+        if group_value is not None:
+            query += " AND group_value = ?"
+            params.append(str(group_value))
+        if compliance is not None:
+            query += " AND compliance = ?"
+            params.append(compliance)
+
+        with closing(self._connect()) as connection:
+            frames = [read_frame(io.BytesIO(frame)) for frame, in connection.execute(query, params)]
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames).sort_index()
+
+    @classmethod
+    def _detail_partitions(cls, analytic_id: str, detail: pd.DataFrame, group_by: str) -> List:
+        """
+        Split detail rows into (group value, compliance, row count, Parquet bytes) partitions
+
+        Every analytic has its own detail columns, so detail is stored as one Parquet file per
+        group value and compliance status; those two columns are indexed for queries. Returns
+        no partitions, keeping the run's summary, if the detail cannot be stored as Parquet.
+        """
+        try:
+            partition_keys = pd.DataFrame({
+                'group_value': cls._text_values(detail[group_by]) if group_by in detail.columns else None,
+                'compliance': cls._text_values(detail['Compliance']) if 'Compliance' in detail.columns else None
+            }, index=detail.index)
+            partitions = partition_keys.groupby(['group_value', 'compliance'], dropna=False, sort=False).indices
+
+            detail_rows = []
+            for (group_value, compliance), positions in partitions.items():
+                buffer = io.BytesIO()
+                detail.take(positions).to_parquet(buffer, engine='pyarrow')
+                detail_rows.append((None if pd.isna(group_value) else group_value,
+                                    None if pd.isna(compliance) else compliance, len(positions), buffer.getvalue()))
+            return detail_rows
+
+        except Exception as e:
+            logger.warning(f"Detail rows for QA-ID {analytic_id} not stored: {e}")
+            return []
+
+    def _apply_retention(self, connection: sqlite3.Connection, analytic_id: str) -> None:
+        """Delete the analytic's runs and detail rows beyond the retention limits"""
+        ranked_runs = ("SELECT run_id FROM (SELECT run_id, ROW_NUMBER() OVER (ORDER BY run_date DESC, run_id DESC) "
+                       "AS run_rank FROM runs WHERE analytic_id = ?{}) WHERE run_rank > ?")
+        older_runs = ranked_runs.format("")
+        # Runs recorded without detail do not count against the detail limit
+        older_detail_runs = ranked_runs.format(
+            " AND EXISTS (SELECT 1 FROM detail_partitions d WHERE d.run_id = runs.run_id)")
+
+        connection.execute(f"DELETE FROM detail_partitions WHERE run_id IN ({older_detail_runs})",
+                           (analytic_id, self.keep_detail_runs))
+        if self.keep_runs is not None:
+            connection.execute(f"DELETE FROM summary WHERE run_id IN ({older_runs})", (analytic_id, self.keep_runs))
+            connection.execute(f"DELETE FROM runs WHERE run_id IN ({older_runs})", (analytic_id, self.keep_runs))
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection, creating the database and tables on first use"""
+        if not self._initialized:
+            os.makedirs(os.path.dirname(self.db_path) or '.', exist_ok=True)
+        # Analytics running in separate processes may write at the same time
+        connection = sqlite3.connect(self.db_path, timeout=30)
+        if not self._initialized:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(SCHEMA)
+            self._initialized = True
+        return connection
+
+    def _query(self, query: str, params: List) -> pd.DataFrame:
+        """Run a query and return its rows as a DataFrame"""
+        with closing(self._connect()) as connection:
+            return pd.read_sql_query(query, connection, params=params)
+
+    @staticmethod
+    def _run_filter(analytic_id: Optional[str], last_runs: Optional[int]) -> str:
+        """Subquery selecting the run IDs for an analytic filter and per-analytic run limit"""
+        where = "WHERE analytic_id = ?" if analytic_id is not None else ""
+        if not last_runs:
+            return f"SELECT run_id FROM runs {where}"
+        return (f"SELECT run_id FROM (SELECT run_id, ROW_NUMBER() OVER (PARTITION BY analytic_id "
+                f"ORDER BY run_date DESC, run_id DESC) AS run_rank FROM runs {where}) WHERE run_rank <= ?")
+
+    @staticmethod
+    def _run_params(analytic_id: Optional[str], last_runs: Optional[int]) -> List:
+        """Parameters for _run_filter"""
+        params = [str(analytic_id)] if analytic_id is not None else []
+        if last_runs:
+            params.append(int(last_runs))
+        return params
+
+    @staticmethod
+    def _text_values(values: pd.Series) -> List[Optional[str]]:
+        """Column values as text for the indexed columns, with missing values as NULL"""
+        text = values.astype(str).to_numpy(dtype=object)
+        text[values.isna().to_numpy()] = None
+        return text.tolist()
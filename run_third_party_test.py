@@ -2,6 +2,7 @@ import os
 import sys
 from test_qa_analytic import TestQAAnalytic
 from test_data_generator2 import create_third_party_test_data
+from logging_config import setup_logging
 
 # Ensure directories exist
 if not os.path.exists('test_data'):
@@ -37,6 +38,8 @@ def run_third_party_risk_test():
 
 
 if __name__ == "__main__":
+    setup_logging()
+
     # Ensure the config file exists - you'll need to create the qa_78.yaml file
     if not os.path.exists('configs/qa_78.yaml'):
         print("Configuration file 'configs/qa_78.yaml' not found.")
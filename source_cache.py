@@ -0,0 +1,240 @@
+import os
+import json
+import hashlib
+import numpy as np
+import pandas as pd
+from typing import Dict, Optional
+from logging_config import get_logger
+
+logger = get_logger()
+
+DEFAULT_CACHE_DIR = os.path.join(".qa_cache", "source")
+
+# Cached frames are stored as Parquet, which round-trips categoricals, datetimes and the index
+# and, unlike pickle, is safe to load from a shared directory
+ENTRY_SUFFIX = ".parquet"
+
+
+def read_frame(path) -> pd.DataFrame:
+    """
+    Read a frame stored with write_frame, from a file path or a binary buffer
+
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+    df = pd.read_parquet(path, engine='pyarrow')
+
+    # Parquet returns missing text as None; restore the NaN a freshly cleaned frame holds
+    for column in df.columns[df.dtypes == object]:
+        values = df[column]
+        missing = values.isna()
+        if missing.any():
+            df[column] = values.where(~missing, np.nan)
+    return df
+
+
+def write_frame(df: pd.DataFrame, path: str) -> None:
+    """
+    Store a frame as Parquet, replacing the file at path atomically
+
+    Raises:
+        ImportError: If pyarrow is not installed
+        pyarrow.ArrowException: If a column cannot be stored, e.g. an object column mixing
+            strings and numbers
+    """
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        df.to_parquet(temp_path, engine='pyarrow')
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    os.replace(temp_path, path)
+
+
+def entry_path(cache_dir: str, key_data: Dict) -> str:
+    """Build a cache entry path from a hash of the JSON-serialized key data"""
+    key = hashlib.sha256(json.dumps(key_data, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+    return os.path.join(cache_dir, f"{key}{ENTRY_SUFFIX}")
+
+
+def evict_entries(cache_dir: str, max_entries: int, max_bytes: int, description: str) -> None:
+    """
+    Drop least recently used entries of a cache directory beyond the entry count or size limits
+
+    Args:
+        cache_dir: Directory holding the entries
+        max_entries: Maximum number of entries kept
+        max_bytes: Maximum total size of entries kept
+        description: Name of the cache for log messages, e.g. 'source cache'
+    """
+    entries = []
+    for filename in os.listdir(cache_dir):
+        if filename.endswith(ENTRY_SUFFIX):
+            stat = os.stat(os.path.join(cache_dir, filename))
+            entries.append((stat.st_mtime, stat.st_size, filename))
+
+    # Newest first; keep entries while both limits hold
+    entries.sort(reverse=True)
+    total_bytes = 0
+    for count, (_, size, filename) in enumerate(entries, 1):
+        total_bytes += size
+        if count > max_entries or total_bytes > max_bytes:
+            os.remove(os.path.join(cache_dir, filename))
+            logger.info(f"Evicted {description} entry {filename}")
+
+
+def remove_entries(cache_dir: str) -> None:
+    """Remove all entries of a cache directory"""
+    if not os.path.isdir(cache_dir):
+        return
+
+    for filename in os.listdir(cache_dir):
+        if filename.endswith(ENTRY_SUFFIX):
+            os.remove(os.path.join(cache_dir, filename))
+
+
+class FileHashManifest:
+    """
+    Content hashes of files, recorded in a manifest against each file's path, size and mtime
+    so unchanged files are not re-read on every lookup
+    """
+
+    MANIFEST_NAME = "manifest.json"
+
+    def __init__(self, cache_dir: str):
+        """
+        Initialize file hash manifest
+
+        Args:
+            cache_dir: Directory holding the manifest
+        """
+        self.cache_dir = cache_dir
+
+    def file_hash(self, file_path: str) -> str:
+        """
+        Get the content hash of a file, re-reading it only when its size or mtime changed
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        abs_path = os.path.abspath(file_path)
+        stat = os.stat(abs_path)
+
+        manifest = self._read_manifest()
+        known = manifest.get(abs_path)
+        if known and known['size'] == stat.st_size and known['mtime_ns'] == stat.st_mtime_ns:
+            return known['content_hash']
+
+        digest = hashlib.sha256()
+        with open(abs_path, 'rb') as file:
+            for block in iter(lambda: file.read(1024 * 1024), b''):
+                digest.update(block)
+
+        manifest[abs_path] = {
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'content_hash': digest.hexdigest()
+        }
+        self._write_manifest(manifest)
+        return manifest[abs_path]['content_hash']
+
+    def clear(self) -> None:
+        """Remove the manifest"""
+        manifest_path = os.path.join(self.cache_dir, self.MANIFEST_NAME)
+        if os.path.exists(manifest_path):
+            os.remove(manifest_path)
+
+    def _read_manifest(self) -> Dict:
+        """Read the path -> (size, mtime, content hash) manifest"""
+        manifest_path = os.path.join(self.cache_dir, self.MANIFEST_NAME)
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_manifest(self, manifest: Dict) -> None:
+        """Write the manifest atomically"""
+        manifest_path = os.path.join(self.cache_dir, self.MANIFEST_NAME)
+        temp_path = f"{manifest_path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            json.dump(manifest, file)
+        os.replace(temp_path, manifest_path)
+
+
+class SourceCache:
+    """Sidecar cache of parsed, alias-mapped and cleaned source DataFrames"""
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, max_entries: int = 32,
+                 max_bytes: int = 2 * 1024 ** 3):
+        """
+        Initialize source cache
+
+        Args:
+            cache_dir: Directory holding cached frames and the manifest
+            max_entries: Maximum number of cached frames kept
+            max_bytes: Maximum total size of cached frames on disk
+        """
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hashes = FileHashManifest(cache_dir)
+
+    def get(self, file_path: str, source_config: Dict) -> Optional[pd.DataFrame]:
+        """
+        Get the cached frame for a source file, if one is current
+
+        Args:
+            file_path: Path to the source file
+            source_config: Source settings and code hashes the frame was built with
+
+        Returns:
+            Cached DataFrame, or None on a miss
+        """
+        try:
+            entry_path = self._entry_path(file_path, source_config)
+            if not os.path.exists(entry_path):
+                logger.info(f"Source cache miss for {file_path}")
+                return None
+
+            df = read_frame(entry_path)
+
+            # Touch the entry so eviction drops least recently used frames first
+            os.utime(entry_path)
+            logger.info(f"Source cache hit for {file_path}")
+            return df
+
+        except Exception as e:
+            logger.warning(f"Error reading source cache for {file_path}: {e}")
+            return None
+
+    def put(self, file_path: str, source_config: Dict, df: pd.DataFrame) -> None:
+        """
+        Store the prepared frame for a source file and evict old entries
+
+        Args:
+            file_path: Path to the source file
+            source_config: Source settings and code hashes the frame was built with
+            df: Parsed, alias-mapped and cleaned DataFrame
+        """
+        try:
+            write_frame(df, self._entry_path(file_path, source_config))
+            evict_entries(self.cache_dir, self.max_entries, self.max_bytes, 'source cache')
+
+        except Exception as e:
+            logger.warning(f"Error writing source cache for {file_path}: {e}")
+
+    def clear(self) -> None:
+        """Remove all cached frames and the manifest"""
+        remove_entries(self.cache_dir)
+        self.hashes.clear()
+
+    def _entry_path(self, file_path: str, source_config: Dict) -> str:
+        """Build the cache entry path from the file content and the config that shaped the frame"""
+        return entry_path(self.cache_dir, {
+            'content_hash': self.hashes.file_hash(file_path),
+            'source': source_config,
+            'pandas': pd.__version__
+        })
@@ -0,0 +1,351 @@
+import os
+import numpy as np
+import pandas as pd
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
+from pandas.io.parsers import TextParser
+from logging_config import get_logger
+
+logger = get_logger()
+
+# Rows parsed per chunk when streaming a workbook
+STREAMING_CHUNK_ROWS = 50000
+
+# Workbooks at least this large are streamed even when the config does not ask for it
+STREAMING_THRESHOLD_BYTES = 50 * 1024 ** 2
+
+# Rows parsed per chunk when reading CSV files
+CSV_CHUNK_ROWS = 200000
+
+# Values openpyxl gives error cells ('#DIV/0!', '#REF!', '#N/A', ...), matching
+# openpyxl.cell.cell.ERROR_CODES, which is not imported here to keep openpyxl lazy
+EXCEL_ERROR_CODES = frozenset(('#NULL!', '#DIV/0!', '#VALUE!', '#REF!', '#NAME?', '#NUM!', '#N/A'))
+
+# Value kinds (pandas infer_dtype) that convert to numbers without parsing any text
+NUMERIC_VALUE_KINDS = ('integer', 'floating', 'mixed-integer-float', 'decimal', 'boolean', 'empty')
+
+# Source readers by 'source.file_type'
+SOURCE_READERS: Dict[str, Callable[..., pd.DataFrame]] = {}
+
+
+class ReadPlan:
+    """Which physical source columns to read and how they are declared in the config"""
+
+    def __init__(self, columns: Optional[Set[str]] = None, column_types: Optional[Dict[str, str]] = None):
+        """
+        Initialize read plan
+
+        Args:
+            columns: Physical column names to read (standard names and aliases); None reads all
+            column_types: Declared type ('string', 'number' or 'date') by physical column name
+        """
+        self.columns = columns
+        self.column_types = column_types or {}
+
+    def selects(self, column) -> bool:
+        """Check whether a physical column is part of the plan"""
+        return self.columns is None or column in self.columns
+
+    def string_columns(self) -> List[str]:
+        """Physical columns declared as strings, which readers keep as text"""
+        return [col for col, col_type in self.column_types.items() if col_type == 'string']
+
+    def usecols(self):
+        """Column selector for pandas readers, or None to read every column"""
+        return None if self.columns is None else self.selects
+
+
+def register_reader(*file_types: str):
+    """
+    Register a source reader for one or more file types
+
+    A reader is called as reader(file_path, source_config, header_check, read_plan) and returns
+    the raw DataFrame. Readers that can see the column names before parsing data should pass them
+    to header_check, when given, so a file missing required columns fails early. Readers should
+    only parse the columns the read plan selects.
+    """
+    def decorator(reader):
+        for file_type in file_types:
+            SOURCE_READERS[file_type.lower()] = reader
+        return reader
+    return decorator
+
+
+def get_reader(file_type: str) -> Callable[..., pd.DataFrame]:
+    """
+    Get the reader registered for a file type
+
+    Raises:
+        ValueError: If no reader is registered for the file type
+    """
+    reader = SOURCE_READERS.get(str(file_type).lower().lstrip('.'))
+    if reader is None:
+        raise ValueError(f"Unsupported source file type '{file_type}' "
+                         f"(supported: {', '.join(sorted(SOURCE_READERS))})")
+    return reader
+
+
+@register_reader('xlsx', 'xlsm')
+def read_xlsx(file_path: str, source_config: Dict,
+              header_check: Optional[Callable[[List[str]], None]] = None,
+              read_plan: Optional[ReadPlan] = None) -> pd.DataFrame:
+    """Read an Excel workbook, streaming it when 'source.streaming' is set or the file is large"""
+    read_plan = read_plan or ReadPlan()
+    streaming = source_config.get('streaming')
+    if streaming is None:
+        streaming = os.path.getsize(file_path) >= STREAMING_THRESHOLD_BYTES
+
+    if streaming:
+        return read_excel_streaming(file_path, header_check=header_check, read_plan=read_plan)
+
+    # The whole sheet is parsed at once, so columns are checked after loading
+    return pd.read_excel(file_path, usecols=read_plan.usecols(),
+                         dtype={col: object for col in read_plan.string_columns()} or None)
+
+
+@register_reader('xls')
+def read_xls(file_path: str, source_config: Dict,
+             header_check: Optional[Callable[[List[str]], None]] = None,
+             read_plan: Optional[ReadPlan] = None) -> pd.DataFrame:
+    """Read a legacy Excel workbook"""
+    read_plan = read_plan or ReadPlan()
+    return pd.read_excel(file_path, usecols=read_plan.usecols(),
+                         dtype={col: object for col in read_plan.string_columns()} or None)
+
+
+@register_reader('csv')
+def read_csv(file_path: str, source_config: Dict,
+             header_check: Optional[Callable[[List[str]], None]] = None,
+             read_plan: Optional[ReadPlan] = None) -> pd.DataFrame:
+    """
+    Read a CSV file in chunks
+
+    Chunks are read as objects and typed as they arrive; columns whose chunks end up with
+    different types are re-inferred over the full column, so a value late in the file cannot
+    leave earlier chunks with a different type. Columns declared as strings are kept as text.
+    """
+    read_plan = read_plan or ReadPlan()
+    if header_check is not None:
+        header_check(list(pd.read_csv(file_path, nrows=0).columns))
+
+    string_columns = set(read_plan.string_columns())
+    typed_chunks = [_type_chunk(chunk, string_columns)
+                    for chunk in pd.read_csv(file_path, usecols=read_plan.usecols(), dtype=object,
+                                             chunksize=CSV_CHUNK_ROWS)]
+    return _concat_typed_chunks(typed_chunks)
+
+
+@register_reader('parquet')
+def read_parquet(file_path: str, source_config: Dict,
+                 header_check: Optional[Callable[[List[str]], None]] = None,
+                 read_plan: Optional[ReadPlan] = None) -> pd.DataFrame:
+    """Read a Parquet file (requires pyarrow)"""
+    import pyarrow.parquet as pq
+
+    read_plan = read_plan or ReadPlan()
+    names = list(pq.read_schema(file_path).names)
+    if header_check is not None:
+        header_check(names)
+    return pd.read_parquet(file_path, columns=[name for name in names if read_plan.selects(name)])
+
+
+@register_reader('feather')
+def read_feather(file_path: str, source_config: Dict,
+                 header_check: Optional[Callable[[List[str]], None]] = None,
+                 read_plan: Optional[ReadPlan] = None) -> pd.DataFrame:
+    """Read a Feather file (requires pyarrow)"""
+    import pyarrow.ipc
+
+    read_plan = read_plan or ReadPlan()
+    with pyarrow.ipc.open_file(file_path) as feather_file:
+        names = list(feather_file.schema.names)
+    if header_check is not None:
+        header_check(names)
+    return pd.read_feather(file_path, columns=[name for name in names if read_plan.selects(name)])
+
+
+def read_excel_streaming(file_path: str,
+                         header_check: Optional[Callable[[List[str]], None]] = None,
+                         chunk_rows: int = STREAMING_CHUNK_ROWS,
+                         read_plan: Optional[ReadPlan] = None) -> pd.DataFrame:
+    """
+    Read the first worksheet of a workbook row by row in openpyxl read-only mode
+
+    Cell values are converted and parsed the same way pd.read_excel does, but only one
+    chunk of raw rows is held at a time and each chunk is converted to typed columns before
+    the next is read, so peak memory tracks the final DataFrame rather than a full list of
+    cell values. Columns are defined by the header row.
+
+    Args:
+        file_path: Path to the workbook
+        header_check: Optional callback run on the header names before any data row is
+            parsed; raise from it to abort the read
+        chunk_rows: Number of rows parsed per chunk
+        read_plan: Optional plan limiting which columns are kept; cells of other columns
+            are dropped before parsing
+
+    Returns:
+        DataFrame with the sheet contents
+    """
+    from openpyxl import load_workbook
+
+    read_plan = read_plan or ReadPlan()
+    workbook = load_workbook(file_path, read_only=True, data_only=True, keep_links=False)
+    try:
+        sheet = workbook.worksheets[0]
+        sheet.reset_dimensions()
+        rows = _iter_sheet_rows(sheet)
+
+        header = next(rows, None)
+        if header is None:
+            return pd.DataFrame()
+
+        if header_check is not None:
+            header_check([str(name) for name in header if name != ""])
+
+        # Only cells of planned columns are kept; rows are padded to the header width first
+        width = len(header)
+        keep = [i for i, name in enumerate(header) if read_plan.selects(name)]
+        header = [header[i] for i in keep]
+
+        string_columns = set(read_plan.string_columns())
+        typed_chunks = []
+        chunk = []
+        for row in rows:
+            if len(row) < width:
+                row = row + [""] * (width - len(row))
+            chunk.append([row[i] for i in keep])
+            if len(chunk) >= chunk_rows:
+                typed_chunks.append(_type_chunk(_parse_chunk(header, chunk), string_columns))
+                chunk = []
+        if chunk or not typed_chunks:
+            typed_chunks.append(_type_chunk(_parse_chunk(header, chunk), string_columns))
+    finally:
+        workbook.close()
+
+    chunk_count = len(typed_chunks)
+    df = _concat_typed_chunks(typed_chunks)
+
+    logger.info(f"Streamed {len(df)} rows from {file_path} in {chunk_count} chunk(s)")
+    return df
+
+
+def _iter_sheet_rows(sheet) -> Iterator[List]:
+    """Yield converted rows, dropping trailing empty cells and trailing empty rows"""
+    pending_empty = 0
+    for values in sheet.iter_rows(values_only=True):
+        row = [_convert_value(value) for value in values]
+        while row and row[-1] == "":
+            row.pop()
+
+        if not row:
+            # Empty rows only count if data follows them
+            pending_empty += 1
+            continue
+
+        for _ in range(pending_empty):
+            yield []
+        pending_empty = 0
+        yield row
+
+
+def _convert_value(value):
+    """Convert a raw cell value the way pandas' openpyxl reader does"""
+    if value is None:
+        return ""
+    # Read-only rows give error cells as their code, e.g. '#REF!'; pandas reads them as NaN
+    if isinstance(value, str) and value in EXCEL_ERROR_CODES:
+        return np.nan
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        as_int = int(value)
+        return as_int if as_int == value else float(value)
+    return value
+
+
+def _parse_chunk(header: List, rows: List[List]) -> pd.DataFrame:
+    """Parse one chunk of rows with pandas' default NA handling, keeping values as objects"""
+    chunk = TextParser([header] + rows, header=0, skip_blank_lines=False, dtype=object).read().astype(object)
+
+    # Dates parsed within a chunk leave NaT behind; use NaN like the other missing values
+    return chunk.where(chunk.notna(), np.nan)
+
+
+def _type_chunk(chunk: pd.DataFrame, string_columns: Set) -> Tuple[pd.DataFrame, Dict[int, pd.Series]]:
+    """
+    Infer the column types of one chunk parsed as objects
+
+    Args:
+        chunk: Chunk with object columns
+        string_columns: Columns declared as strings, which stay as text
+
+    Returns:
+        Tuple of (typed chunk, untyped values by column position). Untyped values are only kept
+        for columns where numeric text was converted to numbers, as the typed values cannot
+        restore the text if the full column turns out not to be numeric.
+    """
+    raw_text = {}
+    for position, col in enumerate(chunk.columns):
+        if col in string_columns:
+            continue
+        values = chunk.iloc[:, position]
+        typed = _infer_column(values)
+        if (pd.api.types.is_numeric_dtype(typed)
+                and pd.api.types.infer_dtype(values, skipna=True) not in NUMERIC_VALUE_KINDS):
+            raw_text[position] = values
+        chunk.isetitem(position, typed)
+    return chunk, raw_text
+
+
+def _concat_typed_chunks(typed_chunks: List[Tuple[pd.DataFrame, Dict[int, pd.Series]]]) -> pd.DataFrame:
+    """
+    Combine typed chunks into the frame whole-column inference would give
+
+    Columns typed alike in every chunk, or numeric in every chunk, are concatenated as they
+    are. Otherwise the column held different kinds of values, e.g. numbers in one chunk and
+    text in another, and only that column is rebuilt as objects and inferred again.
+    """
+    if len(typed_chunks) == 1:
+        return typed_chunks[0][0]
+
+    chunks = [chunk for chunk, _ in typed_chunks]
+    columns = []
+    for position in range(len(chunks[0].columns)):
+        parts = [chunk.iloc[:, position] for chunk in chunks]
+        dtypes = {part.dtype for part in parts}
+        if len(dtypes) == 1 or all(pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+                                   for dtype in dtypes):
+            columns.append(pd.concat(parts, ignore_index=True))
+        else:
+            raw_parts = [raw_text[position] if position in raw_text else _untyped_values(part)
+                         for part, (_, raw_text) in zip(parts, typed_chunks)]
+            columns.append(_infer_column(pd.concat(raw_parts, ignore_index=True)))
+
+    df = pd.concat(columns, axis=1, ignore_index=True)
+    df.columns = chunks[0].columns
+    return df
+
+
+def _untyped_values(values: pd.Series) -> pd.Series:
+    """Turn a typed chunk column back into the object values it was parsed from"""
+    if pd.api.types.is_float_dtype(values):
+        # Cells holding whole numbers are read as ints (see _convert_value)
+        whole = values.notna() & (values == np.floor(values)) & (values.abs() < 2 ** 63)
+        untyped = values.astype(object)
+        untyped[whole] = values[whole].astype(np.int64).astype(object)
+        return untyped
+    untyped = values.astype(object)
+    return untyped.where(values.notna(), np.nan)
+
+
+def _infer_column(values: pd.Series) -> pd.Series:
+    """Infer the dtype pd.read_excel would give an object column"""
+    if values.dtype != object:
+        return values
+
+    if values.isna().all():
+        return values.astype(np.float64) if len(values) else values
+
+    # Numbers and numeric strings become numeric columns; anything else stays as is
+    try:
+        return pd.to_numeric(values)
+    except (ValueError, TypeError):
+        return values.infer_objects()
@@ -0,0 +1,89 @@
+import os
+import pandas as pd
+from typing import Dict, Optional
+from source_cache import FileHashManifest, entry_path, evict_entries, read_frame, remove_entries, write_frame
+from logging_config import get_logger
+
+logger = get_logger()
+
+DEFAULT_STAGE_CACHE_DIR = os.path.join(".qa_cache", "stages")
+
+
+class StageCache:
+    """
+    Content-addressed cache of process_data stage outputs, stored like cached source frames
+
+    Every run with new inputs stores its full validated detail and its summary, so the cache
+    grows by roughly one Parquet copy of the source data per changed input. Least recently
+    used entries are evicted beyond max_entries or max_bytes.
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_STAGE_CACHE_DIR, max_entries: int = 64,
+                 max_bytes: int = 2 * 1024 ** 3):
+        """
+        Initialize stage cache
+
+        Args:
+            cache_dir: Directory holding cached stage outputs and the file hash manifest;
+                relative paths resolve against the working directory
+            max_entries: Maximum number of cached outputs kept
+            max_bytes: Maximum total size of cached outputs on disk
+        """
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hashes = FileHashManifest(cache_dir)
+
+    def get_stage(self, stage: str, inputs: Dict) -> Optional[pd.DataFrame]:
+        """
+        Get a stage's cached output, if one was stored for the same inputs
+
+        Args:
+            stage: Stage name, e.g. 'validations' or 'summary'
+            inputs: JSON-serializable description of everything the stage output depends on
+
+        Returns:
+            Cached DataFrame, or None on a miss
+        """
+        try:
+            path = self._stage_path(stage, inputs)
+            if not os.path.exists(path):
+                logger.info(f"Stage cache miss for {stage}")
+                return None
+
+            df = read_frame(path)
+
+            # Touch the entry so eviction drops least recently used outputs first
+            os.utime(path)
+            logger.info(f"Stage cache hit for {stage}")
+            return df
+
+        except Exception as e:
+            logger.warning(f"Error reading stage cache for {stage}: {e}")
+            return None
+
+    def put_stage(self, stage: str, inputs: Dict, df: pd.DataFrame) -> None:
+        """
+        Store a stage's output and evict old entries
+
+        Args:
+            stage: Stage name
+            inputs: The same inputs description used for get_stage
+            df: Stage output
+        """
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            write_frame(df, self._stage_path(stage, inputs))
+            evict_entries(self.cache_dir, self.max_entries, self.max_bytes, 'stage cache')
+
+        except Exception as e:
+            logger.warning(f"Error writing stage cache for {stage}: {e}")
+
+    def clear(self) -> None:
+        """Remove all cached stage outputs and the file hash manifest"""
+        remove_entries(self.cache_dir)
+        self.hashes.clear()
+
+    def _stage_path(self, stage: str, inputs: Dict) -> str:
+        """Build the entry path of a stage output from its inputs"""
+        return entry_path(self.cache_dir, {'stage': stage, 'inputs': inputs, 'pandas': pd.__version__})
@@ -0,0 +1,47 @@
+"""
+Import-time tests for the entry points
+
+The CLI and GUIs defer pandas and the Excel writers to the code paths that use them, so
+--help, --list and opening a window stay fast. Each module is imported in a fresh
+interpreter with -X importtime and the modules it loaded are checked.
+"""
+import os
+import subprocess
+import sys
+import pytest
+
+ENTRY_POINTS = ["qa_cli", "main", "consolidated_qa_app"]
+HEAVY_MODULES = {"pandas", "openpyxl", "xlsxwriter"}
+# Cumulative import time of an entry point, well above the ~0.07s measured so slow
+# machines pass while an eager pandas import (~0.5s) does not
+IMPORT_BUDGET_SECONDS = 0.3
+
+
+def import_times(module: str) -> dict:
+    """Import module in a fresh interpreter and return cumulative seconds by module name"""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+    assert result.returncode == 0, result.stderr
+    times = {}
+    # Lines read "import time: self [us] | cumulative | imported package"
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if fields[1].strip().isdigit():
+            times[fields[2].strip()] = int(fields[1]) / 1e6
+    return times
+
+
+@pytest.mark.parametrize("module", ENTRY_POINTS)
+def test_entry_point_defers_heavy_imports(module):
+    times = import_times(module)
+    assert module in times
+    assert not HEAVY_MODULES & times.keys()
+
+
+@pytest.mark.parametrize("module", ENTRY_POINTS)
+def test_entry_point_import_budget(module):
+    # Best of three, so one slow start on a busy machine does not fail the run
+    elapsed = min(import_times(module)[module] for _ in range(3))
+    assert elapsed < IMPORT_BUDGET_SECONDS
@@ -4,10 +4,9 @@ import pandas as pd
 from config_manager import ConfigManager
 from data_processor import DataProcessor
 from report_generator import ReportGenerator
-from logging_config import setup_logging
+from logging_config import get_logger, setup_logging
 
-# Set up logging
-logger = setup_logging()
+logger = get_logger()
 
 
 class TestQAAnalytic:
@@ -132,6 +131,8 @@ class TestQAAnalytic:
 
 
 if __name__ == "__main__":
+    setup_logging()
+
     # First check that we generated test data
     if not os.path.exists('test_data/qa_77_test_data.xlsx'):
         print("Test data not found. Run the test_data_generator.py script first.")
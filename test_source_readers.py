@@ -0,0 +1,47 @@
+"""
+Tests for the streaming workbook reader
+
+read_excel_streaming must give the same frame as pd.read_excel, whatever the chunk size,
+since large extracts switch to it automatically.
+"""
+import pandas as pd
+import pytest
+from openpyxl import Workbook
+from openpyxl.cell.cell import ERROR_CODES
+from source_readers import EXCEL_ERROR_CODES, read_excel_streaming
+
+ERRORS = sorted(ERROR_CODES)
+
+
+@pytest.fixture
+def error_workbook(tmp_path):
+    """Workbook whose columns mix error cells with numbers, text, dates and blanks"""
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.append(["Record ID", "Risk Level", "Amount", "Submit Date", "Mixed"])
+    for i in range(23):
+        error = ERRORS[i % len(ERRORS)]
+        sheet.append([
+            f"TW{i:04d}",
+            error if i % 3 == 0 else ["Low", "High", None][i % 3],
+            error if i % 4 == 1 else i * 1.5,
+            error if i % 5 == 2 else pd.Timestamp("2025-01-01") + pd.Timedelta(days=i),
+            error if i % 2 else ("N/A" if i % 4 == 0 else i),
+        ])
+    path = tmp_path / "errors.xlsx"
+    workbook.save(path)
+    return path
+
+
+def test_error_codes_match_openpyxl():
+    assert EXCEL_ERROR_CODES == set(ERROR_CODES)
+
+
+@pytest.mark.parametrize("chunk_rows", [4, 5, 100])
+def test_streaming_reads_error_cells_like_read_excel(error_workbook, chunk_rows):
+    expected = pd.read_excel(error_workbook, engine='openpyxl')
+    # Amount has no blank cells, so its missing values all come from error cells
+    assert expected['Amount'].isna().sum() == 6
+
+    actual = read_excel_streaming(str(error_workbook), chunk_rows=chunk_rows)
+    pd.testing.assert_frame_equal(actual, expected)
@@ -0,0 +1,260 @@
+"""
+Equivalence tests for the vectorized validation rules
+
+Each rule is compared with a row-by-row reference implementation of its original
+semantics on randomized data holding nulls, empty strings, "N/A" variants,
+non-string values and categorical columns.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+from prepared_columns import PreparedColumns
+from validation_rules import ValidationRules
+
+SEEDS = range(5)
+ROWS = 500
+# Rows of the large-input case, where the references run once per distinct row
+LARGE_ROWS = 300_000
+
+NAMES = ["Alice Johnson", "alice johnson", "ALICE JOHNSON", "Bob Brown", "Charlie Davis", "Dana White"]
+MESSY_VALUES = [None, np.nan, "", " ", "N/A", "n/a", "N/A ", "NA", 0, 1, 2.5, True]
+RISK_LEVELS = ["Low", "Medium", "High", "Critical"]
+DATES = ["2025-01-01", "2025-01-02", "2025-01-15", "2025-02-01", "2025-03-31"]
+TITLES = {"Alice Johnson": "Audit Leader", "Bob Brown": "Executive Auditor", "Charlie Davis": "Audit Manager",
+          "Dana White": "", "Ghost": np.nan, 7: "Audit Leader"}
+ALLOWED_TITLES = ["Audit Leader", "Executive Auditor"]
+
+
+def random_column(rng: np.random.Generator, values, messy_share: float = 0.4, rows: int = ROWS) -> pd.Series:
+    """Draw a column mixing the given values with nulls, blanks and non-string values"""
+    pool = list(values) + MESSY_VALUES
+    weights = np.r_[np.full(len(values), (1 - messy_share) / len(values)),
+                    np.full(len(MESSY_VALUES), messy_share / len(MESSY_VALUES))]
+    picks = rng.choice(len(pool), size=rows, p=weights)
+    return pd.Series([pool[i] for i in picks], dtype=object)
+
+
+def as_categorical(df: pd.DataFrame, columns) -> pd.DataFrame:
+    """Encode columns as categoricals, as low-cardinality text columns are after load"""
+    encoded = df.copy()
+    for column in columns:
+        # Categories must be hashable and comparable within a column, so values are stringified
+        # except for nulls, matching what the reader produces for mixed text columns
+        values = encoded[column].map(lambda v: v if pd.isna(v) else str(v))
+        encoded[column] = values.astype('category')
+    return encoded
+
+
+def stringify(df: pd.DataFrame, columns) -> pd.DataFrame:
+    """The object-dtype equivalent of as_categorical, for the reference implementations"""
+    plain = df.copy()
+    for column in columns:
+        plain[column] = plain[column].map(lambda v: v if pd.isna(v) else str(v)).astype(object)
+    return plain
+
+
+# Reference implementations of the original row-by-row rules
+
+def reference_third_party_risk(df: pd.DataFrame, params) -> pd.Series:
+    result = pd.Series(False, index=df.index)
+    for idx, row in df.iterrows():
+        third_parties = row[params['third_party_field']]
+        risk_level = row[params['risk_level_field']]
+        if pd.isna(third_parties) or third_parties == "":
+            if risk_level == "N/A":
+                result[idx] = True
+        elif not pd.isna(third_parties) and third_parties != "":
+            if not pd.isna(risk_level) and risk_level != "" and risk_level != "N/A":
+                result[idx] = True
+    return result
+
+
+def reference_title_based_approval(df: pd.DataFrame, params, ref_data) -> pd.Series:
+    title_dict = ref_data[params['title_reference']]
+    result = pd.Series(False, index=df.index)
+    for idx, row in df.iterrows():
+        approver = row[params['approver_field']]
+        if pd.isna(approver):
+            result[idx] = True
+            continue
+        approver_title = title_dict.get(approver)
+        if approver_title and approver_title in params['allowed_titles']:
+            result[idx] = True
+    return result
+
+
+def reference_segregation_of_duties(df: pd.DataFrame, params) -> pd.Series:
+    result = pd.Series(True, index=df.index)
+    for idx, row in df.iterrows():
+        submitter = row[params['submitter_field']]
+        submitter = submitter.lower() if isinstance(submitter, str) else np.nan
+        for approver_field in params['approver_fields']:
+            approver = row[approver_field]
+            approver = approver.lower() if isinstance(approver, str) else np.nan
+            if pd.notna(submitter) and pd.notna(approver) and submitter == approver:
+                result[idx] = False
+    return result
+
+
+def reference_approval_sequence(df: pd.DataFrame, params) -> pd.Series:
+    fields = params['date_fields_in_order']
+    dates = {field: pd.to_datetime(df[field], errors='coerce') for field in fields}
+    result = pd.Series(True, index=df.index)
+    for idx in df.index:
+        for first, second in zip(fields, fields[1:]):
+            date1, date2 = dates[first][idx], dates[second][idx]
+            if pd.notna(date1) and pd.notna(date2) and not date1 <= date2:
+                result[idx] = False
+    return result
+
+
+def reference_by_distinct_rows(reference, df: pd.DataFrame, *args) -> pd.Series:
+    """
+    Run a row-by-row reference once per distinct row of a large frame and map the results back
+
+    Rows are told apart by the repr of their values, so None, NaN, "" and "N/A" stay distinct.
+    The first row of the frame is also the first distinct row, so date format inference sees
+    the same leading value as it does on the full frame.
+    """
+    row_keys = pd.Series(list(zip(*(df[column].astype(object).map(repr) for column in df.columns))))
+    codes, _ = pd.factorize(row_keys)
+    _, first_positions = np.unique(codes, return_index=True)
+    distinct = df.iloc[first_positions].reset_index(drop=True)
+    return pd.Series(reference(distinct, *args).to_numpy()[codes], index=df.index)
+
+
+def assert_same(actual: pd.Series, expected: pd.Series):
+    """Compare rule output with the reference as plain booleans on the same index"""
+    assert actual.index.equals(expected.index)
+    np.testing.assert_array_equal(actual.to_numpy(dtype=bool), expected.to_numpy(dtype=bool))
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+@pytest.mark.parametrize("categorical", [False, True])
+def test_third_party_risk_validation_matches_reference(seed, categorical):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        'Third Parties': random_column(rng, ["Vendor A", "Vendor B; Vendor C"], messy_share=0.6),
+        'Risk Level': random_column(rng, RISK_LEVELS, messy_share=0.6),
+    })
+    params = {'third_party_field': 'Third Parties', 'risk_level_field': 'Risk Level'}
+    if categorical:
+        df = as_categorical(df, df.columns)
+
+    expected = reference_third_party_risk(df, params)
+    assert_same(ValidationRules.third_party_risk_validation(df, params), expected)
+    # Both outcomes are exercised
+    assert 0 < expected.sum() < len(df)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+@pytest.mark.parametrize("categorical", [False, True])
+def test_title_based_approval_matches_reference(seed, categorical):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({'Approver': random_column(rng, list(TITLES) + ["Unknown Person"])})
+    params = {'approver_field': 'Approver', 'allowed_titles': ALLOWED_TITLES, 'title_reference': 'titles'}
+    if categorical:
+        df = as_categorical(df, ['Approver'])
+        reference_df = stringify(df, ['Approver'])
+        titles = {str(name): title for name, title in TITLES.items()}
+    else:
+        reference_df = df
+        titles = TITLES
+
+    expected = reference_title_based_approval(reference_df, params, {'titles': titles})
+    # Reference lookups arrive as dicts or as indexed Series from the reference cache
+    assert_same(ValidationRules.title_based_approval(df, params, {'titles': titles}), expected)
+    assert_same(ValidationRules.title_based_approval(df, params, {'titles': pd.Series(titles, dtype=object)}),
+                expected)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+@pytest.mark.parametrize("categorical", [False, True])
+def test_segregation_of_duties_matches_reference(seed, categorical):
+    rng = np.random.default_rng(seed)
+    columns = ['Submitter', 'TL Approver', 'AL Approver']
+    df = pd.DataFrame({column: random_column(rng, NAMES, messy_share=0.3) for column in columns})
+    params = {'submitter_field': 'Submitter', 'approver_fields': ['TL Approver', 'AL Approver', 'Missing']}
+    reference_params = dict(params, approver_fields=['TL Approver', 'AL Approver'])
+    if categorical:
+        df = as_categorical(df, columns)
+        reference_df = stringify(df, columns)
+    else:
+        reference_df = df
+
+    expected = reference_segregation_of_duties(reference_df, reference_params)
+    assert_same(ValidationRules.segregation_of_duties(df, params), expected)
+    # A cache shared with other rules gives the same answer
+    prepared = PreparedColumns(df)
+    prepared.lowercase('Submitter')
+    assert_same(ValidationRules.segregation_of_duties(df, params, prepared), expected)
+    assert 0 < expected.sum() < len(df)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+@pytest.mark.filterwarnings("ignore:Could not infer format")
+def test_approval_sequence_matches_reference(seed):
+    rng = np.random.default_rng(seed)
+    fields = ['Submit Date', 'TL Approval Date', 'AL Approval Date']
+    df = pd.DataFrame({field: random_column(rng, DATES, messy_share=0.2) for field in fields})
+    # Dates are stringified, as a text column read from a workbook would be
+    df = stringify(df, fields)
+    params = {'date_fields_in_order': fields}
+
+    expected = reference_approval_sequence(df, params)
+    assert_same(ValidationRules.approval_sequence(df, params), expected)
+
+    # Columns already parsed during cleaning give the same answer
+    parsed = df.copy()
+    for field in fields:
+        parsed[field] = pd.to_datetime(parsed[field], errors='coerce')
+    assert_same(ValidationRules.approval_sequence(parsed, params), expected)
+    assert 0 < expected.sum() < len(df)
+
+
+@pytest.mark.parametrize("categorical", [False, True])
+@pytest.mark.filterwarnings("ignore:Could not infer format")
+def test_rules_match_reference_on_large_input(categorical):
+    rng = np.random.default_rng(2024)
+    text_columns = ['Third Parties', 'Risk Level', 'Approver', 'Submitter', 'TL Approver', 'AL Approver']
+    date_fields = ['Submit Date', 'TL Approval Date', 'AL Approval Date']
+    df = pd.DataFrame({
+        'Third Parties': random_column(rng, ["Vendor A", "Vendor B; Vendor C"], messy_share=0.6, rows=LARGE_ROWS),
+        'Risk Level': random_column(rng, RISK_LEVELS, messy_share=0.6, rows=LARGE_ROWS),
+        'Approver': random_column(rng, list(TITLES) + ["Unknown Person"], rows=LARGE_ROWS),
+        **{column: random_column(rng, NAMES, messy_share=0.3, rows=LARGE_ROWS)
+           for column in ['Submitter', 'TL Approver', 'AL Approver']},
+        **{field: random_column(rng, DATES, messy_share=0.2, rows=LARGE_ROWS) for field in date_fields},
+    })
+    df = stringify(df, date_fields)
+    if categorical:
+        df = as_categorical(df, text_columns)
+        reference_df = stringify(df, text_columns)
+        titles = {str(name): title for name, title in TITLES.items()}
+    else:
+        reference_df = df
+        titles = TITLES
+
+    third_party_params = {'third_party_field': 'Third Parties', 'risk_level_field': 'Risk Level'}
+    title_params = {'approver_field': 'Approver', 'allowed_titles': ALLOWED_TITLES, 'title_reference': 'titles'}
+    sod_params = {'submitter_field': 'Submitter', 'approver_fields': ['TL Approver', 'AL Approver']}
+    sequence_params = {'date_fields_in_order': date_fields}
+    # Rules share one prepared-column cache, as they do in a run
+    prepared = PreparedColumns(df)
+
+    checks = [
+        (ValidationRules.third_party_risk_validation(df, third_party_params),
+         reference_by_distinct_rows(reference_third_party_risk, df[['Third Parties', 'Risk Level']],
+                                    third_party_params)),
+        (ValidationRules.title_based_approval(df, title_params, {'titles': titles}),
+         reference_by_distinct_rows(reference_title_based_approval, reference_df[['Approver']], title_params,
+                                    {'titles': titles})),
+        (ValidationRules.segregation_of_duties(df, sod_params, prepared),
+         reference_by_distinct_rows(reference_segregation_of_duties,
+                                    reference_df[['Submitter', 'TL Approver', 'AL Approver']], sod_params)),
+        (ValidationRules.approval_sequence(df, sequence_params, prepared),
+         reference_by_distinct_rows(reference_approval_sequence, df[date_fields], sequence_params)),
+    ]
+    for actual, expected in checks:
+        assert_same(actual, expected)
+        assert 0 < expected.sum() < len(df)
@@ -1,22 +1,25 @@
 import pandas as pd
 import numpy as np
-from typing import Dict, List
-from logging_config import setup_logging
+from typing import Dict, List, Optional
+from prepared_columns import PreparedColumns
+from logging_config import get_logger
 
-logger = setup_logging()
+logger = get_logger()
 
 
 class ValidationRules:
     """Library of validation rules that can be applied to data"""
 
     @staticmethod
-    def segregation_of_duties(df: pd.DataFrame, params: Dict) -> pd.Series:
+    def segregation_of_duties(df: pd.DataFrame, params: Dict,
+                              prepared: Optional[PreparedColumns] = None) -> pd.Series:
         """
         Validates segregation of duties - submitter cannot be an approver
 
         Args:
             df: DataFrame containing the data
             params: Dict with 'submitter_field' and 'approver_fields' keys
+            prepared: Optional shared cache of normalized columns for this run
 
         Returns:
             Series with True for rows that conform, False for non-conforming
@@ -28,11 +31,11 @@ class ValidationRules:
             logger.error("Missing required parameters for segregation_of_duties")
             return pd.Series(False, index=df.index)
 
-        # Standardize names to lowercase for comparison and handle None values
-        df_clean = df.copy()
-        df_clean[submitter_field] = df_clean[submitter_field].str.lower() if df_clean[
-                                                                                 submitter_field].dtype == 'object' else \
-            df_clean[submitter_field]
+        if prepared is None:
+            prepared = PreparedColumns(df)
+
+        # Standardize names to lowercase for comparison
+        submitter = prepared.lowercase(submitter_field)
 
         # Initialize result as all True
         result = pd.Series(True, index=df.index)
@@ -40,25 +43,25 @@ class ValidationRules:
         # Check each approver field
         for approver_field in approver_fields:
             if approver_field in df.columns:
-                df_clean[approver_field] = df_clean[approver_field].str.lower() if df_clean[
-                                                                                       approver_field].dtype == 'object' else \
-                    df_clean[approver_field]
+                approver = prepared.lowercase(approver_field)
                 # Mark false where submitter = approver (ignoring nulls)
-                submitter_is_approver = (df_clean[submitter_field].notna() &
-                                         df_clean[approver_field].notna() &
-                                         (df_clean[submitter_field] == df_clean[approver_field]))
+                submitter_is_approver = (submitter.notna() &
+                                         approver.notna() &
+                                         (submitter == approver))
                 result = result & ~submitter_is_approver
 
         return result
 
     @staticmethod
-    def approval_sequence(df: pd.DataFrame, params: Dict) -> pd.Series:
+    def approval_sequence(df: pd.DataFrame, params: Dict,
+                          prepared: Optional[PreparedColumns] = None) -> pd.Series:
         """
         Validates that approvals happened in the correct sequence
 
         Args:
             df: DataFrame containing the data
             params: Dict with 'date_fields_in_order' key
+            prepared: Optional shared cache of normalized columns for this run
 
         Returns:
             Series with True for rows that conform, False for non-conforming
@@ -69,14 +72,8 @@ class ValidationRules:
             logger.error("Not enough date fields for approval_sequence")
             return pd.Series(False, index=df.index)
 
-        # Convert date columns to datetime if they aren't already
-        df_dates = df.copy()
-        for field in date_fields:
-            if field in df.columns:
-                try:
-                    df_dates[field] = pd.to_datetime(df_dates[field], errors='coerce')
-                except Exception as e:
-                    logger.error(f"Error converting {field} to datetime: {e}")
+        if prepared is None:
+            prepared = PreparedColumns(df)
 
         # Initialize result as all True
         result = pd.Series(True, index=df.index)
@@ -87,9 +84,13 @@ class ValidationRules:
             field2 = date_fields[i + 1]
 
             if field1 in df.columns and field2 in df.columns:
+                # Dates are parsed once per run and shared between rules
+                date1 = prepared.datetime(field1)
+                date2 = prepared.datetime(field2)
+
                 # Both dates present - field1 should be before field2
-                both_present = df_dates[field1].notna() & df_dates[field2].notna()
-                correct_order = df_dates[field1] <= df_dates[field2]
+                both_present = date1.notna() & date2.notna()
+                correct_order = date1 <= date2
 
                 # Update result - only check ordering if both dates are present
                 result = result & (~both_present | correct_order)
@@ -120,21 +121,28 @@ class ValidationRules:
         # Get title reference data
         title_dict = ref_data[title_ref_name]
 
-        # Check each approver's title
-        result = pd.Series(False, index=df.index)
-
-        for idx, row in df.iterrows():
-            approver = row[approver_field]
-            if pd.isna(approver):
-                result[idx] = True  # No approver, so can't check
-                continue
-
-            # Look up title in reference data
-            approver_title = title_dict.get(approver)
-            if approver_title and approver_title in allowed_titles:
-                result[idx] = True
-
-        return result
+        # Index the reference names once and precompute, per name, whether the title is allowed;
+        # cached lookups arrive already indexed by unique name
+        if isinstance(title_dict, pd.Series):
+            title_ref = title_dict
+        else:
+            title_ref = pd.Series(title_dict, dtype=object)
+            title_ref = title_ref[title_ref.index.notna()]
+        # A trailing False entry catches approvers that are not in the reference (position -1)
+        title_allowed = np.append((title_ref.astype(bool) & title_ref.isin(allowed_titles)).to_numpy(), False)
+
+        # Resolve every approver to its reference position in one hashed lookup
+        approvers = df[approver_field]
+        if isinstance(approvers.dtype, pd.CategoricalDtype):
+            # Look up each category once and expand through the codes (code -1 is a missing approver)
+            category_positions = np.append(title_ref.index.get_indexer(approvers.cat.categories), -1)
+            positions = category_positions[approvers.cat.codes.to_numpy()]
+        else:
+            positions = title_ref.index.get_indexer(approvers)
+        has_allowed_title = title_allowed[positions]
+
+        # No approver, so can't check - counts as conforming
+        return pd.Series(has_allowed_title, index=df.index) | approvers.isna()
 
     @staticmethod
     def third_party_risk_validation(df: pd.DataFrame, params: Dict) -> pd.Series:
@@ -156,21 +164,17 @@ class ValidationRules:
             logger.error("Missing required parameters for third_party_risk_validation")
             return pd.Series(False, index=df.index)
 
-        # Initialize result as all False
-        result = pd.Series(False, index=df.index)
+        third_parties = df[third_party_field]
+        risk_level = df[risk_level_field]
+
+        # A row has no third parties when the field is null or an empty string
+        no_third_parties = third_parties.isna() | (third_parties == "")
 
-        for idx, row in df.iterrows():
-            # Get third party and risk values for this row
-            third_parties = row[third_party_field]
-            risk_level = row[risk_level_field]
+        # Case 1: No third parties and risk level is N/A - this is correct
+        no_tp_conforms = no_third_parties & (risk_level == "N/A")
 
-            # Case 1: No third parties and risk level is N/A - this is correct
-            if (pd.isna(third_parties) or third_parties == ""):
-                if risk_level == "N/A":
-                    result[idx] = True
-            # Case 2: Third parties exist and risk level is NOT N/A - this is correct
-            elif not pd.isna(third_parties) and third_parties != "":
-                if not pd.isna(risk_level) and risk_level != "" and risk_level != "N/A":
-                    result[idx] = True
+        # Case 2: Third parties exist and risk level is assigned (not blank or N/A) - this is correct
+        risk_assigned = risk_level.notna() & ~risk_level.isin(["", "N/A"])
+        tp_conforms = ~no_third_parties & risk_assigned
 
-        return result
\ No newline at end of file
+        return no_tp_conforms | tp_conforms